@@ -0,0 +1,281 @@
+"""
+tictactoe_batch_analysis.py
+
+prof. lehman
+spring 2026
+
+Analyze many Tic Tac Toe positions in one run (grading / auditing).
+
+Input file: one position per line, 9 squares left-to-right, top-to-bottom,
+then the player to move. Empty squares are "." (or "-" / "_").
+Blank lines and lines starting with # are skipped.
+
+    .OX.OXX.. O
+    XO..XX..O O
+
+Output CSV: one row per position with the root-branch values (same numbers as
+tictactoe_minimax_2026.branch_values()), the best move and its value.
+
+Leaves are evaluated in batches instead of one at a time:
+  - each position's tree is walked depth-first to SEARCH_DEPTH; leaf boards go
+    into a fixed-size buffer (LEAF_BUFFER rows of a NumPy array)
+  - when the buffer is full it is evaluated in one call (both evaluation
+    modes), and each value is handed to the node waiting for it; a node whose
+    children are all known passes its max / min on to its parent
+Only the nodes still waiting on a buffered leaf are kept, so memory stays
+bounded by the buffer size whatever the depth or number of positions.
+(Values are needed before alpha-beta could cut, so every leaf is evaluated.)
+If NumPy is not installed the leaves are evaluated one at a time instead.
+
+usage: python tictactoe_batch_analysis.py positions.txt [results.csv]
+"""
+
+from __future__ import annotations
+import argparse
+import csv
+import time
+from typing import List, Optional, Tuple
+
+from tictactoe_minimax_2026 import (
+    WIN_LINES, board_full, choose_best_from_branches, eval_tanimoto_100_10_1,
+    eval_terminal_only, legal_moves, next_player, winner,
+)
+
+try:
+    import numpy as np
+except ImportError:  # plain Python leaf evaluation
+    np = None
+
+# ----------------------------
+# Configuration (edit these)
+# ----------------------------
+
+#EVAL_MODE = "terminal_only"
+EVAL_MODE = "tanimoto_100_10_1"
+
+SEARCH_DEPTH = 2          # plies
+
+LEAF_BUFFER = 65_536       # leaf boards evaluated per NumPy call
+BATCH_POSITIONS = 256      # positions read and written per chunk of the CSV
+
+OUTPUT_FILE = "batch_results.csv"
+
+EMPTY_CHARS = ".-_ "
+
+# ----------------------------
+# Input
+# ----------------------------
+
+def parse_position(line: str) -> Tuple[List[str], str]:
+    """'.OX.OXX.. O' -> (board list, player)."""
+    parts = line.split()
+    player = parts[1].upper() if len(parts) == 2 else ""
+    if len(parts) != 2 or len(parts[0]) != 9 or player not in ("X", "O"):
+        raise ValueError(f"expected 9 squares and a player (X/O), got: {line!r}")
+    board = [" " if ch in EMPTY_CHARS else ch for ch in parts[0].upper()]
+    if any(cell not in (" ", "X", "O") for cell in board):
+        raise ValueError(f"squares must be X, O or . : {line!r}")
+    return board, player
+
+def read_positions(path: str) -> List[Tuple[int, List[str], str]]:
+    """(line number, board, player) for every position line in the file."""
+    positions = []
+    with open(path, "r") as f:
+        for line_no, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                board, player = parse_position(line)
+            except ValueError as exc:
+                raise ValueError(f"line {line_no}: {exc}") from None
+            positions.append((line_no, board, player))
+    return positions
+
+# ----------------------------
+# Batched leaf evaluation
+# ----------------------------
+
+DIGIT = {" ": 0, "X": 1, "O": 2}
+
+if np is not None:
+    LINE_INDEX = np.array(WIN_LINES, dtype=np.intp)             # (8, 3)
+    LINE_WEIGHT = np.array([0, 1, 10, 100], dtype=np.int64)     # by marks in line
+
+def evaluate_batch(leaves, eval_mode: str) -> List[int]:
+    """
+    Evaluate encoded boards (0 empty / 1 X / 2 O per square) all at once;
+    leaves is an (N, 9) array or a list of 9-int lists.
+    Matches eval_terminal_only() / eval_tanimoto_100_10_1() board by board.
+    """
+    if len(leaves) == 0:
+        return []
+    if np is None:
+        decode = (" ", "X", "O")
+        fn = eval_terminal_only if eval_mode == "terminal_only" else eval_tanimoto_100_10_1
+        if eval_mode not in ("terminal_only", "tanimoto_100_10_1"):
+            raise ValueError(f"Unknown EVAL_MODE: {eval_mode}")
+        return [fn([decode[d] for d in leaf]) for leaf in leaves]
+
+    boards = np.asarray(leaves, dtype=np.int8)                # (N, 9)
+    lines = boards[:, LINE_INDEX]                             # (N, 8, 3)
+    xs = (lines == 1).sum(axis=2)                             # X marks per line
+    os = (lines == 2).sum(axis=2)                             # O marks per line
+
+    if eval_mode == "terminal_only":
+        x_win = (xs == 3).any(axis=1)
+        o_win = (os == 3).any(axis=1)
+        # winner() reports the first complete line; only matters if both have one
+        first_x = np.where(xs == 3, np.arange(8), 8).min(axis=1)
+        first_o = np.where(os == 3, np.arange(8), 8).min(axis=1)
+        vals = np.where(x_win & (first_x < first_o), 1, np.where(o_win, -1, 0))
+    elif eval_mode == "tanimoto_100_10_1":
+        vals = (np.where(os == 0, LINE_WEIGHT[xs], 0)
+                - np.where(xs == 0, LINE_WEIGHT[os], 0)).sum(axis=1)
+    else:
+        raise ValueError(f"Unknown EVAL_MODE: {eval_mode}")
+    return vals.tolist()
+
+# ----------------------------
+# Search with a bounded leaf buffer
+# ----------------------------
+
+class PendingNode:
+    """A node (or root branch) still waiting for some of its children's values."""
+
+    __slots__ = ("parent", "maximizing", "value", "waiting")
+
+    def __init__(self, parent: Optional[PendingNode], maximizing: bool, children: int) -> None:
+        self.parent = parent
+        self.maximizing = maximizing
+        self.value: Optional[int] = None
+        self.waiting = children
+
+    def resolve(self, val: int) -> None:
+        """One child's value is known; finished nodes pass their value up."""
+        node = self
+        while True:
+            if node.value is None or (val > node.value if node.maximizing else val < node.value):
+                node.value = val
+            node.waiting -= 1
+            if node.waiting or node.parent is None:
+                return
+            val, node = node.value, node.parent
+
+class LeafBuffer:
+    """Fixed-size buffer of encoded leaf boards, evaluated together when full."""
+
+    def __init__(self, eval_mode: str, size: int = LEAF_BUFFER) -> None:
+        self.eval_mode = eval_mode
+        self.size = size
+        self.boards = np.zeros((size, 9), dtype=np.int8) if np is not None else [None] * size
+        self.owners: List[Optional[PendingNode]] = [None] * size
+        self.count = 0
+        self.evaluated = 0
+
+    def add(self, codes: List[int], owner: PendingNode) -> None:
+        self.boards[self.count] = codes if np is not None else codes[:]
+        self.owners[self.count] = owner
+        self.count += 1
+        if self.count == self.size:
+            self.flush()
+
+    def flush(self) -> None:
+        n = self.count
+        if not n:
+            return
+        vals = evaluate_batch(self.boards[:n], self.eval_mode)
+        owners = self.owners
+        for i in range(n):
+            owners[i].resolve(vals[i])
+            owners[i] = None
+        self.evaluated += n
+        self.count = 0
+
+def walk(board: List[str], codes: List[int], player: str, depth: int,
+         owner: PendingNode, buffer: LeafBuffer) -> None:
+    """Depth-first walk (same cutoffs as minimax()); owner receives this node's value."""
+    if depth == 0 or winner(board) is not None or board_full(board):
+        buffer.add(codes, owner)
+        return
+
+    moves = legal_moves(board)
+    node = PendingNode(owner, player == "X", len(moves))
+    digit, opp = DIGIT[player], next_player(player)
+    for mv in moves:
+        board[mv] = player
+        codes[mv] = digit
+        walk(board, codes, opp, depth - 1, node, buffer)
+        board[mv] = " "
+        codes[mv] = 0
+
+def analyze_batch(positions: List[Tuple[List[str], str]], depth: int, eval_mode: str,
+                  buffer: Optional[LeafBuffer] = None) -> List[Optional[List[Tuple[int, int]]]]:
+    """Root-branch values for each (board, player); None for games already over."""
+    if buffer is None:
+        buffer = LeafBuffer(eval_mode)
+    roots: List[Optional[List[Tuple[int, PendingNode]]]] = []
+    for board, player in positions:
+        board = board[:]
+        if winner(board) is not None or board_full(board):
+            roots.append(None)
+            continue
+        codes = [DIGIT[cell] for cell in board]
+        root = []
+        for mv in legal_moves(board):
+            branch = PendingNode(None, True, 1)   # holds the value after mv
+            board[mv] = player
+            codes[mv] = DIGIT[player]
+            walk(board, codes, next_player(player), depth - 1, branch, buffer)
+            board[mv] = " "
+            codes[mv] = 0
+            root.append((mv, branch))
+        roots.append(root)
+
+    buffer.flush()
+    return [
+        None if root is None else [(mv, branch.value) for mv, branch in root]
+        for root in roots
+    ]
+
+# ----------------------------
+# Main
+# ----------------------------
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Batch minimax analysis of Tic Tac Toe positions.")
+    parser.add_argument("input", help="positions file (9 squares + player per line)")
+    parser.add_argument("output", nargs="?", default=OUTPUT_FILE, help="CSV file to write")
+    parser.add_argument("--depth", type=int, default=SEARCH_DEPTH)
+    parser.add_argument("--eval", dest="eval_mode", default=EVAL_MODE,
+                        choices=["terminal_only", "tanimoto_100_10_1"])
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    positions = read_positions(args.input)
+    buffer = LeafBuffer(args.eval_mode)
+
+    with open(args.output, "w", newline="") as f:
+        out = csv.writer(f)
+        out.writerow(["line", "board", "player", "best_move", "best_value", "branches"])
+        for start in range(0, len(positions), BATCH_POSITIONS):
+            chunk = positions[start:start + BATCH_POSITIONS]
+            results = analyze_batch([(b, p) for _, b, p in chunk], args.depth, args.eval_mode,
+                                    buffer)
+            for (line_no, board, player), branches in zip(chunk, results):
+                squares = "".join("." if cell == " " else cell for cell in board)
+                if branches is None:
+                    out.writerow([line_no, squares, player, "", "", "game over"])
+                    continue
+                best_mv, best_val = choose_best_from_branches(player, branches)
+                out.writerow([line_no, squares, player, best_mv, best_val,
+                              " ".join(f"{mv}:{val}" for mv, val in branches)])
+
+    elapsed = time.perf_counter() - t0
+    print(f"Analyzed {len(positions):,} positions (depth {args.depth}, {args.eval_mode}, "
+          f"{buffer.evaluated:,} leaves) in {elapsed:.2f}s -> {args.output}")
+    if np is None:
+        print("(NumPy not installed: leaves were evaluated one at a time)")
+
+if __name__ == "__main__":
+    main()
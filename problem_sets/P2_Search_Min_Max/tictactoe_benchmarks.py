@@ -0,0 +1,239 @@
+"""
+tictactoe_benchmarks.py
+
+prof. lehman
+spring 2026
+
+Repeatable benchmarks for the P2 search scripts:
+  - tictactoe_minimax_2026.branch_values() over fixed boards / depths / eval modes
+  - tictactoe_enumerate_games.backtrack_all_games() (all 255,168 games)
+  - tictactoe_states_by_move.backtrack() (states by move depth)
+
+Each case is timed REPEAT times (best time kept); a timing sample repeats the
+case until it has run for MIN_SAMPLE_SECONDS, so fast cases are not just timer
+noise. One more run under tracemalloc gives the peak memory.
+
+Module settings a case needs (EVAL_MODE, DISPLAY_GAMES, ...) are set only for
+the duration of the case and then restored, so nothing has to be edited by
+hand and nothing is printed by the scripts being measured.
+
+Results are compared with a saved JSON baseline: a case is a regression when
+its wall time or peak memory is more than THRESHOLD (fraction) above the
+baseline, and the exit status is 1 if any case regressed.
+
+usage: python tictactoe_benchmarks.py                 # compare with the baseline
+       python tictactoe_benchmarks.py --save          # record a new baseline
+       python tictactoe_benchmarks.py --save --only enumerate   # re-record those cases only
+       python tictactoe_benchmarks.py --threshold 0.1 --only minimax
+"""
+
+from __future__ import annotations
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional
+
+import tictactoe_enumerate_games as enumerate_games
+import tictactoe_minimax_2026 as minimax_engine
+import tictactoe_states_by_move as states_by_move
+
+# ----------------------------
+# Configuration (defaults for the command line)
+# ----------------------------
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             "tictactoe_bench_baseline.json")
+THRESHOLD = 0.20     # allowed slowdown / memory growth before a case counts as a regression
+REPEAT = 3
+MIN_SAMPLE_SECONDS = 0.05
+
+EMPTY = [" "] * 9
+CLASS_EXAMPLE = [
+    "X", "O", " ",
+    " ", "X", "X",
+    " ", " ", "O"
+]
+MIDGAME = [
+    "X", " ", " ",
+    " ", "O", " ",
+    " ", " ", "X"
+]
+
+# ----------------------------
+# Cases
+# ----------------------------
+
+@dataclass
+class BenchCase:
+    name: str
+    run: Callable[[], int]     # does the work once, returns nodes (positions) visited
+
+@contextmanager
+def module_settings(module, **settings) -> Iterator[None]:
+    """Temporarily set module-level constants, restoring them afterwards."""
+    saved = {name: getattr(module, name) for name in settings}
+    for name, value in settings.items():
+        setattr(module, name, value)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(module, name, value)
+
+def minimax_case(label: str, board: List[str], player: str, depth: int, eval_mode: str,
+                 alpha_beta: bool = False, tt: bool = True) -> BenchCase:
+    def run() -> int:
+        with module_settings(minimax_engine, EVAL_MODE=eval_mode, USE_ALPHA_BETA=alpha_beta):
+            table = minimax_engine.TranspositionTable() if tt else None
+            counts = minimax_engine.SearchCounts()
+            minimax_engine.branch_values(board[:], player, depth, tt=table, counts=counts)
+            return counts.nodes
+    search = "ab" if alpha_beta else "plain"
+    cache = "tt" if tt else "no-tt"
+    return BenchCase(f"minimax/{label}/{player}/d{depth}/{eval_mode}/{search}/{cache}", run)
+
+def enumerate_games_case() -> BenchCase:
+    def run() -> int:
+        with module_settings(enumerate_games, DISPLAY_GAMES=False, USE_SYMMETRY=False):
+            counts = enumerate_games.Counts()
+            enumerate_games.backtrack_all_games([" "] * 9, "X", [], counts, [0])
+            return counts.positions_expanded
+    return BenchCase("enumerate_games/backtrack_all_games", run)
+
+def states_by_move_case() -> BenchCase:
+    def run() -> int:
+        with module_settings(states_by_move, USE_SYMMETRY=False):
+            levels = [states_by_move.LevelStats() for _ in range(10)]
+            states_by_move.backtrack([" "] * 9, "X", 0, levels)
+            return sum(s.states for s in levels)
+    return BenchCase("states_by_move/backtrack", run)
+
+CASES = [
+    minimax_case("class", CLASS_EXAMPLE, "O", 2, "tanimoto_100_10_1"),
+    minimax_case("class", CLASS_EXAMPLE, "O", 5, "terminal_only"),
+    minimax_case("midgame", MIDGAME, "O", 6, "tanimoto_100_10_1"),
+    minimax_case("empty", EMPTY, "X", 4, "tanimoto_100_10_1", tt=False),
+    minimax_case("empty", EMPTY, "X", 9, "terminal_only"),
+    minimax_case("empty", EMPTY, "X", 9, "terminal_only", alpha_beta=True),
+    enumerate_games_case(),
+    states_by_move_case(),
+]
+
+# ----------------------------
+# Measuring + comparing
+# ----------------------------
+
+def measure(case: BenchCase, repeat: int) -> Dict:
+    best = float("inf")
+    nodes = 0
+    for _ in range(repeat):
+        runs = 0
+        t0 = time.perf_counter()
+        while True:
+            nodes = case.run()
+            runs += 1
+            elapsed = time.perf_counter() - t0
+            if elapsed >= MIN_SAMPLE_SECONDS:
+                break
+        best = min(best, elapsed / runs)
+
+    tracemalloc.start()
+    try:
+        case.run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {"seconds": best, "nodes": nodes,
+            "nodes_per_sec": nodes / best if best > 0 else 0.0, "peak_bytes": peak}
+
+def compare(result: Dict, base: Optional[Dict], threshold: float) -> List[str]:
+    """Regression messages for one case (empty when within the threshold)."""
+    if base is None:
+        return []
+    problems = []
+    if result["seconds"] > base["seconds"] * (1 + threshold):
+        problems.append(f"time +{(result['seconds'] / base['seconds'] - 1) * 100:.0f}%")
+    if base["peak_bytes"] and result["peak_bytes"] > base["peak_bytes"] * (1 + threshold):
+        problems.append(f"memory +{(result['peak_bytes'] / base['peak_bytes'] - 1) * 100:.0f}%")
+    if result["nodes"] != base["nodes"]:
+        problems.append(f"nodes {base['nodes']:,} -> {result['nodes']:,}")
+    return problems
+
+def load_baseline(path: str) -> Optional[Dict]:
+    if not os.path.exists(path):
+        return None
+    with open(path, "r") as f:
+        return json.load(f)
+
+def save_baseline(path: str, results: Dict[str, Dict]) -> None:
+    with open(path, "w") as f:
+        json.dump({"python": platform.python_version(), "machine": platform.machine(),
+                   "cases": results}, f, indent=2)
+
+# ----------------------------
+# Main
+# ----------------------------
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the P2 search scripts.")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="baseline JSON file")
+    parser.add_argument("--save", action="store_true", help="write results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help="allowed slowdown / memory growth, as a fraction (0.2 = 20%%)")
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--only", default="", help="run cases whose name contains this text")
+    args = parser.parse_args()
+
+    baseline = None if args.save else load_baseline(args.baseline)
+    base_cases = baseline["cases"] if baseline else {}
+
+    header = (f"{'Case':<58}  {'Nodes':>10}  {'Best (s)':>9}  {'Nodes/s':>11}  "
+              f"{'Peak KB':>9}  {'vs base':>8}  Status")
+    print(header)
+    print("-" * len(header))
+
+    results: Dict[str, Dict] = {}
+    regressions = 0
+    for case in CASES:
+        if args.only not in case.name:
+            continue
+        result = measure(case, args.repeat)
+        results[case.name] = result
+        base = base_cases.get(case.name)
+        problems = compare(result, base, args.threshold)
+        regressions += bool(problems)
+
+        if base is None:
+            change, status = "-", "new" if baseline else ""
+        else:
+            change = f"{(result['seconds'] / base['seconds'] - 1) * 100:+.0f}%"
+            status = "REGRESSION " + ", ".join(problems) if problems else "ok"
+        print(f"{case.name:<58}  {result['nodes']:>10,}  {result['seconds']:>9.4f}  "
+              f"{result['nodes_per_sec']:>11,.0f}  {result['peak_bytes'] / 1024:>9,.1f}  "
+              f"{change:>8}  {status}")
+
+    if args.save:
+        # with --only, the cases that were not run keep their saved numbers
+        previous = load_baseline(args.baseline) if args.only else None
+        cases = dict(previous["cases"]) if previous else {}
+        cases.update(results)
+        save_baseline(args.baseline, cases)
+        kept = len(cases) - len(results)
+        print(f"\nBaseline written to {args.baseline}"
+              + (f" ({len(results)} case(s) updated, {kept} kept)" if previous else ""))
+    elif baseline is None:
+        print(f"\nNo baseline at {args.baseline} (run with --save to create one)")
+    else:
+        print(f"\n{regressions} regression(s) beyond {args.threshold:.0%} "
+              f"(baseline from Python {baseline.get('python', '?')})")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,186 @@
+"""
+tictactoe_bitboard.py
+
+prof. lehman
+spring 2026
+
+Bitboard version of the minimax engine in tictactoe_minimax_2026.py.
+
+A board is two 9-bit integers instead of a list of 9 strings:
+    x_mask  bit i set -> X on square i
+    o_mask  bit i set -> O on square i
+
+    bit:  0 | 1 | 2
+         ---+---+---
+          3 | 4 | 5
+         ---+---+---
+          6 | 7 | 8
+
+- the 8 WIN_LINES are precomputed as bitmasks, and a 512-entry table answers
+  "does this mask hold a win line?" with one index
+- line counting uses a 512-entry popcount table
+- legal moves are generated by iterating the set bits of the empty mask
+
+Running this file searches the same START_BOARD / CURRENT_PLAYER / SEARCH_DEPTH
+as tictactoe_minimax_2026.py with both engines, for every evaluation mode,
+and checks that the root-branch values are identical.
+"""
+
+from __future__ import annotations
+import time
+from typing import Iterator, List, Optional, Tuple
+
+import tictactoe_minimax_2026 as list_engine
+
+# ----------------------------
+# Bitboard definitions
+# ----------------------------
+
+EVAL_MODES = ("terminal_only", "tanimoto_100_10_1")
+
+FULL_MASK = (1 << 9) - 1
+
+WIN_MASKS = tuple(
+    (1 << a) | (1 << b) | (1 << c) for a, b, c in list_engine.WIN_LINES
+)
+
+POPCOUNT = tuple(bin(n).count("1") for n in range(1 << 9))
+
+# HAS_LINE[mask] is True when the marks in mask complete any win line
+HAS_LINE = tuple(any(n & m == m for m in WIN_MASKS) for n in range(1 << 9))
+
+# score of a line that holds n marks of one player and none of the other
+LINE_WEIGHT = (0, 1, 10, 100)
+
+def board_to_masks(board: List[str]) -> Tuple[int, int]:
+    x_mask = o_mask = 0
+    for i, cell in enumerate(board):
+        if cell == "X":
+            x_mask |= 1 << i
+        elif cell == "O":
+            o_mask |= 1 << i
+    return x_mask, o_mask
+
+def masks_to_board(x_mask: int, o_mask: int) -> List[str]:
+    return [
+        "X" if x_mask >> i & 1 else "O" if o_mask >> i & 1 else " "
+        for i in range(9)
+    ]
+
+def winner(x_mask: int, o_mask: int) -> Optional[str]:
+    if HAS_LINE[x_mask]:
+        return "X"
+    if HAS_LINE[o_mask]:
+        return "O"
+    return None
+
+def board_full(x_mask: int, o_mask: int) -> bool:
+    return (x_mask | o_mask) == FULL_MASK
+
+def legal_moves(x_mask: int, o_mask: int) -> Iterator[int]:
+    """Yield empty squares in increasing index order (same order as the list engine)."""
+    empty = ~(x_mask | o_mask) & FULL_MASK
+    while empty:
+        low = empty & -empty
+        yield low.bit_length() - 1
+        empty ^= low
+
+# ----------------------------
+# Evaluation functions
+# ----------------------------
+
+def eval_terminal_only(x_mask: int, o_mask: int) -> int:
+    w = winner(x_mask, o_mask)
+    if w == "X":
+        return 1
+    if w == "O":
+        return -1
+    return 0  # tie OR non-terminal
+
+def eval_tanimoto_100_10_1(x_mask: int, o_mask: int) -> int:
+    score = 0
+    for m in WIN_MASKS:
+        xs = x_mask & m
+        os = o_mask & m
+        if not os:
+            score += LINE_WEIGHT[POPCOUNT[xs]]
+        elif not xs:
+            score -= LINE_WEIGHT[POPCOUNT[os]]
+    return score
+
+def evaluate(x_mask: int, o_mask: int, eval_mode: str) -> int:
+    if eval_mode == "terminal_only":
+        return eval_terminal_only(x_mask, o_mask)
+    if eval_mode == "tanimoto_100_10_1":
+        return eval_tanimoto_100_10_1(x_mask, o_mask)
+    raise ValueError(f"Unknown EVAL_MODE: {eval_mode}")
+
+# ----------------------------
+# Minimax (depth-limited)
+# ----------------------------
+
+def minimax(x_mask: int, o_mask: int, player: str, depth: int, eval_mode: str) -> int:
+    if depth == 0 or HAS_LINE[x_mask] or HAS_LINE[o_mask] or (x_mask | o_mask) == FULL_MASK:
+        return evaluate(x_mask, o_mask, eval_mode)
+
+    if player == "X":  # MAX
+        best_val = -10**9
+        for mv in legal_moves(x_mask, o_mask):
+            val = minimax(x_mask | 1 << mv, o_mask, "O", depth - 1, eval_mode)
+            if val > best_val:
+                best_val = val
+        return best_val
+    else:  # MIN
+        best_val = 10**9
+        for mv in legal_moves(x_mask, o_mask):
+            val = minimax(x_mask, o_mask | 1 << mv, "X", depth - 1, eval_mode)
+            if val < best_val:
+                best_val = val
+        return best_val
+
+def branch_values(board: List[str], player: str, depth: int, eval_mode: str) -> List[Tuple[int, int]]:
+    """
+    Same contract as tictactoe_minimax_2026.branch_values():
+    a list of (move_index, predicted_value) for each legal root move.
+    """
+    x_mask, o_mask = board_to_masks(board)
+    results: List[Tuple[int, int]] = []
+    for mv in legal_moves(x_mask, o_mask):
+        if player == "X":
+            val = minimax(x_mask | 1 << mv, o_mask, "O", depth - 1, eval_mode)
+        else:
+            val = minimax(x_mask, o_mask | 1 << mv, "X", depth - 1, eval_mode)
+        results.append((mv, val))
+    return results
+
+# ----------------------------
+# Main: compare with the list engine
+# ----------------------------
+
+def main() -> None:
+    board = list_engine.START_BOARD[:]
+    player = list_engine.CURRENT_PLAYER
+    depth = list_engine.SEARCH_DEPTH
+
+    print("=== Tic Tac Toe Minimax: list engine vs bitboard engine ===\n")
+    print("Depth (plies):", depth)
+    print("Player to move:", player)
+    print("\nStarting board:\n")
+    print(list_engine.format_board(board))
+
+    for eval_mode in EVAL_MODES:
+        settings = list_engine.SearchSettings(eval_mode=eval_mode)
+
+        t0 = time.perf_counter()
+        list_vals = list_engine.branch_values(board[:], player, depth, settings=settings)
+        t1 = time.perf_counter()
+        bit_vals = branch_values(board, player, depth, eval_mode)
+        t2 = time.perf_counter()
+
+        print(f"\nEvaluation: {eval_mode}")
+        print(f"  list engine:     {list_vals}   {(t1 - t0) * 1000:8.2f} ms")
+        print(f"  bitboard engine: {bit_vals}   {(t2 - t1) * 1000:8.2f} ms")
+        print("  match:", "yes" if list_vals == bit_vals else "NO")
+
+if __name__ == "__main__":
+    main()
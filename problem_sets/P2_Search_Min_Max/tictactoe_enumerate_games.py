@@ -6,7 +6,8 @@ spring 2026
 
 Chat GPT 5.2 prompts with minor output edits
 
-Displays all Tic Tac Toe games without any reduction in search space for symmetry.
+Displays all Tic Tac Toe games (by default without any reduction in search space
+for symmetry; see USE_SYMMETRY).
 
 Set DISPLAY_LIMIT to show more/less boards
 
@@ -19,27 +20,68 @@ For each terminal game, count:
 
 Also (optionally) display each terminal game's move list + final board.
 Warning: printing every game is a LOT of output. Set DISPLAY_GAMES = False by default.
+
+Set USE_SYMMETRY = True to expand only one move from each group of moves that
+lead to the same position under the rotations/reflections of the board.
+Each expanded move carries a weight (how many raw move sequences it stands for),
+so the totals are still the exact raw counts, with far fewer positions visited.
+The symmetry helpers (tictactoe_mnk_board.py) work for any board shape, and in
+COUNT_MODE = "memo" positions are also memoized by symmetry class.
+
+Set COUNT_MODE = "memo" to count without walking the move sequences at all:
+the number of games (and wins/ties) from a position only depends on the position,
+so each distinct position is solved once and reused (memoized recursion over the
+DAG of positions). This also works for other board shapes (MEMO_ROWS/COLS/K).
+
+iter_games() is the streaming form of the enumeration: a generator that yields
+(moves, result) for each terminal game as it is reached, optionally filtered by
+a predicate, e.g. O wins in exactly 8 moves:
+
+    for moves, result in iter_games(lambda moves, result: result == "O" and len(moves) == 8):
+        ...
+
+write_game_log() stores a game stream as fixed-width 8-byte records after a
+header holding the number of games, and GameLog memory-maps such a file back
+(len(), log[i], iteration), checking the header against the file size first. Set
+GAME_LOG_FILE to write all 255,168 games (~2 MB) when this file is run.
 """
 
 from __future__ import annotations
+import mmap
+import os
+import struct
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from tictactoe_mnk_board import Shape, canonical, unique_moves, winner_at
 
 DISPLAY_GAMES = True          # Set True to print every terminal game
 DISPLAY_LIMIT = 3              # If DISPLAY_GAMES is True, print at most this many games
 
+USE_SYMMETRY = False           # Set True to expand only canonical (symmetry-unique) moves
+
+COUNT_MODE = "paths"           # "paths" (every move sequence) or "memo" (each distinct position once)
+MEMO_ROWS = 3                  # board shape used by COUNT_MODE = "memo"
+MEMO_COLS = 3
+MEMO_K = 3
+
+GAME_LOG_FILE = None           # e.g. "tictactoe_games.bin" to write every game to a binary log
+
 WIN_LINES = [
     (0, 1, 2), (3, 4, 5), (6, 7, 8),  # rows
     (0, 3, 6), (1, 4, 7), (2, 5, 8),  # cols
     (0, 4, 8), (2, 4, 6)              # diagonals
 ]
 
+SHAPE = Shape(3, 3, 3)         # board of COUNT_MODE = "paths"
+
 @dataclass
 class Counts:
     total_games: int = 0
     x_wins: int = 0
     o_wins: int = 0
     ties: int = 0
+    positions_expanded: int = 0
 
 def winner(board: List[str]) -> Optional[str]:
     """Return 'X' or 'O' if there is a winner; otherwise None."""
@@ -67,61 +109,259 @@ def backtrack_all_games(
     turn: str,
     move_seq: List[int],
     counts: Counts,
-    printed: List[int]
+    printed: List[int],
+    weight: int = 1
 ) -> None:
     """
     Explore every possible move sequence until terminal (win or tie).
     Count terminal outcomes; optionally print them.
+
+    weight = number of raw move sequences this path stands for
+    (always 1 unless USE_SYMMETRY is on).
     """
+    counts.positions_expanded += 1
+    same_as = f"  (x{weight:,} symmetric sequences)" if weight > 1 else ""
+
     w = winner(board)
     if w is not None:
-        counts.total_games += 1
+        counts.total_games += weight
         if w == "X":
-            counts.x_wins += 1
+            counts.x_wins += weight
         else:
-            counts.o_wins += 1
+            counts.o_wins += weight
 
         if DISPLAY_GAMES and printed[0] < DISPLAY_LIMIT:
             printed[0] += 1
-            print(f"\nGame #{counts.total_games}  Result: {w} wins")
+            print(f"\nGame #{counts.total_games}  Result: {w} wins{same_as}")
             print("Moves (0-8):", move_seq)
             print(format_board(board))
         return
 
     if board_full(board):
-        counts.total_games += 1
-        counts.ties += 1
+        counts.total_games += weight
+        counts.ties += weight
 
         if DISPLAY_GAMES and printed[0] < DISPLAY_LIMIT:
             printed[0] += 1
-            print(f"\nGame #{counts.total_games}  Result: Tie")
+            print(f"\nGame #{counts.total_games}  Result: Tie{same_as}")
             print("Moves (0-8):", move_seq)
             print(format_board(board))
         return
 
+    if USE_SYMMETRY:
+        moves = [(mv, mult) for mv, mult, _ in unique_moves(board, turn, SHAPE)]
+    else:
+        moves = [(mv, 1) for mv in legal_moves(board)]
+
     # Recurse for each legal move
-    for mv in legal_moves(board):
+    for mv, mult in moves:
         board[mv] = turn
         move_seq.append(mv)
 
         next_turn = "O" if turn == "X" else "X"
-        backtrack_all_games(board, next_turn, move_seq, counts, printed)
+        backtrack_all_games(board, next_turn, move_seq, counts, printed, weight * mult)
 
         # undo
         move_seq.pop()
         board[mv] = " "
 
+# ----------------------------
+# Streaming games + binary game log
+# ----------------------------
+
+Game = Tuple[Tuple[int, ...], str]     # (moves 0-8 in play order, "X" / "O" / "Tie")
+
+def iter_games(
+    where: Optional[Callable[[Tuple[int, ...], str], bool]] = None,
+    board: Optional[List[str]] = None,
+    turn: str = "X",
+    move_seq: Optional[List[int]] = None
+) -> Iterator[Game]:
+    """
+    Lazily yield every terminal game reachable from board (empty board by default),
+    in the same order backtrack_all_games() visits them.
+    where(moves, result) -> bool keeps only matching games.
+    """
+    if board is None:
+        board = [" "] * 9
+    if move_seq is None:
+        move_seq = []
+
+    w = winner(board)
+    if w is not None or board_full(board):
+        game = (tuple(move_seq), w if w is not None else "Tie")
+        if where is None or where(*game):
+            yield game
+        return
+
+    next_turn = "O" if turn == "X" else "X"
+    for mv in legal_moves(board):
+        board[mv] = turn
+        move_seq.append(mv)
+        yield from iter_games(where, board, next_turn, move_seq)
+        move_seq.pop()
+        board[mv] = " "
+
+# Header: LOG_MAGIC, then the number of games (little-endian 64-bit).
+# One little-endian 64-bit record per game:
+#   bits 0-35   moves, 4 bits each, first move in the lowest bits
+#   bits 36-39  number of moves (5..9)
+#   bits 40-41  result (1 = X wins, 2 = O wins, 3 = tie)
+LOG_MAGIC = b"TTTGAME2"
+LOG_HEADER = struct.Struct("<8sQ")
+LOG_RECORD = struct.Struct("<Q")
+RESULT_CODE = {"X": 1, "O": 2, "Tie": 3}
+RESULT_NAME = {code: name for name, code in RESULT_CODE.items()}
+
+def pack_game(moves: Tuple[int, ...], result: str) -> int:
+    rec = RESULT_CODE[result] << 40 | len(moves) << 36
+    for i, mv in enumerate(moves):
+        rec |= mv << (4 * i)
+    return rec
+
+def unpack_game(rec: int) -> Game:
+    n = rec >> 36 & 0xF
+    return tuple(rec >> (4 * i) & 0xF for i in range(n)), RESULT_NAME[rec >> 40 & 3]
+
+def write_game_log(path: str, games: Iterable[Game]) -> int:
+    """Write a game stream to path; returns the number of games written."""
+    count = 0
+    with open(path, "wb") as f:
+        f.write(LOG_HEADER.pack(LOG_MAGIC, 0))   # count filled in at the end
+        for moves, result in games:
+            f.write(LOG_RECORD.pack(pack_game(moves, result)))
+            count += 1
+        f.seek(0)
+        f.write(LOG_HEADER.pack(LOG_MAGIC, count))
+    return count
+
+class GameLog:
+    """
+    Read-only, memory-mapped view of a game log file.
+
+        with GameLog("tictactoe_games.bin") as log:
+            len(log), log[0]
+            sum(1 for moves, result in log if result == "Tie")
+    """
+
+    def __init__(self, path: str) -> None:
+        size = os.path.getsize(path)
+        with open(path, "rb") as f:
+            header = f.read(LOG_HEADER.size)
+        if len(header) < LOG_HEADER.size or header[:len(LOG_MAGIC)] != LOG_MAGIC:
+            raise ValueError(f"{path} is not a game log file")
+        _, self._count = LOG_HEADER.unpack(header)
+        expected = LOG_HEADER.size + self._count * LOG_RECORD.size
+        if size != expected:
+            raise ValueError(f"{path}: header says {self._count:,} games ({expected:,} bytes), "
+                             f"file has {size:,} bytes (truncated or damaged)")
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> GameLog:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i: int) -> Game:
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return unpack_game(LOG_RECORD.unpack_from(self._map, LOG_HEADER.size + i * LOG_RECORD.size)[0])
+
+    def __iter__(self) -> Iterator[Game]:
+        # unpack at offsets rather than through a memoryview: an exported view
+        # would keep close() from unmapping the file while a loop is unfinished
+        start = LOG_HEADER.size
+        for offset in range(start, start + len(self) * LOG_RECORD.size, LOG_RECORD.size):
+            yield unpack_game(LOG_RECORD.unpack_from(self._map, offset)[0])
+
+def count_games_memo(
+    board: List[str],
+    turn: str,
+    shape: Shape,
+    memo: Dict[str, Tuple[int, int, int, int]],
+    last_move: Optional[int] = None,
+    symmetric: bool = False
+) -> Tuple[int, int, int, int]:
+    """
+    (games, X wins, O wins, ties) over all move sequences from this position.
+    The player to move is fixed by the board (X starts), so the board alone
+    is the memo key. With symmetric, symmetric positions share one memo entry
+    (the counts do not change under rotation/reflection) and moves into the
+    same symmetry class are expanded once, weighted by their number.
+    """
+    if last_move is not None:
+        w = winner_at(board, last_move, shape)
+        if w == "X":
+            return (1, 1, 0, 0)
+        if w == "O":
+            return (1, 0, 1, 0)
+    if " " not in board:
+        return (1, 0, 0, 1)
+
+    key = canonical(board, shape) if symmetric else "".join(board)
+    if key in memo:
+        return memo[key]
+
+    if symmetric:
+        moves = [(mv, mult) for mv, mult, _ in unique_moves(board, turn, shape)]
+    else:
+        moves = [(mv, 1) for mv in legal_moves(board)]
+
+    games = x_wins = o_wins = ties = 0
+    next_turn = "O" if turn == "X" else "X"
+    for mv, mult in moves:
+        board[mv] = turn
+        g, x, o, t = count_games_memo(board, next_turn, shape, memo, mv, symmetric)
+        board[mv] = " "
+        games += g * mult
+        x_wins += x * mult
+        o_wins += o * mult
+        ties += t * mult
+
+    memo[key] = (games, x_wins, o_wins, ties)
+    return memo[key]
+
 def main() -> None:
-    board = [" "] * 9
     counts = Counts()
-    printed = [0]  # mutable counter for printing limit
-
-    backtrack_all_games(board, "X", [], counts, printed)
+    title = "Tic Tac Toe"
+
+    if COUNT_MODE == "memo":
+        shape = Shape(MEMO_ROWS, MEMO_COLS, MEMO_K)
+        if (MEMO_ROWS, MEMO_COLS, MEMO_K) != (3, 3, 3):
+            title = f"{MEMO_ROWS}x{MEMO_COLS} board, {MEMO_K} in a row"
+        memo: Dict[str, Tuple[int, int, int, int]] = {}
+        counts.total_games, counts.x_wins, counts.o_wins, counts.ties = count_games_memo(
+            [" "] * shape.cells, "X", shape, memo, symmetric=USE_SYMMETRY
+        )
+        counts.positions_expanded = len(memo)
+    elif COUNT_MODE == "paths":
+        board = [" "] * SHAPE.cells
+        printed = [0]  # mutable counter for printing limit
+        backtrack_all_games(board, "X", [], counts, printed)
+    else:
+        raise ValueError(f"Unknown COUNT_MODE: {COUNT_MODE}")
 
     print()
-    print("=== Tic Tac Toe (all move sequences), X starts ===")
+    print(f"=== {title} (all move sequences), X starts ===")
     print()
 
+    if COUNT_MODE == "memo":
+        mode = "memoized, distinct non-terminal positions"
+        if USE_SYMMETRY:
+            mode += " up to symmetry"
+    else:
+        mode = "symmetry-reduced" if USE_SYMMETRY else "every move sequence"
+    print(f"{'Positions expanded:':<38}{counts.positions_expanded:>12,}  ({mode})")
+
     print(f"{'Total terminal games (move sequences):':<38}{counts.total_games:>12,}")
 
     print()
@@ -146,9 +386,16 @@ def main() -> None:
 
 
 
-    if DISPLAY_GAMES:
+    if DISPLAY_GAMES and COUNT_MODE == "paths":
         if counts.total_games > DISPLAY_LIMIT:
             print(f"\n(Displayed only first {DISPLAY_LIMIT} terminal games.)")
 
+    if GAME_LOG_FILE:
+        written = write_game_log(GAME_LOG_FILE, iter_games())
+        print(f"\nWrote {written:,} games to {GAME_LOG_FILE} ({os.path.getsize(GAME_LOG_FILE):,} bytes)")
+        with GameLog(GAME_LOG_FILE) as log:
+            o_in_8 = sum(1 for moves, result in log if result == "O" and len(moves) == 8)
+            print(f"{'O wins in exactly 8 moves (from log):':<38}{o_in_8:>12,}")
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,308 @@
+"""
+tictactoe_mcts.py
+
+prof. lehman
+spring 2026
+
+Monte Carlo Tree Search for the m,n,k game (same boards and helpers as tictactoe_mnk.py,
+from tictactoe_mnk_board.py).
+
+Instead of searching every move to a fixed depth, MCTS grows a tree one node
+per iteration and estimates each move by playing games out to the end:
+
+  1) selection:   from the root, follow the child with the best UCT score
+                      mean value (for the player choosing) + C * sqrt(ln N_parent / N_child)
+                  until reaching a node that still has untried moves
+  2) expansion:   add one untried move as a new child
+  3) simulation:  play PLAYOUT_BATCH games from the new child to the end
+                  ("random" or "heuristic": take a win, else block a win, else random)
+  4) backup:      add the results (+1 X win, -1 O win, 0 tie) to every node on the path
+
+Values are kept from X's point of view (X maximizes, O minimizes), like minimax.
+The move played is the root child with the most visits.
+
+The search is "anytime": stop it after ITERATIONS iterations or after
+TIME_BUDGET_SECONDS, whichever comes first, and it returns its current best.
+
+Random playouts are batched: with NumPy, the PLAYOUT_BATCH games of one
+iteration are played at once by shuffling the empty squares of each game
+(players alternate along the shuffled order) and finding, per game, the first
+win line completed. Without NumPy they are played one at a time.
+"""
+
+from __future__ import annotations
+import math
+import random
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from tictactoe_mnk_board import (
+    Shape, board_full, format_board, idx_to_rc, index_guide, legal_moves,
+    win_lines, winner, winner_at,
+)
+from tictactoe_minimax_2026 import next_player
+
+try:
+    import numpy as np
+except ImportError:  # playouts run one game at a time
+    np = None
+
+# ----------------------------
+# Configuration (edit these)
+# ----------------------------
+
+ROWS = 4
+COLS = 4
+K_IN_A_ROW = 4
+
+CURRENT_PLAYER = "X"  # "X" (MAX) or "O" (MIN)
+
+START_BOARD: Optional[List[str]] = None  # None = empty ROWS x COLS board
+
+ITERATIONS: Optional[int] = 5_000             # tree iterations (None = until the time budget)
+TIME_BUDGET_SECONDS: Optional[float] = None   # e.g. 1.0 (None = until ITERATIONS)
+
+PLAYOUT_POLICY = "random"     # "random" or "heuristic"
+PLAYOUT_BATCH = 16            # playouts per expanded node
+EXPLORATION = 1.0             # UCT constant C (values are in -1..+1)
+
+RANDOM_SEED: Optional[int] = 2026  # None = different games every run
+
+# ----------------------------
+# Search tree
+# ----------------------------
+
+class Node:
+    """One position in the search tree; player is the side to move here."""
+
+    __slots__ = ("move", "parent", "player", "children", "untried", "visits", "value_sum", "result")
+
+    def __init__(self, board: List[str], player: str, shape: Shape,
+                 move: Optional[int] = None, parent: Optional[Node] = None) -> None:
+        self.move = move
+        self.parent = parent
+        self.player = player
+        self.children: List[Node] = []
+        self.visits = 0
+        self.value_sum = 0.0          # sum of playout results, X's point of view
+
+        # result is set for finished games: +1 / -1 / 0
+        w = winner_at(board, move, shape) if move is not None else winner(board, shape)
+        if w is not None:
+            self.result: Optional[int] = 1 if w == "X" else -1
+        elif board_full(board):
+            self.result = 0
+        else:
+            self.result = None
+        self.untried = legal_moves(board) if self.result is None else []
+
+    @property
+    def mean(self) -> float:
+        return self.value_sum / self.visits if self.visits else 0.0
+
+    def select_child(self, c: float) -> Node:
+        sign = 1 if self.player == "X" else -1
+        log_n = math.log(self.visits)
+        return max(
+            self.children,
+            key=lambda ch: sign * ch.mean + c * math.sqrt(log_n / ch.visits)
+        )
+
+# ----------------------------
+# Playouts
+# ----------------------------
+
+def playout_python(board: List[str], player: str, shape: Shape, policy: str,
+                   rng: random.Random) -> int:
+    """Play one game to the end on a copy of board; +1 X win / -1 O win / 0 tie."""
+    board = board[:]
+    empties = legal_moves(board)
+    while empties:
+        mv = None
+        if policy == "heuristic":
+            mv = find_winning_move(board, empties, player, shape)
+            if mv is None:
+                mv = find_winning_move(board, empties, next_player(player), shape)
+        elif policy != "random":
+            raise ValueError(f"Unknown PLAYOUT_POLICY: {policy}")
+        if mv is None:
+            mv = empties[rng.randrange(len(empties))]
+        board[mv] = player
+        empties.remove(mv)
+        if winner_at(board, mv, shape) is not None:
+            return 1 if player == "X" else -1
+        player = next_player(player)
+    return 0
+
+def find_winning_move(board: List[str], empties: List[int], player: str,
+                      shape: Shape) -> Optional[int]:
+    for mv in empties:
+        board[mv] = player
+        wins = winner_at(board, mv, shape) is not None
+        board[mv] = " "
+        if wins:
+            return mv
+    return None
+
+def playout_batch_numpy(board: List[str], player: str, shape: Shape, batch: int,
+                        rng) -> List[int]:
+    """
+    batch random playouts at once. Each game is a random order of the empty
+    squares; the player to move takes the 1st, 3rd, ... squares of that order.
+    A line is won by whoever owns all its squares, at the time its last square
+    is filled; the game's result is the win line completed first.
+    """
+    empties = np.array(legal_moves(board), dtype=np.intp)
+    lines = np.array(win_lines(shape), dtype=np.intp)                 # (L, k)
+
+    # turn[g, j] = move number at which game g fills empties[j] (0-based)
+    turn = np.argsort(rng.random((batch, len(empties))), axis=1).argsort(axis=1)
+
+    when = np.full((batch, shape.cells), -1, dtype=np.intp)         # -1 = already filled
+    owner = np.zeros((batch, shape.cells), dtype=np.int8)            # 1 X, 2 O
+    for i, cell in enumerate(board):
+        if cell != " ":
+            owner[:, i] = 1 if cell == "X" else 2
+    mover, other = (1, 2) if player == "X" else (2, 1)
+    when[:, empties] = turn
+    owner[:, empties] = np.where(turn % 2 == 0, mover, other)
+
+    line_owner = owner[:, lines]                                      # (batch, L, k)
+    done_at = when[:, lines].max(axis=2)                              # (batch, L)
+    never = len(empties)
+    x_at = np.where((line_owner == 1).all(axis=2), done_at, never).min(axis=1)
+    o_at = np.where((line_owner == 2).all(axis=2), done_at, never).min(axis=1)
+    return np.where(x_at < o_at, 1, np.where(o_at < x_at, -1, 0)).tolist()
+
+def run_playouts(board: List[str], player: str, shape: Shape, batch: int, policy: str,
+                 rng: random.Random, np_rng) -> List[int]:
+    if policy == "random" and np_rng is not None:
+        return playout_batch_numpy(board, player, shape, batch, np_rng)
+    return [playout_python(board, player, shape, policy, rng) for _ in range(batch)]
+
+# ----------------------------
+# MCTS
+# ----------------------------
+
+@dataclass
+class MCTSResult:
+    branches: List[Tuple[int, int, float]]   # (move, visits, mean value) per root move
+    best_move: int
+    iterations: int
+    playouts: int
+    seconds: float
+
+def mcts(board: List[str], player: str, shape: Shape, *,
+         iterations: Optional[int] = ITERATIONS,
+         time_budget: Optional[float] = TIME_BUDGET_SECONDS,
+         batch: int = PLAYOUT_BATCH, policy: str = PLAYOUT_POLICY,
+         c: float = EXPLORATION, seed: Optional[int] = RANDOM_SEED) -> MCTSResult:
+    """
+    Search from board with player to move until iterations or time_budget
+    (at least one must be set) runs out. board is not modified.
+    """
+    if iterations is None and time_budget is None:
+        raise ValueError("MCTS needs an iteration count or a time budget")
+
+    rng = random.Random(seed)
+    np_rng = np.random.default_rng(seed) if np is not None else None
+    root = Node(board, player, shape)
+    if root.result is not None:
+        raise ValueError("game is already over")
+
+    t0 = time.perf_counter()
+    deadline = t0 + time_budget if time_budget is not None else None
+    done = playouts = 0
+    while (iterations is None or done < iterations) and \
+            (deadline is None or time.perf_counter() < deadline):
+        node = root
+        path = board[:]
+
+        # 1) selection
+        while not node.untried and node.children:
+            node = node.select_child(c)
+            path[node.move] = node.parent.player
+
+        # 2) expansion
+        if node.untried:
+            mv = node.untried.pop(rng.randrange(len(node.untried)))
+            path[mv] = node.player
+            child = Node(path, next_player(node.player), shape, mv, node)
+            node.children.append(child)
+            node = child
+
+        # 3) simulation
+        if node.result is not None:
+            results = [node.result] * batch
+        else:
+            results = run_playouts(path, node.player, shape, batch, policy, rng, np_rng)
+
+        # 4) backup
+        total = sum(results)
+        while node is not None:
+            node.visits += len(results)
+            node.value_sum += total
+            node = node.parent
+
+        done += 1
+        playouts += len(results)
+
+    elapsed = time.perf_counter() - t0
+    branches = sorted(((ch.move, ch.visits, ch.mean) for ch in root.children),
+                      key=lambda t: (-t[1], t[0]))
+    if not branches:
+        raise ValueError("no iterations completed within the budget")
+    return MCTSResult(branches, branches[0][0], done, playouts, elapsed)
+
+# ----------------------------
+# Main
+# ----------------------------
+
+def main() -> None:
+    shape = Shape(ROWS, COLS, K_IN_A_ROW)
+    board = START_BOARD[:] if START_BOARD is not None else [" "] * shape.cells
+    if len(board) != shape.cells:
+        raise ValueError(f"START_BOARD has {len(board)} squares, expected {shape.cells}")
+
+    print(index_guide(shape))
+
+    print(f"\n=== m,n,k MCTS: {ROWS}x{COLS} board, {K_IN_A_ROW} in a row ===\n")
+    print("Iterations:", ITERATIONS if ITERATIONS is not None else "no limit")
+    print("Time budget:", f"{TIME_BUDGET_SECONDS}s" if TIME_BUDGET_SECONDS is not None else "none")
+    print(f"Playouts: {PLAYOUT_POLICY}, {PLAYOUT_BATCH} per expanded node"
+          + ("" if np is not None or PLAYOUT_POLICY != "random" else " (NumPy not installed)"))
+    print("Player to move:", CURRENT_PLAYER)
+    print("\nStarting board:\n")
+    print(format_board(board, shape))
+
+    if winner(board, shape) is not None or board_full(board):
+        print("\nGame is already over.")
+        return
+
+    # settings passed as they are now (the defaults were fixed at import)
+    result = mcts(board, CURRENT_PLAYER, shape, iterations=ITERATIONS,
+                  time_budget=TIME_BUDGET_SECONDS, batch=PLAYOUT_BATCH, policy=PLAYOUT_POLICY,
+                  c=EXPLORATION, seed=RANDOM_SEED)
+
+    print("\n\n=== Root branch summary (visit counts, mean value for X) ===\n")
+    header = f"{'Move':>4}  {'(r,c)':>7}  {'Visits':>10}  {'Mean value':>11}  {'Chosen':>7}"
+    print(header)
+    print("-" * len(header))
+
+    for mv, visits, mean in result.branches:
+        r, c = idx_to_rc(mv, shape)
+        chosen = "<<<" if mv == result.best_move else ""
+        print(f"{mv:>4}  ({r},{c})  {visits:>10,}  {mean:>+11.3f}  {chosen:>7}")
+
+    print(f"\nSearch: MCTS  iterations={result.iterations:,}  playouts={result.playouts:,}  "
+          f"time={result.seconds:.2f}s")
+
+    print("\nBest move:", result.best_move, " (row,col)=", idx_to_rc(result.best_move, shape))
+
+    board[result.best_move] = CURRENT_PLAYER
+    print("\nBoard after best move:\n")
+    print(format_board(board, shape))
+
+if __name__ == "__main__":
+    main()
@@ -14,10 +14,32 @@ Minimax for Tic Tac Toe with:
 Enhancement:
 - Traces evaluation numbers at each level of the search tree for EVERY root branch.
 - Still prints a root-branch summary table and the chosen move.
+- Optional transposition table: positions reached by different move orders
+  are searched once (hit/miss/eviction counts shown in the summary).
+- Optional alpha-beta pruning with move ordering; prunes show up in the trace
+  and the summary reports how many nodes were searched.
+- Optional perfect-play table lookup for full-depth terminal_only queries.
+- Incremental (make/unmake) 100/10/1 evaluation in the search.
+- Optional lookup-table evaluation over all 3**9 boards (base-3 board number
+  kept during the search; win / full / eval become single array reads).
+- Optional process-pool search of root branches (or second-ply subtrees);
+  each branch's trace is captured and printed in root order.
+- Trace output goes through a trace sink: the indented text (default), an
+  in-memory tree, or a buffered JSONL file, with ply / root-move filters.
 """
 
 from __future__ import annotations
-from typing import List, Optional, Tuple
+import io
+import json
+import sys
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from tictactoe_perfect_table import PerfectTable
 
 # ----------------------------
 # Configuration (edit these)
@@ -45,6 +67,68 @@ SHOW_BOARD_PER_BRANCH = False  # True prints the board after each root move (opt
 # Option A tracing controls
 TRACE_ALL_ROOT_BRANCHES = True
 TRACE_SHOW_ROOT_BOARD = True   # show the board position after the root move (nice for class)
+TRACE_SINK = "text"            # "text" (print as found), "tree" (print per root move), "jsonl"
+TRACE_JSONL_FILE = "minimax_trace.jsonl"
+TRACE_MIN_PLY = 0              # only keep node events with TRACE_MIN_PLY <= ply <= TRACE_MAX_PLY
+TRACE_MAX_PLY: Optional[int] = None
+TRACE_ROOT_MOVES: Optional[List[int]] = None   # e.g. [0, 8]; None = every root move
+
+# Transposition table controls
+USE_TRANSPOSITION_TABLE = False
+TT_MAX_ENTRIES = 100_000       # least recently used entries are evicted past this size
+
+# Alpha-beta pruning controls (root values are the same as plain minimax)
+USE_ALPHA_BETA = False
+MOVE_ORDERING = "static"       # "index", "static" (center, corners, edges) or "history"
+
+# Perfect-play table (tictactoe_perfect_table.py): terminal_only searches to the
+# end of the game read root values from the precomputed table instead of searching
+USE_PERFECT_TABLE = False
+
+# tanimoto_100_10_1 only: keep line counts and score up to date as moves are
+# made/unmade instead of recounting every line at each leaf (same values)
+INCREMENTAL_EVAL = True
+
+# Lookup tables (tictactoe_ternary_eval.py): keep the base-3 board number during
+# the search so winner / full board / evaluation are each one array read
+# (either EVAL_MODE; takes precedence over INCREMENTAL_EVAL)
+TERNARY_LOOKUP = False
+
+# Parallel search: 0 = search root branches one after another in this process
+# (parallel workers always capture the plain text trace; TRACE_SINK is not used)
+PARALLEL_WORKERS = 0
+PARALLEL_SPLIT_PLY = 1         # 1 = one task per root move, 2 = one task per reply
+
+# ----------------------------
+# Search settings
+# ----------------------------
+
+@dataclass(frozen=True)
+class SearchSettings:
+    """
+    The configuration one search runs with (defaults: the settings above).
+    minimax() and the helpers below take it as an argument; passing None means
+    "the module settings, as they are now" (see current_settings()).
+    """
+    eval_mode: str = EVAL_MODE
+    use_alpha_beta: bool = USE_ALPHA_BETA
+    move_ordering: str = MOVE_ORDERING
+    incremental_eval: bool = INCREMENTAL_EVAL
+    ternary_lookup: bool = TERNARY_LOOKUP
+    use_transposition_table: bool = USE_TRANSPOSITION_TABLE
+    tt_max_entries: int = TT_MAX_ENTRIES
+
+def current_settings() -> SearchSettings:
+    """SearchSettings from the module-level configuration."""
+    return SearchSettings(
+        eval_mode=EVAL_MODE,
+        use_alpha_beta=USE_ALPHA_BETA,
+        move_ordering=MOVE_ORDERING,
+        incremental_eval=INCREMENTAL_EVAL,
+        ternary_lookup=TERNARY_LOOKUP,
+        use_transposition_table=USE_TRANSPOSITION_TABLE,
+        tt_max_entries=TT_MAX_ENTRIES,
+    )
 
 # ----------------------------
 # Game definitions
@@ -114,93 +198,569 @@ def eval_tanimoto_100_10_1(board: List[str]) -> int:
     o3, o2, o1 = line_counts(board, "O")
     return (100*x3 + 10*x2 + x1) - (100*o3 + 10*o2 + o1)
 
-def evaluate(board: List[str]) -> int:
-    if EVAL_MODE == "terminal_only":
+def evaluate(board: List[str], eval_mode: Optional[str] = None) -> int:
+    """Static evaluation of board with eval_mode (default: EVAL_MODE)."""
+    if eval_mode is None:
+        eval_mode = EVAL_MODE
+    if eval_mode == "terminal_only":
         return eval_terminal_only(board)
-    if EVAL_MODE == "tanimoto_100_10_1":
+    if eval_mode == "tanimoto_100_10_1":
         return eval_tanimoto_100_10_1(board)
-    raise ValueError(f"Unknown EVAL_MODE: {EVAL_MODE}")
+    raise ValueError(f"Unknown EVAL_MODE: {eval_mode}")
+
+# ----------------------------
+# Incremental 100/10/1 evaluation (make/unmake)
+# ----------------------------
+
+# CELL_LINES[i] = indexes into WIN_LINES of the lines through square i
+CELL_LINES = [[li for li, line in enumerate(WIN_LINES) if i in line] for i in range(9)]
+
+# LINE_SCORE[x][o] = contribution of one line holding x X's and o O's
+LINE_SCORE = [
+    [(0, 1, 10, 100)[x] if o == 0 else (-(0, 1, 10, 100)[o] if x == 0 else 0)
+     for o in range(4)]
+    for x in range(4)
+]
+
+def new_incremental_eval(board: List[str],
+                         settings: Optional[SearchSettings] = None) -> Optional["IncrementalTanimoto"]:
+    """
+    TernaryEval when ternary_lookup is on, IncrementalTanimoto when
+    incremental_eval applies, else None.
+    """
+    if settings is None:
+        settings = current_settings()
+    if settings.ternary_lookup:
+        # imported here so the lookup tables are only loaded (or built) when used
+        from tictactoe_ternary_eval import TernaryEval
+        return TernaryEval(board, settings.eval_mode)
+    if settings.incremental_eval and settings.eval_mode == "tanimoto_100_10_1":
+        return IncrementalTanimoto(board)
+    return None
+
+class IncrementalTanimoto:
+    """
+    Keeps per-line X/O counts and the running eval_tanimoto_100_10_1() score
+    while minimax() makes and unmakes moves, so a leaf eval is one read of .score.
+    Only touches the 2-4 lines through the square that changed.
+    """
+
+    answers_terminal = False   # winner / full board still come from the board
+
+    def __init__(self, board: List[str]) -> None:
+        self.x = [0] * len(WIN_LINES)
+        self.o = [0] * len(WIN_LINES)
+        for li, line in enumerate(WIN_LINES):
+            self.x[li] = sum(1 for i in line if board[i] == "X")
+            self.o[li] = sum(1 for i in line if board[i] == "O")
+        self.score = sum(LINE_SCORE[x][o] for x, o in zip(self.x, self.o))
+
+    def make(self, square: int, player: str) -> None:
+        self._update(square, player, 1)
+
+    def unmake(self, square: int, player: str) -> None:
+        self._update(square, player, -1)
+
+    def _update(self, square: int, player: str, step: int) -> None:
+        xs, os = self.x, self.o
+        for li in CELL_LINES[square]:
+            before = LINE_SCORE[xs[li]][os[li]]
+            if player == "X":
+                xs[li] += step
+            else:
+                os[li] += step
+            self.score += LINE_SCORE[xs[li]][os[li]] - before
+
+# ----------------------------
+# Transposition table
+# ----------------------------
+
+# Bound flags: EXACT is a true minimax value; LOWER/UPPER are what a search
+# with a narrowed (alpha, beta) window can prove (value >= v or value <= v).
+TT_EXACT = 0
+TT_LOWER = 1
+TT_UPPER = 2
+
+class TranspositionTable:
+    """
+    Cache of searched positions keyed by (board, player to move, remaining depth).
+
+    Only interior nodes are stored (a leaf eval is cheaper than a lookup).
+    Remaining depth is capped at the number of empty squares, since a search
+    can never go deeper than that: depth 9 and depth 4 with 4 empties match.
+    """
+
+    def __init__(self, max_entries: int = TT_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self.entries: OrderedDict[Tuple[str, str, int], Tuple[int, int]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(board: List[str], player: str, depth: int) -> Tuple[str, str, int]:
+        return ("".join(board), player, min(depth, board.count(" ")))
+
+    def probe(self, key: Tuple[str, str, int], alpha: int, beta: int) -> Optional[int]:
+        """Return a usable value for this (alpha, beta) window, or None on a miss."""
+        entry = self.entries.get(key)
+        if entry is not None:
+            value, flag = entry
+            if (flag == TT_EXACT
+                    or (flag == TT_LOWER and value >= beta)
+                    or (flag == TT_UPPER and value <= alpha)):
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return value
+        self.misses += 1
+        return None
+
+    def store(self, key: Tuple[str, str, int], value: int, flag: int) -> None:
+        self.entries[key] = (value, flag)
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def summary(self) -> str:
+        return (f"entries={len(self.entries):,}  hits={self.hits:,}  "
+                f"misses={self.misses:,}  evictions={self.evictions:,}")
+
+# ----------------------------
+# Move ordering (used by alpha-beta)
+# ----------------------------
+
+# center first, then corners, then edges
+STATIC_ORDER = [4, 0, 2, 6, 8, 1, 3, 5, 7]
+STATIC_RANK = [STATIC_ORDER.index(i) for i in range(9)]
+
+class SearchCounts:
+    """Per-search counters: nodes visited and alpha-beta cutoffs."""
+
+    def __init__(self) -> None:
+        self.nodes = 0
+        self.cutoffs = 0
+
+def new_history() -> dict:
+    """History heuristic table: history[player][move] grows each time move causes a cutoff."""
+    return {"X": [0] * 9, "O": [0] * 9}
+
+def order_moves(moves: List[int], player: str, history: Optional[dict],
+                ordering: Optional[str] = None) -> List[int]:
+    """moves in the order alpha-beta tries them (ordering default: MOVE_ORDERING)."""
+    if ordering is None:
+        ordering = MOVE_ORDERING
+    if ordering == "index":
+        return moves
+    if ordering == "static":
+        return sorted(moves, key=lambda mv: STATIC_RANK[mv])
+    if ordering == "history":
+        if history is None:
+            return moves
+        scores = history[player]
+        return sorted(moves, key=lambda mv: -scores[mv])
+    raise ValueError(f"Unknown MOVE_ORDERING: {ordering}")
+
+# ----------------------------
+# Trace sinks
+# ----------------------------
+
+class TraceSink(ABC):
+    """
+    Receives one event (a dict) per traced step of minimax():
+        leaf    ply player depth state eval       (state = WIN / FULL / DEPTH0)
+        tt      ply player depth eval             (transposition table hit)
+        expand  ply player depth moves
+        prune   ply player depth move alpha beta skipped
+        choose  ply player depth eval values chosen
+    Every event also carries "root": the root move being searched (or None).
+
+    Filters: only plies min_ply..max_ply and root moves in root_moves are kept.
+    minimax() asks wants(ply) before building an event, so filtered-out
+    nodes cost one call and tracing off (sink=None) costs nothing.
+    """
+
+    def __init__(self, min_ply: int = 0, max_ply: Optional[int] = None,
+                 root_moves: Optional[List[int]] = None) -> None:
+        self.min_ply = min_ply
+        self.max_ply = max_ply
+        self.root_moves = None if root_moves is None else set(root_moves)
+        self.root_move: Optional[int] = None
+
+    def wants(self, ply: int) -> bool:
+        if ply < self.min_ply or (self.max_ply is not None and ply > self.max_ply):
+            return False
+        return self.root_moves is None or self.root_move in self.root_moves
+
+    @abstractmethod
+    def record(self, event: Dict) -> None:
+        """Handle one event that passed the filters."""
+
+    def close(self) -> None:
+        pass
+
+def format_trace_event(event: Dict) -> str:
+    """The classic indented one-line text for a trace event."""
+    indent = "  " * event["ply"]
+    head = f"{indent}{event['player']}"
+    kind = event["event"]
+    if kind == "leaf":
+        return f"{head} depth={event['depth']} [{event['state']}] eval= {event['eval']}"
+    if kind == "tt":
+        return f"{head} depth={event['depth']} [TT] eval= {event['eval']}"
+    if kind == "expand":
+        role = "MAX" if event["player"] == "X" else "MIN"
+        return f"{head} depth={event['depth']} ({role}) exploring moves {event['moves']}"
+    if kind == "prune":
+        return (f"{head} PRUNE after move {event['move']}: alpha={event['alpha']} >= "
+                f"beta={event['beta']}, skipping moves {event['skipped']}")
+    if kind == "choose":
+        return f"{head} chooses {event['eval']} from {event['values']} via moves {event['chosen']}"
+    raise ValueError(f"Unknown trace event: {kind}")
+
+class TextTraceSink(TraceSink):
+    """Prints each event as it happens (the original trace output)."""
+
+    def __init__(self, stream=None, **filters) -> None:
+        super().__init__(**filters)
+        self.stream = stream
+
+    def record(self, event: Dict) -> None:
+        print(format_trace_event(event), file=self.stream or sys.stdout)
+
+class TraceNode:
+    def __init__(self, event: Dict) -> None:
+        self.event = event
+        self.children: List[TraceNode] = []
+        self.closing: List[Dict] = []   # prune / choose events, after the children
+
+class TreeTraceSink(TraceSink):
+    """
+    Builds the traced search tree in memory: roots[root_move] is the list of
+    top-level TraceNodes searched under that root move.
+    """
+
+    def __init__(self, **filters) -> None:
+        super().__init__(**filters)
+        self.roots: Dict[Optional[int], List[TraceNode]] = {}
+        self._stack: List[TraceNode] = []
+
+    def record(self, event: Dict) -> None:
+        kind = event["event"]
+        if kind in ("prune", "choose"):
+            if self._stack:
+                self._stack[-1].closing.append(event)
+                if kind == "choose":
+                    self._stack.pop()
+            return
+        node = TraceNode(event)
+        if self._stack:
+            self._stack[-1].children.append(node)
+        else:
+            self.roots.setdefault(self.root_move, []).append(node)
+        if kind == "expand":
+            self._stack.append(node)
+
+    def render_text(self, root_move: Optional[int] = None) -> str:
+        lines: List[str] = []
+
+        def walk(node: TraceNode) -> None:
+            lines.append(format_trace_event(node.event))
+            for child in node.children:
+                walk(child)
+            for event in node.closing:
+                lines.append(format_trace_event(event))
+
+        for node in self.roots.get(root_move, []):
+            walk(node)
+        return "\n".join(lines)
+
+class JsonlTraceSink(TraceSink):
+    """Buffers events and writes them to path as JSON lines, buffer_size at a time."""
+
+    def __init__(self, path: str, buffer_size: int = 10_000, **filters) -> None:
+        super().__init__(**filters)
+        self.file = open(path, "w")
+        self.buffer: List[str] = []
+        self.buffer_size = buffer_size
+        self.events = 0
+
+    def record(self, event: Dict) -> None:
+        self.buffer.append(json.dumps(event))
+        self.events += 1
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.buffer:
+            self.file.write("\n".join(self.buffer) + "\n")
+            self.buffer.clear()
+
+    def close(self) -> None:
+        self.flush()
+        self.file.close()
+
+def make_trace_sink() -> TraceSink:
+    """Sink described by the TRACE_* settings."""
+    filters = dict(min_ply=TRACE_MIN_PLY, max_ply=TRACE_MAX_PLY, root_moves=TRACE_ROOT_MOVES)
+    if TRACE_SINK == "text":
+        return TextTraceSink(**filters)
+    if TRACE_SINK == "tree":
+        return TreeTraceSink(**filters)
+    if TRACE_SINK == "jsonl":
+        return JsonlTraceSink(TRACE_JSONL_FILE, **filters)
+    raise ValueError(f"Unknown TRACE_SINK: {TRACE_SINK}")
 
 # ----------------------------
 # Minimax (depth-limited) with tracing
 # ----------------------------
 
-def minimax(board: List[str], player: str, depth: int, *, trace: bool=False, ply: int=0) -> int:
+def minimax(board: List[str], player: str, depth: int, *, trace: bool=False, ply: int=0,
+            tt: Optional[TranspositionTable]=None,
+            alpha: int=-10**9, beta: int=10**9,
+            counts: Optional[SearchCounts]=None, history: Optional[dict]=None,
+            inc: Optional[IncrementalTanimoto]=None,
+            sink: Optional[TraceSink]=None,
+            settings: Optional[SearchSettings]=None) -> int:
     """
-    If trace=True, prints:
+    Trace events go to sink (trace=True is shorthand for printing them as text):
       - leaf evals (win/full/depth==0)
+      - transposition table hits (subtree not searched again)
+      - alpha-beta prunes (remaining moves skipped)
       - internal node child-values list and chosen best
-    Indentation is based on ply (tree depth from the trace root).
-    """
-    indent = "  " * ply
+    Text indentation is based on ply (tree depth from the trace root).
 
-    w = winner(board)
-    if w is not None or board_full(board) or depth == 0:
-        val = evaluate(board)
-        if trace:
-            state = "WIN" if w is not None else ("FULL" if board_full(board) else "DEPTH0")
-            print(f"{indent}{player} depth={depth} [{state}] eval= {val}")
+    settings (default: current_settings()) picks the evaluation, alpha-beta and
+    move ordering. With use_alpha_beta, (alpha, beta) is the search window; a
+    call made with the full window (the default) still returns the exact
+    minimax value.
+
+    inc (see new_incremental_eval()) is kept in step with board, and leaf evals
+    read inc.score instead of rescanning the board. A TernaryEval also answers
+    the win / full-board checks.
+    """
+    if trace and sink is None:
+        sink = TextTraceSink()
+    if settings is None:
+        settings = current_settings()
+    tracing = sink is not None and sink.wants(ply)
+    if counts is not None:
+        counts.nodes += 1
+
+    if inc is not None and inc.answers_terminal:
+        w, full = inc.winner, inc.full
+    else:
+        w, full = winner(board), board_full(board)
+    if w is not None or full or depth == 0:
+        val = inc.score if inc is not None else evaluate(board, settings.eval_mode)
+        if tracing:
+            state = "WIN" if w is not None else ("FULL" if full else "DEPTH0")
+            sink.record({"event": "leaf", "root": sink.root_move, "ply": ply, "player": player,
+                         "depth": depth, "state": state, "eval": val})
         return val
 
+    if tt is not None:
+        tt_key = tt.key(board, player, depth)
+        cached = tt.probe(tt_key, alpha, beta)
+        if cached is not None:
+            if tracing:
+                sink.record({"event": "tt", "root": sink.root_move, "ply": ply, "player": player,
+                             "depth": depth, "eval": cached})
+            return cached
+
+    alpha_orig, beta_orig = alpha, beta
     moves = legal_moves(board)
+    if settings.use_alpha_beta:
+        moves = order_moves(moves, player, history, settings.move_ordering)
 
-    if trace:
-        role = "MAX" if player == "X" else "MIN"
-        print(f"{indent}{player} depth={depth} ({role}) exploring moves {moves}")
+    if tracing:
+        sink.record({"event": "expand", "root": sink.root_move, "ply": ply, "player": player,
+                     "depth": depth, "moves": moves})
 
     child_vals: List[Tuple[int, int]] = []  # (move, value)
+    maximizing = player == "X"
+    best_val = -10**9 if maximizing else 10**9
 
-    if player == "X":  # MAX
-        best_val = -10**9
-        for mv in moves:
-            board[mv] = "X"
-            val = minimax(board, "O", depth - 1, trace=trace, ply=ply + 1)
-            board[mv] = " "
-            child_vals.append((mv, val))
+    for i, mv in enumerate(moves):
+        board[mv] = player
+        if inc is not None:
+            inc.make(mv, player)
+        val = minimax(board, next_player(player), depth - 1, ply=ply + 1, tt=tt,
+                      alpha=alpha, beta=beta, counts=counts, history=history, inc=inc,
+                      sink=sink, settings=settings)
+        if inc is not None:
+            inc.unmake(mv, player)
+        board[mv] = " "
+        child_vals.append((mv, val))
+
+        if maximizing:  # MAX
             if val > best_val:
                 best_val = val
-
-        if trace:
-            vals_only = [v for _, v in child_vals]
-            best_moves = [mv for mv, v in child_vals if v == best_val]
-            print(f"{indent}{player} chooses {best_val} from {vals_only} via moves {best_moves}")
-
-        return best_val
-
-    else:  # MIN (player == "O")
-        best_val = 10**9
-        for mv in moves:
-            board[mv] = "O"
-            val = minimax(board, "X", depth - 1, trace=trace, ply=ply + 1)
-            board[mv] = " "
-            child_vals.append((mv, val))
+        else:           # MIN (player == "O")
             if val < best_val:
                 best_val = val
 
-        if trace:
-            vals_only = [v for _, v in child_vals]
-            best_moves = [mv for mv, v in child_vals if v == best_val]
-            print(f"{indent}{player} chooses {best_val} from {vals_only} via moves {best_moves}")
-
-        return best_val
+        if not settings.use_alpha_beta:
+            continue
+        if maximizing:
+            alpha = max(alpha, best_val)
+        else:
+            beta = min(beta, best_val)
+        if alpha >= beta:
+            if counts is not None:
+                counts.cutoffs += 1
+            if history is not None:
+                history[player][mv] += depth * depth
+            if tracing and i + 1 < len(moves):
+                sink.record({"event": "prune", "root": sink.root_move, "ply": ply,
+                             "player": player, "depth": depth, "move": mv,
+                             "alpha": alpha, "beta": beta, "skipped": moves[i + 1:]})
+            break
+
+    if tracing:
+        vals_only = [v for _, v in child_vals]
+        best_moves = [mv for mv, v in child_vals if v == best_val]
+        sink.record({"event": "choose", "root": sink.root_move, "ply": ply, "player": player,
+                     "depth": depth, "eval": best_val, "values": vals_only, "chosen": best_moves})
+
+    if tt is not None:
+        if best_val <= alpha_orig:
+            flag = TT_UPPER
+        elif best_val >= beta_orig:
+            flag = TT_LOWER
+        else:
+            flag = TT_EXACT
+        tt.store(tt_key, best_val, flag)
+    return best_val
 
 # ----------------------------
 # Root branch reporting helpers
 # ----------------------------
 
-def branch_values(board: List[str], player: str, depth: int) -> List[Tuple[int, int]]:
+def branch_values(board: List[str], player: str, depth: int,
+                  tt: Optional[TranspositionTable]=None,
+                  counts: Optional[SearchCounts]=None,
+                  history: Optional[dict]=None,
+                  settings: Optional[SearchSettings]=None) -> List[Tuple[int, int]]:
     """
     Returns a list of (move_index, predicted_value) for each legal root move.
     predicted_value is the minimax value AFTER making that move.
+    Each root branch is searched with a full window, so values are exact
+    even with use_alpha_beta.
     """
+    if settings is None:
+        settings = current_settings()
+    inc = new_incremental_eval(board, settings)
     results: List[Tuple[int, int]] = []
     for mv in legal_moves(board):
         board[mv] = player
-        val = minimax(board, next_player(player), depth - 1, trace=False, ply=0)
+        if inc is not None:
+            inc.make(mv, player)
+        val = minimax(board, next_player(player), depth - 1, trace=False, ply=0, tt=tt,
+                      counts=counts, history=history, inc=inc, settings=settings)
+        if inc is not None:
+            inc.unmake(mv, player)
         board[mv] = " "
         results.append((mv, val))
     return results
 
+# ----------------------------
+# Parallel root branches (process pool)
+# ----------------------------
+
+def search_subtree(task: tuple) -> Tuple[int, str, int, int, Tuple[int, int, int]]:
+    """
+    Worker: minimax() one subtree with its own table/counters. The task carries
+    the SearchSettings, so workers search with the parent's configuration even
+    under "spawn".
+    Returns (value, captured trace text, nodes, cutoffs, (tt hits, misses, evictions)).
+    """
+    board, player, depth, ply, trace, settings = task
+
+    tt = TranspositionTable(settings.tt_max_entries) if settings.use_transposition_table else None
+    counts = SearchCounts()
+    history = (new_history() if settings.use_alpha_beta and settings.move_ordering == "history"
+               else None)
+    out = io.StringIO()
+    with redirect_stdout(out):
+        val = minimax(board, player, depth, trace=trace, ply=ply, tt=tt, counts=counts,
+                      history=history, inc=new_incremental_eval(board, settings),
+                      settings=settings)
+    tt_stats = (tt.hits, tt.misses, tt.evictions) if tt is not None else (0, 0, 0)
+    return val, out.getvalue(), counts.nodes, counts.cutoffs, tt_stats
+
+def parallel_branch_values(board: List[str], player: str, depth: int, workers: int,
+                           split_ply: int = 1, trace: bool = False,
+                           settings: Optional[SearchSettings] = None
+                           ) -> Tuple[List[Tuple[int, int]], List[str], SearchCounts, Tuple[int, int, int]]:
+    """
+    branch_values() on a ProcessPoolExecutor.
+
+    split_ply=1 sends each root move to a worker; split_ply=2 sends each reply
+    to each root move, and the reply level is combined here (the root branches
+    then have no pruning between replies, but values are the same).
+
+    Returns (branches in move order, trace text per branch, summed counts,
+    summed (tt hits, misses, evictions)).
+    """
+    if settings is None:
+        settings = current_settings()
+    opp = next_player(player)
+    tasks: List[tuple] = []
+    plan: List[Tuple[int, Optional[List[Tuple[int, int]]], int]] = []  # (move, [(reply, task)], task)
+
+    for mv in legal_moves(board):
+        child = board[:]
+        child[mv] = player
+        if split_ply == 1 or depth - 1 == 0 or winner(child) is not None or board_full(child):
+            plan.append((mv, None, len(tasks)))
+            tasks.append((child, opp, depth - 1, 1, trace, settings))
+            continue
+        replies = []
+        for reply in legal_moves(child):
+            grandchild = child[:]
+            grandchild[reply] = opp
+            replies.append((reply, len(tasks)))
+            tasks.append((grandchild, player, depth - 2, 2, trace, settings))
+        plan.append((mv, replies, -1))
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(search_subtree, tasks))
+
+    counts = SearchCounts()
+    tt_stats = [0, 0, 0]
+    for _, _, nodes, cutoffs, stats in results:
+        counts.nodes += nodes
+        counts.cutoffs += cutoffs
+        for i in range(3):
+            tt_stats[i] += stats[i]
+
+    branches: List[Tuple[int, int]] = []
+    traces: List[str] = []
+    for mv, replies, task_index in plan:
+        if replies is None:
+            val, text = results[task_index][:2]
+            branches.append((mv, val))
+            traces.append(text)
+            continue
+
+        # rebuild the reply node (ply 1) that the workers were split under
+        counts.nodes += 1
+        child_vals = [(reply, results[i][0]) for reply, i in replies]
+        vals_only = [v for _, v in child_vals]
+        val = max(vals_only) if opp == "X" else min(vals_only)
+        branches.append((mv, val))
+        if trace:
+            role = "MAX" if opp == "X" else "MIN"
+            best_moves = [r for r, v in child_vals if v == val]
+            text = f"  {opp} depth={depth - 1} ({role}) exploring moves {[r for r, _ in replies]}\n"
+            text += "".join(results[i][1] for _, i in replies)
+            text += f"  {opp} chooses {val} from {vals_only} via moves {best_moves}\n"
+            traces.append(text)
+        else:
+            traces.append("")
+    return branches, traces, counts, (tt_stats[0], tt_stats[1], tt_stats[2])
+
 def choose_best_from_branches(player: str, branches: List[Tuple[int, int]]) -> Tuple[int, int]:
     """
     Choose best branch for player: MAX chooses highest value, MIN chooses lowest value.
@@ -246,35 +806,95 @@ def main() -> None:
         print("Board value:", evaluate(board))
         return
 
-    # ---- Option A: trace every root branch ----
-    traced_branches: List[Tuple[int, int]] = []
-    for mv in legal_moves(board):
-        board[mv] = CURRENT_PLAYER
-
-        print("\n" + "=" * 60)
-        print(f"Root move {mv} by {CURRENT_PLAYER} (row,col={idx_to_rc(mv)})")
-        print("=" * 60)
-
-        if TRACE_SHOW_ROOT_BOARD:
-            print(format_board(board))
-            print()
-
-        val = minimax(
-            board,
-            next_player(CURRENT_PLAYER),
-            SEARCH_DEPTH - 1,
-            trace=TRACE_ALL_ROOT_BRANCHES,
-            ply=1
+    settings = current_settings()
+    tt = TranspositionTable(TT_MAX_ENTRIES) if USE_TRANSPOSITION_TABLE else None
+    counts = SearchCounts()
+    history = new_history() if USE_ALPHA_BETA and MOVE_ORDERING == "history" else None
+    inc = new_incremental_eval(board, settings)
+
+    # ---- Perfect-play table: full-depth terminal_only is a lookup, not a search ----
+    traced_branches: Optional[List[Tuple[int, int]]] = None
+    if USE_PERFECT_TABLE and EVAL_MODE == "terminal_only" and SEARCH_DEPTH >= board.count(" "):
+        with PerfectTable() as table:
+            traced_branches = table.branch_values(board, CURRENT_PLAYER)
+        if traced_branches is None:
+            print("\nPosition is not reachable with X moving first; searching instead.")
+        else:
+            print("\nRoot values read from the perfect-play table (no search).")
+    used_table = traced_branches is not None
+    parallel_tt_stats = None
+
+    if traced_branches is None and PARALLEL_WORKERS > 0:
+        # ---- Option A, in parallel: traces are captured per branch, printed in order ----
+        traced_branches, traces, counts, parallel_tt_stats = parallel_branch_values(
+            board, CURRENT_PLAYER, SEARCH_DEPTH, PARALLEL_WORKERS,
+            PARALLEL_SPLIT_PLY, TRACE_ALL_ROOT_BRANCHES, settings
         )
+        for (mv, _), text in zip(traced_branches, traces):
+            board[mv] = CURRENT_PLAYER
+            print("\n" + "=" * 60)
+            print(f"Root move {mv} by {CURRENT_PLAYER} (row,col={idx_to_rc(mv)})")
+            print("=" * 60)
+            if TRACE_SHOW_ROOT_BOARD:
+                print(format_board(board))
+                print()
+            print(text, end="")
+            if SHOW_BOARD_PER_BRANCH:
+                print("\nBoard after this root move:\n")
+                print(format_board(board))
+            board[mv] = " "
 
-        board[mv] = " "
-        traced_branches.append((mv, val))
-
-        if SHOW_BOARD_PER_BRANCH:
+    if traced_branches is None:
+        # ---- Option A: trace every root branch ----
+        sink = make_trace_sink() if TRACE_ALL_ROOT_BRANCHES else None
+        traced_branches = []
+        for mv in legal_moves(board):
+            if sink is not None:
+                sink.root_move = mv
             board[mv] = CURRENT_PLAYER
-            print("\nBoard after this root move:\n")
-            print(format_board(board))
+            if inc is not None:
+                inc.make(mv, CURRENT_PLAYER)
+
+            print("\n" + "=" * 60)
+            print(f"Root move {mv} by {CURRENT_PLAYER} (row,col={idx_to_rc(mv)})")
+            print("=" * 60)
+
+            if TRACE_SHOW_ROOT_BOARD:
+                print(format_board(board))
+                print()
+
+            val = minimax(
+                board,
+                next_player(CURRENT_PLAYER),
+                SEARCH_DEPTH - 1,
+                ply=1,
+                tt=tt,
+                counts=counts,
+                history=history,
+                inc=inc,
+                sink=sink,
+                settings=settings
+            )
+            if isinstance(sink, TreeTraceSink):
+                text = sink.render_text(mv)
+                if text:
+                    print(text)
+
+            if inc is not None:
+                inc.unmake(mv, CURRENT_PLAYER)
             board[mv] = " "
+            traced_branches.append((mv, val))
+
+            if SHOW_BOARD_PER_BRANCH:
+                board[mv] = CURRENT_PLAYER
+                print("\nBoard after this root move:\n")
+                print(format_board(board))
+                board[mv] = " "
+
+        if isinstance(sink, JsonlTraceSink):
+            print(f"\nTrace: {sink.events:,} events written to {TRACE_JSONL_FILE}")
+        if sink is not None:
+            sink.close()
 
     # Choose best move from traced branches
     best_mv, best_val = choose_best_from_branches(CURRENT_PLAYER, traced_branches)
@@ -296,6 +916,20 @@ def main() -> None:
         chosen = "<<<" if mv == best_mv else ""
         print(f"{mv:>4}  ({r},{c})  {val:>16}  {chosen:>7}")
 
+    search = f"alpha-beta (ordering={MOVE_ORDERING})" if USE_ALPHA_BETA else "plain minimax"
+    if used_table:
+        search = "perfect-play table lookup"
+    elif parallel_tt_stats is not None:
+        search += f", {PARALLEL_WORKERS} workers (split at ply {PARALLEL_SPLIT_PLY})"
+    print(f"\nSearch: {search}  nodes={counts.nodes:,}  cutoffs={counts.cutoffs:,}")
+    if parallel_tt_stats is not None:
+        if USE_TRANSPOSITION_TABLE:
+            hits, misses, evictions = parallel_tt_stats
+            print(f"Transposition tables (one per task, summed): hits={hits:,}  "
+                  f"misses={misses:,}  evictions={evictions:,}")
+    elif tt is not None:
+        print("Transposition table:", tt.summary())
+
     print("\nBest move:", best_mv, " (row,col)=", idx_to_rc(best_mv))
     print("Best predicted value:", best_val)
 
@@ -16,11 +16,20 @@ Minimax for Tic Tac Toe with:
 Enhancement:
 - Displays predicted minimax value for ALL root branches (all legal moves),
   marking which move was chosen.
+- Optional alpha-beta pruning with move ordering (same root values, fewer nodes).
+- Optional search instrumentation: per-ply nodes, leaf evaluations (win/full
+  vs depth cutoff), cutoffs and branching factor, plus time spent in evaluate()
+  vs move generation. Printed after the root branch report and optionally
+  written as JSON (STATS_JSON_FILE) for tracking over time.
 """
 
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import List, Optional, Tuple
+import json
+import time
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from tictactoe_minimax_2026 import SearchCounts, SearchSettings, new_history, order_moves
 
 # ----------------------------
 # Configuration (edit these)
@@ -55,6 +64,12 @@ START_BOARD = [
 
 SHOW_BOARD_PER_BRANCH = False  # set True to print board after each root move
 
+USE_ALPHA_BETA = False         # prune with alpha-beta (root values do not change)
+MOVE_ORDERING = "static"       # "index", "static" (center, corners, edges) or "history"
+
+INSTRUMENT = False             # collect per-ply search statistics (SearchStats)
+STATS_JSON_FILE = None         # e.g. "search_stats.json" to also save them as JSON
+
 # ----------------------------
 # Game definitions
 # ----------------------------
@@ -123,60 +138,221 @@ def eval_tanimoto_100_10_1(board: List[str]) -> int:
     o3, o2, o1 = line_counts(board, "O")
     return (100*x3 + 10*x2 + x1) - (100*o3 + 10*o2 + o1)
 
-def evaluate(board: List[str]) -> int:
-    if EVAL_MODE == "terminal_only":
+def evaluate(board: List[str], eval_mode: Optional[str] = None) -> int:
+    if eval_mode is None:
+        eval_mode = EVAL_MODE
+    if eval_mode == "terminal_only":
         return eval_terminal_only(board)
-    if EVAL_MODE == "tanimoto_100_10_1":
+    if eval_mode == "tanimoto_100_10_1":
         return eval_tanimoto_100_10_1(board)
-    raise ValueError(f"Unknown EVAL_MODE: {EVAL_MODE}")
+    raise ValueError(f"Unknown EVAL_MODE: {eval_mode}")
+
+# ----------------------------
+# Search settings
+# ----------------------------
+
+# move ordering, SearchCounts and the settings type are shared with
+# tictactoe_minimax_2026.py so the two engines order moves the same way
+
+def current_settings() -> SearchSettings:
+    """SearchSettings from the configuration at the top of this file."""
+    return SearchSettings(eval_mode=EVAL_MODE, use_alpha_beta=USE_ALPHA_BETA,
+                          move_ordering=MOVE_ORDERING)
+
+# ----------------------------
+# Search instrumentation
+# ----------------------------
+
+MAX_PLY = 10                   # root (ply 0) .. 9 moves later
+
+class SearchStats:
+    """
+    Per-ply counters in flat integer arrays (index = ply from the root), so
+    recording is one indexed add. Times are cumulative nanoseconds.
+    """
+
+    def __init__(self) -> None:
+        self.nodes = array("q", [0] * MAX_PLY)        # positions visited
+        self.terminal = array("q", [0] * MAX_PLY)     # leaves evaluated: win or full board
+        self.depth_cut = array("q", [0] * MAX_PLY)    # leaves evaluated: depth == 0
+        self.cutoffs = array("q", [0] * MAX_PLY)      # alpha-beta cutoffs
+        self.eval_ns = 0
+        self.movegen_ns = 0
+
+    def interior(self, ply: int) -> int:
+        return self.nodes[ply] - self.terminal[ply] - self.depth_cut[ply]
+
+    def plies(self) -> int:
+        """Number of plies that saw any node."""
+        return max((p + 1 for p in range(MAX_PLY) if self.nodes[p]), default=0)
+
+    def branching(self, ply: int) -> float:
+        """Children searched per expanded node (below the legal move count after cutoffs)."""
+        n = self.interior(ply)
+        return self.nodes[ply + 1] / n if n and ply + 1 < MAX_PLY else 0.0
+
+    def growth(self, ply: int) -> float:
+        """nodes(ply + 1) / nodes(ply): how much the tree widens from this ply to the next."""
+        n = self.nodes[ply]
+        return self.nodes[ply + 1] / n if n and ply + 1 < MAX_PLY else 0.0
+
+    def effective_branching(self) -> float:
+        """
+        Geometric mean of growth(0) .. growth(d - 1), d = deepest ply:
+        the b with nodes(0) * b**d == nodes(d).
+        """
+        d = self.plies() - 1
+        return (self.nodes[d] / self.nodes[0]) ** (1 / d) if d > 0 else 0.0
+
+    def to_dict(self, settings: SearchSettings) -> Dict:
+        n = self.plies()
+        return {
+            "eval_mode": settings.eval_mode,
+            "depth": SEARCH_DEPTH,
+            "alpha_beta": settings.use_alpha_beta,
+            "move_ordering": settings.move_ordering if settings.use_alpha_beta else None,
+            "per_ply": [
+                {"ply": p, "nodes": self.nodes[p], "interior": self.interior(p),
+                 "terminal_leaves": self.terminal[p], "depth_leaves": self.depth_cut[p],
+                 "cutoffs": self.cutoffs[p], "branching": round(self.branching(p), 3),
+                 "growth": round(self.growth(p), 3)}
+                for p in range(n)
+            ],
+            "nodes": sum(self.nodes),
+            "leaf_evals": sum(self.terminal) + sum(self.depth_cut),
+            "effective_branching": round(self.effective_branching(), 3),
+            "eval_seconds": self.eval_ns / 1e9,
+            "movegen_seconds": self.movegen_ns / 1e9,
+        }
+
+def evaluate_leaf(board: List[str], stats: Optional[SearchStats], ply: int,
+                  terminal: bool, eval_mode: str) -> int:
+    if stats is None:
+        return evaluate(board, eval_mode)
+    t0 = time.perf_counter_ns()
+    val = evaluate(board, eval_mode)
+    stats.eval_ns += time.perf_counter_ns() - t0
+    if terminal:
+        stats.terminal[ply] += 1
+    else:
+        stats.depth_cut[ply] += 1
+    return val
+
+def print_search_stats(stats: SearchStats, settings: SearchSettings) -> None:
+    print("\nSearch statistics (ply 0 = starting position):\n")
+    header = (f"{'Ply':>3}  {'Nodes':>10}  {'Expanded':>10}  {'Win/full':>10}  "
+              f"{'Depth=0':>10}  {'Cutoffs':>8}  {'Branching':>9}  {'Growth':>7}")
+    print(header)
+    print("-" * len(header))
+    for p in range(stats.plies()):
+        print(f"{p:>3}  {stats.nodes[p]:>10,}  {stats.interior(p):>10,}  {stats.terminal[p]:>10,}  "
+              f"{stats.depth_cut[p]:>10,}  {stats.cutoffs[p]:>8,}  {stats.branching(p):>9.2f}  "
+              f"{stats.growth(p):>7.2f}")
+    leaves = sum(stats.terminal) + sum(stats.depth_cut)
+    print(f"\nNodes: {sum(stats.nodes):,}  leaf evals: {leaves:,}  "
+          f"effective branching factor: {stats.effective_branching():.2f}")
+    print(f"Time in evaluate(): {stats.eval_ns / 1e6:.2f} ms  "
+          f"move generation: {stats.movegen_ns / 1e6:.2f} ms")
+
+    if STATS_JSON_FILE:
+        with open(STATS_JSON_FILE, "w") as f:
+            json.dump(stats.to_dict(settings), f, indent=2)
+        print("Statistics written to", STATS_JSON_FILE)
 
 # ----------------------------
 # Minimax (depth-limited)
 # ----------------------------
 
-def minimax(board: List[str], player: str, depth: int) -> int:
+def minimax(board: List[str], player: str, depth: int,
+            alpha: int = -10**9, beta: int = 10**9,
+            counts: Optional[SearchCounts] = None,
+            history: Optional[dict] = None,
+            stats: Optional[SearchStats] = None, ply: int = 0,
+            settings: Optional[SearchSettings] = None) -> int:
+    if settings is None:
+        settings = current_settings()
+    if counts is not None:
+        counts.nodes += 1
+    if stats is not None:
+        stats.nodes[ply] += 1
+
     w = winner(board)
     if w is not None:
-        return evaluate(board)
+        return evaluate_leaf(board, stats, ply, True, settings.eval_mode)
     if board_full(board):
-        return evaluate(board)
+        return evaluate_leaf(board, stats, ply, True, settings.eval_mode)
     if depth == 0:
-        return evaluate(board)
+        return evaluate_leaf(board, stats, ply, False, settings.eval_mode)
 
+    if stats is not None:
+        t0 = time.perf_counter_ns()
     moves = legal_moves(board)
+    if settings.use_alpha_beta:
+        moves = order_moves(moves, player, history, settings.move_ordering)
+    if stats is not None:
+        stats.movegen_ns += time.perf_counter_ns() - t0
 
     if player == "X":  # MAX
         best_val = -10**9
         for mv in moves:
             board[mv] = "X"
-            val = minimax(board, "O", depth - 1)
+            val = minimax(board, "O", depth - 1, alpha, beta, counts, history, stats, ply + 1,
+                          settings)
             board[mv] = " "
             if val > best_val:
                 best_val = val
-        return best_val
+            if settings.use_alpha_beta:
+                alpha = max(alpha, best_val)
+                if alpha >= beta:
+                    break
     else:  # MIN
         best_val = 10**9
         for mv in moves:
             board[mv] = "O"
-            val = minimax(board, "X", depth - 1)
+            val = minimax(board, "X", depth - 1, alpha, beta, counts, history, stats, ply + 1,
+                          settings)
             board[mv] = " "
             if val < best_val:
                 best_val = val
-        return best_val
+            if settings.use_alpha_beta:
+                beta = min(beta, best_val)
+                if alpha >= beta:
+                    break
+
+    if settings.use_alpha_beta and alpha >= beta:
+        if counts is not None:
+            counts.cutoffs += 1
+        if stats is not None:
+            stats.cutoffs[ply] += 1
+        if history is not None:
+            history[player][mv] += depth * depth
+    return best_val
 
 # ----------------------------
 # Root branch reporting
 # ----------------------------
 
-def branch_values(board: List[str], player: str, depth: int) -> List[Tuple[int, int]]:
+def branch_values(board: List[str], player: str, depth: int,
+                  counts: Optional[SearchCounts] = None,
+                  stats: Optional[SearchStats] = None,
+                  settings: Optional[SearchSettings] = None) -> List[Tuple[int, int]]:
     """
     Returns a list of (move_index, predicted_value) for each legal root move.
     predicted_value is the minimax value AFTER making that move.
+    Root branches are searched with a full window, so alpha-beta values are exact.
+    stats (optional) counts the starting position as ply 0.
     """
+    if settings is None:
+        settings = current_settings()
+    history = (new_history() if settings.use_alpha_beta and settings.move_ordering == "history"
+               else None)
     results: List[Tuple[int, int]] = []
+    if stats is not None:
+        stats.nodes[0] += 1
     for mv in legal_moves(board):
         board[mv] = player
-        val = minimax(board, next_player(player), depth - 1)
+        val = minimax(board, next_player(player), depth - 1, counts=counts, history=history,
+                      stats=stats, ply=1, settings=settings)
         board[mv] = " "
         results.append((mv, val))
     return results
@@ -219,7 +395,10 @@ def main() -> None:
         print("Board value:", evaluate(board))
         return
 
-    branches = branch_values(board, CURRENT_PLAYER, SEARCH_DEPTH)
+    settings = current_settings()
+    counts = SearchCounts()
+    stats = SearchStats() if INSTRUMENT else None
+    branches = branch_values(board, CURRENT_PLAYER, SEARCH_DEPTH, counts, stats, settings)
     best_mv, best_val = choose_best_from_branches(CURRENT_PLAYER, branches)
 
     # Sort for display (nice for students): best-first for X, best-first (lowest) for O
@@ -246,6 +425,9 @@ def main() -> None:
             print()
             board[mv] = " "
 
+    if stats is not None:
+        print_search_stats(stats, settings)
+
     # The line above has one formatting glitch; print correctly:
     # We'll re-print the rows properly (and not duplicate work).
     # (Kept minimal: easiest is to just do the correct print once.)
@@ -282,7 +464,10 @@ if __name__ == "__main__":
         print("Board value:", evaluate(board))
         raise SystemExit(0)
 
-    branches = branch_values(board, CURRENT_PLAYER, SEARCH_DEPTH)
+    settings = current_settings()
+    counts = SearchCounts()
+    stats = SearchStats() if INSTRUMENT else None
+    branches = branch_values(board, CURRENT_PLAYER, SEARCH_DEPTH, counts, stats, settings)
     best_mv, best_val = choose_best_from_branches(CURRENT_PLAYER, branches)
 
     branches_sorted = sorted(branches, key=lambda t: t[1], reverse=(CURRENT_PLAYER == "X"))
@@ -303,6 +488,12 @@ if __name__ == "__main__":
             print()
             board[mv] = " "
 
+    search = (f"alpha-beta (ordering={settings.move_ordering})" if settings.use_alpha_beta
+              else "plain minimax")
+    print(f"\nSearch: {search}  nodes={counts.nodes:,}  cutoffs={counts.cutoffs:,}")
+    if stats is not None:
+        print_search_stats(stats, settings)
+
     print("\nBest move:", best_mv, " (row,col)=", idx_to_rc(best_mv))
     print("Best predicted value:", best_val)
 
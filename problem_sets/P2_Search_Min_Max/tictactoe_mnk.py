@@ -0,0 +1,400 @@
+"""
+tictactoe_mnk.py
+
+prof. lehman
+spring 2026
+
+Minimax for the m,n,k game: a ROWS x COLS board where K_IN_A_ROW marks in a
+row, column or diagonal win. Tic Tac Toe is the 3,3,3 game.
+
+- win lines are generated once per board shape and cached (tictactoe_mnk_board.py)
+- the Tanimoto 100/10/1 line-count heuristic generalizes to length k:
+  a line holding m marks of one player (and none of the other) scores 10**(m-1),
+  so k=3 gives exactly the 100/10/1 weights of tictactoe_minimax_2026.py
+- alpha-beta with center-first move ordering and a transposition table
+  keep 4x4 and 5x5 (4-in-a-row) searches practical
+- optional time budget: iterative deepening (depth 1, 2, 3, ...) that orders
+  each iteration by the previous one's best moves and returns the best move
+  of the deepest depth that finished in time
+
+Boards are lists of "X", "O", " " in row-major order (same as the 3x3 scripts).
+"""
+
+from __future__ import annotations
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from tictactoe_mnk_board import (
+    Shape, board_full, format_board, idx_to_rc, index_guide, legal_moves,
+    lines_through, win_lines, winner, winner_at,
+)
+from tictactoe_minimax_2026 import (
+    TT_EXACT, TT_LOWER, TT_UPPER, SearchCounts, TranspositionTable,
+    choose_best_from_branches, next_player,
+)
+
+# ----------------------------
+# Configuration (edit these)
+# ----------------------------
+
+ROWS = 4
+COLS = 4
+K_IN_A_ROW = 4
+
+CURRENT_PLAYER = "X"  # "X" (MAX) or "O" (MIN)
+
+#EVAL_MODE = "terminal_only"
+EVAL_MODE = "tanimoto_100_10_1"
+
+SEARCH_DEPTH: Optional[int] = 4  # plies, None = to the end of the game (with a time budget: the maximum depth)
+
+TIME_BUDGET_SECONDS: Optional[float] = None  # e.g. 2.0 for iterative deepening
+
+START_BOARD: Optional[List[str]] = None  # None = empty ROWS x COLS board
+
+USE_ALPHA_BETA = True
+USE_TRANSPOSITION_TABLE = True
+TT_MAX_ENTRIES = 1_000_000
+
+# ----------------------------
+# Move ordering and line weights
+# ----------------------------
+
+@lru_cache(maxsize=None)
+def line_weights(k: int) -> Tuple[int, ...]:
+    """line_weights(k)[m] = score of a line with m marks of one player and none of the other."""
+    return (0,) + tuple(10 ** (m - 1) for m in range(1, k + 1))
+
+@lru_cache(maxsize=None)
+def static_order(shape: Shape) -> Tuple[int, ...]:
+    """Squares sorted center-first (ties by index), used for move ordering."""
+    mid_r, mid_c = (shape.rows - 1) / 2, (shape.cols - 1) / 2
+    return tuple(sorted(
+        range(shape.cells),
+        key=lambda i: (abs(i // shape.cols - mid_r) + abs(i % shape.cols - mid_c), i)
+    ))
+
+# ----------------------------
+# Evaluation functions
+# ----------------------------
+
+def eval_terminal_only(board: List[str], shape: Shape) -> int:
+    w = winner(board, shape)
+    if w == "X":
+        return 1
+    if w == "O":
+        return -1
+    return 0  # tie OR non-terminal
+
+def eval_tanimoto(board: List[str], shape: Shape) -> int:
+    weights = line_weights(shape.k)
+    score = 0
+    for line in win_lines(shape):
+        xs = os = 0
+        for i in line:
+            cell = board[i]
+            if cell == "X":
+                xs += 1
+            elif cell == "O":
+                os += 1
+        if not os:
+            score += weights[xs]
+        elif not xs:
+            score -= weights[os]
+    return score
+
+def evaluate(board: List[str], shape: Shape, eval_mode: str) -> int:
+    if eval_mode == "terminal_only":
+        return eval_terminal_only(board, shape)
+    if eval_mode == "tanimoto_100_10_1":
+        return eval_tanimoto(board, shape)
+    raise ValueError(f"Unknown EVAL_MODE: {eval_mode}")
+
+# ----------------------------
+# Minimax (depth-limited, optional alpha-beta)
+# ----------------------------
+
+def tt_key(board: List[str], player: str, depth: int, shape: Shape,
+           eval_mode: str) -> Tuple[int, int, int, str, str, str, int]:
+    """
+    Transposition table key. Unlike the 3x3 engine's key it names the shape and
+    eval mode, so one table can be shared across boards and evaluations.
+    """
+    return (shape.rows, shape.cols, shape.k, eval_mode,
+            "".join(board), player, min(depth, board.count(" ")))
+
+class SearchTimeout(Exception):
+    """Raised inside minimax() when the iterative-deepening deadline passes."""
+
+def minimax(board: List[str], player: str, depth: int, shape: Shape, eval_mode: str, *,
+            alpha: int=-10**9, beta: int=10**9, last_move: Optional[int]=None,
+            tt: Optional[TranspositionTable]=None,
+            counts: Optional[SearchCounts]=None,
+            pv_table: Optional[dict]=None,
+            deadline: Optional[float]=None,
+            use_alpha_beta: Optional[bool]=None) -> int:
+    """
+    Same contract as tictactoe_minimax_2026.minimax(), for any board shape.
+    last_move lets the win check look only at lines through the square just played.
+    eval_mode and use_alpha_beta (None = USE_ALPHA_BETA) are per search, so
+    callers never need to change the module settings.
+
+    pv_table maps (board, player) -> best move found for that position; it is
+    tried first and updated, so each deepening iteration starts on the previous
+    principal variation. Past deadline (time.perf_counter()) SearchTimeout is raised.
+    """
+    if use_alpha_beta is None:
+        use_alpha_beta = USE_ALPHA_BETA
+    if counts is not None:
+        counts.nodes += 1
+    if deadline is not None and time.perf_counter() > deadline:
+        raise SearchTimeout
+
+    if last_move is not None:
+        w = winner_at(board, last_move, shape)
+    else:
+        w = winner(board, shape)
+    if w is not None or depth == 0 or board_full(board):
+        return evaluate(board, shape, eval_mode)
+
+    if tt is not None:
+        key = tt_key(board, player, depth, shape, eval_mode)
+        cached = tt.probe(key, alpha, beta)
+        if cached is not None:
+            return cached
+
+    alpha_orig, beta_orig = alpha, beta
+    maximizing = player == "X"
+    best_val = -10**9 if maximizing else 10**9
+    best_mv = -1
+
+    moves = [mv for mv in static_order(shape) if board[mv] == " "]
+    if pv_table is not None:
+        pv_key = ("".join(board), player)
+        hint = pv_table.get(pv_key)
+        if hint is not None:
+            moves.remove(hint)
+            moves.insert(0, hint)
+
+    for mv in moves:
+        board[mv] = player
+        try:
+            val = minimax(board, next_player(player), depth - 1, shape, eval_mode,
+                          alpha=alpha, beta=beta, last_move=mv, tt=tt, counts=counts,
+                          pv_table=pv_table, deadline=deadline, use_alpha_beta=use_alpha_beta)
+        finally:
+            board[mv] = " "
+
+        if maximizing:
+            if val > best_val:
+                best_val, best_mv = val, mv
+        elif val < best_val:
+            best_val, best_mv = val, mv
+
+        if not use_alpha_beta:
+            continue
+        if maximizing:
+            alpha = max(alpha, best_val)
+        else:
+            beta = min(beta, best_val)
+        if alpha >= beta:
+            if counts is not None:
+                counts.cutoffs += 1
+            break
+
+    if pv_table is not None:
+        pv_table[pv_key] = best_mv
+    if tt is not None:
+        if best_val <= alpha_orig:
+            flag = TT_UPPER
+        elif best_val >= beta_orig:
+            flag = TT_LOWER
+        else:
+            flag = TT_EXACT
+        tt.store(key, best_val, flag)
+    return best_val
+
+def branch_values(board: List[str], player: str, depth: int, shape: Shape, eval_mode: str,
+                  tt: Optional[TranspositionTable]=None,
+                  counts: Optional[SearchCounts]=None,
+                  root_order: Optional[List[int]]=None,
+                  pv_table: Optional[dict]=None,
+                  deadline: Optional[float]=None,
+                  use_alpha_beta: Optional[bool]=None) -> List[Tuple[int, int]]:
+    """
+    Returns a list of (move_index, predicted_value) for each legal root move,
+    each searched with a full window (exact values), in move-index order.
+    root_order only changes the order the root moves are searched in.
+    """
+    results: List[Tuple[int, int]] = []
+    for mv in (root_order if root_order is not None else legal_moves(board)):
+        board[mv] = player
+        try:
+            val = minimax(board, next_player(player), depth - 1, shape, eval_mode,
+                          last_move=mv, tt=tt, counts=counts,
+                          pv_table=pv_table, deadline=deadline, use_alpha_beta=use_alpha_beta)
+        finally:
+            board[mv] = " "
+        results.append((mv, val))
+    return sorted(results)
+
+# ----------------------------
+# Iterative deepening (time budget)
+# ----------------------------
+
+@dataclass
+class Iteration:
+    depth: int
+    branches: List[Tuple[int, int]]
+    best_move: int
+    best_value: int
+    principal_variation: List[int]
+    nodes: int
+    cutoffs: int
+    seconds: float
+
+def principal_variation(board: List[str], player: str, first_move: int,
+                        shape: Shape, pv_table: dict, max_len: int) -> List[int]:
+    """Follow the best-move table from the root move until it runs out (or the game ends)."""
+    board = board[:]
+    line = [first_move]
+    board[first_move] = player
+    player = next_player(player)
+    while len(line) < max_len and winner_at(board, line[-1], shape) is None:
+        mv = pv_table.get(("".join(board), player))
+        if mv is None or mv < 0 or board[mv] != " ":
+            break
+        line.append(mv)
+        board[mv] = player
+        player = next_player(player)
+    return line
+
+def iterative_deepening(board: List[str], player: str, shape: Shape, eval_mode: str,
+                        time_budget: float, max_depth: Optional[int]=None,
+                        tt: Optional[TranspositionTable]=None,
+                        use_alpha_beta: Optional[bool]=None) -> List[Iteration]:
+    """
+    Search depth 1, 2, 3, ... until time_budget seconds have passed (or max_depth /
+    the end of the game is reached). Returns one Iteration per COMPLETED depth;
+    the last one holds the move to play. Depth 1 always completes.
+
+    Each iteration searches the root moves best-first from the previous iteration
+    and reuses the best-move table, so alpha-beta cuts off early.
+    """
+    start = time.perf_counter()
+    deadline = start + time_budget
+    empties = board.count(" ")
+    max_depth = empties if max_depth is None else min(max_depth, empties)
+
+    pv_table: dict = {}
+    root_order = legal_moves(board)
+    iterations: List[Iteration] = []
+
+    for depth in range(1, max_depth + 1):
+        counts = SearchCounts()
+        t0 = time.perf_counter()
+        try:
+            branches = branch_values(board[:], player, depth, shape, eval_mode, tt, counts,
+                                     root_order=root_order, pv_table=pv_table,
+                                     deadline=deadline if depth > 1 else None,
+                                     use_alpha_beta=use_alpha_beta)
+        except SearchTimeout:
+            break
+        best_mv, best_val = choose_best_from_branches(player, branches)
+        iterations.append(Iteration(
+            depth=depth,
+            branches=branches,
+            best_move=best_mv,
+            best_value=best_val,
+            principal_variation=principal_variation(board, player, best_mv, shape, pv_table, depth),
+            nodes=counts.nodes,
+            cutoffs=counts.cutoffs,
+            seconds=time.perf_counter() - t0,
+        ))
+
+        # next iteration: chosen move first, then the rest best-first
+        ranked = sorted(branches, key=lambda t: t[1], reverse=(player == "X"))
+        root_order = [best_mv] + [mv for mv, _ in ranked if mv != best_mv]
+    return iterations
+
+# ----------------------------
+# Main
+# ----------------------------
+
+def main() -> None:
+    shape = Shape(ROWS, COLS, K_IN_A_ROW)
+    board = START_BOARD[:] if START_BOARD is not None else [" "] * shape.cells
+    if len(board) != shape.cells:
+        raise ValueError(f"START_BOARD has {len(board)} squares, expected {shape.cells}")
+
+    print(index_guide(shape))
+
+    print(f"\n=== m,n,k Minimax: {ROWS}x{COLS} board, {K_IN_A_ROW} in a row ===\n")
+    print("Win lines:", len(win_lines(shape)))
+    print("Evaluation:", EVAL_MODE)
+    print("Depth (plies):", SEARCH_DEPTH if SEARCH_DEPTH is not None else "to the end")
+    print("Player to move:", CURRENT_PLAYER)
+    print("\nStarting board:\n")
+    print(format_board(board, shape))
+
+    w = winner(board, shape)
+    if w is not None or board_full(board):
+        print("\nGame is already over.")
+        print("Board value:", evaluate(board, shape, EVAL_MODE))
+        return
+
+    tt = TranspositionTable(TT_MAX_ENTRIES) if USE_TRANSPOSITION_TABLE else None
+    counts = SearchCounts()
+
+    t0 = time.perf_counter()
+    if TIME_BUDGET_SECONDS is None:
+        depth = SEARCH_DEPTH if SEARCH_DEPTH is not None else board.count(" ")
+        branches = branch_values(board, CURRENT_PLAYER, depth, shape, EVAL_MODE, tt, counts,
+                                 use_alpha_beta=USE_ALPHA_BETA)
+    else:
+        iterations = iterative_deepening(board, CURRENT_PLAYER, shape, EVAL_MODE,
+                                         TIME_BUDGET_SECONDS, SEARCH_DEPTH, tt,
+                                         use_alpha_beta=USE_ALPHA_BETA)
+        print(f"\n\n=== Iterative deepening ({TIME_BUDGET_SECONDS}s budget) ===\n")
+        header = f"{'Depth':>5}  {'Best':>4}  {'Value':>8}  {'Nodes':>12}  {'Time (s)':>9}  PV"
+        print(header)
+        print("-" * len(header))
+        for it in iterations:
+            print(f"{it.depth:>5}  {it.best_move:>4}  {it.best_value:>8}  {it.nodes:>12,}  "
+                  f"{it.seconds:>9.3f}  {it.principal_variation}")
+        branches = iterations[-1].branches
+        counts.nodes = sum(it.nodes for it in iterations)
+        counts.cutoffs = sum(it.cutoffs for it in iterations)
+        print(f"\nDeepest completed depth: {iterations[-1].depth}")
+    elapsed = time.perf_counter() - t0
+
+    best_mv, best_val = choose_best_from_branches(CURRENT_PLAYER, branches)
+    branches_sorted = sorted(branches, key=lambda t: t[1], reverse=(CURRENT_PLAYER == "X"))
+
+    print("\n\n=== Root branch summary (predicted minimax value) ===\n")
+    header = f"{'Move':>4}  {'(r,c)':>7}  {'Predicted value':>16}  {'Chosen':>7}"
+    print(header)
+    print("-" * len(header))
+
+    for mv, val in branches_sorted:
+        r, c = idx_to_rc(mv, shape)
+        chosen = "<<<" if mv == best_mv else ""
+        print(f"{mv:>4}  ({r},{c})  {val:>16}  {chosen:>7}")
+
+    search = "alpha-beta" if USE_ALPHA_BETA else "plain minimax"
+    print(f"\nSearch: {search}  nodes={counts.nodes:,}  cutoffs={counts.cutoffs:,}  "
+          f"time={elapsed:.2f}s")
+    if tt is not None:
+        print("Transposition table:", tt.summary())
+
+    print("\nBest move:", best_mv, " (row,col)=", idx_to_rc(best_mv, shape))
+    print("Best predicted value:", best_val)
+
+    board[best_mv] = CURRENT_PLAYER
+    print("\nBoard after best move:\n")
+    print(format_board(board, shape))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+tictactoe_mnk_board.py
+
+prof. lehman
+spring 2026
+
+Board shapes for the m,n,k game (ROWS x COLS board, K in a row wins) with no
+search code attached: the shape, its win lines, its symmetries and the board
+helpers shared by tictactoe_mnk.py, tictactoe_mcts.py and the game / state
+enumerators. Importing it does not import any engine or touch any file.
+
+Boards are lists of "X", "O", " " in row-major order (same as the 3x3 scripts).
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+# ----------------------------
+# Board shape and win lines
+# ----------------------------
+
+@dataclass(frozen=True)
+class Shape:
+    rows: int
+    cols: int
+    k: int
+
+    @property
+    def cells(self) -> int:
+        return self.rows * self.cols
+
+@lru_cache(maxsize=None)
+def win_lines(shape: Shape) -> Tuple[Tuple[int, ...], ...]:
+    """All k-long runs of squares (rows, columns, both diagonals) on this shape."""
+    rows, cols, k = shape.rows, shape.cols, shape.k
+    lines = []
+    for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+        for r in range(rows):
+            for c in range(cols):
+                end_r, end_c = r + dr * (k - 1), c + dc * (k - 1)
+                if 0 <= end_r < rows and 0 <= end_c < cols:
+                    lines.append(tuple((r + dr * i) * cols + (c + dc * i) for i in range(k)))
+    return tuple(lines)
+
+@lru_cache(maxsize=None)
+def lines_through(shape: Shape) -> Tuple[Tuple[Tuple[int, ...], ...], ...]:
+    """lines_through(shape)[i] = the win lines that contain square i."""
+    lines = win_lines(shape)
+    return tuple(tuple(line for line in lines if i in line) for i in range(shape.cells))
+
+def format_board(b: List[str], shape: Shape) -> str:
+    rows = []
+    for r in range(0, shape.cells, shape.cols):
+        rows.append(" | ".join(b[r:r+shape.cols]))
+    return ("\n" + "-" * (4 * shape.cols - 3) + "\n").join(rows)
+
+def index_guide(shape: Shape) -> str:
+    width = len(str(shape.cells - 1))
+    rows = []
+    for r in range(shape.rows):
+        rows.append(" " + " | ".join(f"{r * shape.cols + c:>{width}}" for c in range(shape.cols)))
+    sep = "\n" + "+".join(["-" * (width + 2)] * shape.cols) + "\n"
+    return sep.join(rows)
+
+def idx_to_rc(i: int, shape: Shape) -> Tuple[int, int]:
+    return (i // shape.cols, i % shape.cols)
+
+def winner(board: List[str], shape: Shape) -> Optional[str]:
+    for line in win_lines(shape):
+        first = board[line[0]]
+        if first != " " and all(board[i] == first for i in line):
+            return first
+    return None
+
+def winner_at(board: List[str], square: int, shape: Shape) -> Optional[str]:
+    """Winner check restricted to lines through square (the move just played)."""
+    p = board[square]
+    for line in lines_through(shape)[square]:
+        if all(board[i] == p for i in line):
+            return p
+    return None
+
+def board_full(board: List[str]) -> bool:
+    return " " not in board
+
+def legal_moves(board: List[str]) -> List[int]:
+    return [i for i, cell in enumerate(board) if cell == " "]
+
+# ----------------------------
+# Board symmetries
+# ----------------------------
+
+@lru_cache(maxsize=None)
+def symmetry_permutations(shape: Shape) -> Tuple[Tuple[int, ...], ...]:
+    """
+    The symmetries of the board as index permutations: perm[i] is the square
+    whose mark lands on square i. A square board has 8 (4 rotations, each
+    optionally mirrored), any other rectangle 4 (identity, both mirrors and the
+    half turn). Win lines map onto win lines under all of them.
+    """
+    rows, cols = shape.rows, shape.cols
+    maps = [
+        lambda r, c: (r, c),
+        lambda r, c: (r, cols - 1 - c),
+        lambda r, c: (rows - 1 - r, c),
+        lambda r, c: (rows - 1 - r, cols - 1 - c),
+    ]
+    if rows == cols:
+        maps += [
+            lambda r, c: (c, r),
+            lambda r, c: (c, rows - 1 - r),
+            lambda r, c: (cols - 1 - c, r),
+            lambda r, c: (cols - 1 - c, rows - 1 - r),
+        ]
+    perms = []
+    for f in maps:
+        perm = [0] * shape.cells
+        for i in range(shape.cells):
+            r, c = f(i // cols, i % cols)
+            perm[r * cols + c] = i
+        perms.append(tuple(perm))
+    return tuple(perms)
+
+def canonical(board: List[str], shape: Shape) -> str:
+    """Representative of the board's symmetry class (smallest of its images)."""
+    return min("".join([board[i] for i in perm]) for perm in symmetry_permutations(shape))
+
+def symmetric_images(board: List[str], shape: Shape) -> int:
+    """Number of different boards in the board's symmetry class."""
+    return len({"".join([board[i] for i in perm]) for perm in symmetry_permutations(shape)})
+
+def unique_moves(board: List[str], turn: str, shape: Shape) -> List[Tuple[int, int, str]]:
+    """
+    One (move, multiplicity, canonical child) per symmetry class of resulting
+    positions; multiplicity = number of legal moves that lead to that class.
+    """
+    groups: Dict[str, List[int]] = {}
+    for mv in legal_moves(board):
+        board[mv] = turn
+        key = canonical(board, shape)
+        board[mv] = " "
+        if key in groups:
+            groups[key][1] += 1
+        else:
+            groups[key] = [mv, 1]
+    return [(mv, mult, key) for key, (mv, mult) in groups.items()]
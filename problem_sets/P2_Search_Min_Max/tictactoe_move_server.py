@@ -0,0 +1,257 @@
+"""
+tictactoe_move_server.py
+
+prof. lehman
+spring 2026
+
+Long-running local move server for the minimax engine in tictactoe_minimax_2026.py.
+
+Starting a new Python process per query pays for imports and table setup every
+time, and the transposition table is thrown away after each search. This server
+starts once and keeps everything warm between requests:
+  - one transposition table per evaluation mode, shared by all requests
+  - an LRU cache of complete answers (same board / player / depth / eval)
+
+It listens on localhost (HTTP, one thread per connection, so several clients can
+be connected at once; searches themselves run one at a time).
+
+    GET /move?board=XO..XX..O&player=O&depth=2&eval=tanimoto_100_10_1
+        board: 9 squares left-to-right, top-to-bottom, "." (or "-" / "_") = empty
+        -> {"branches": [{"move": 3, "value": 10}, ...], "best_move": 3,
+            "best_value": 10, "table": "<root branch summary text>",
+            "nodes": 16, "cached": false, "server_ms": 0.41}
+        (a cached answer reports "nodes": 0: nothing was searched for it)
+
+    GET /stats
+        -> request count, latency p50/p95/p99/max (ms), cache sizes and hit rates
+
+usage: python tictactoe_move_server.py [--port 8765]
+       request_move(".OX.OXX..", "O", 2) from another script (urllib client)
+"""
+
+from __future__ import annotations
+import argparse
+import json
+import threading
+import time
+import urllib.parse
+import urllib.request
+from collections import OrderedDict, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Deque, Dict, List, Optional, Tuple
+
+import tictactoe_minimax_2026 as engine
+from tictactoe_batch_analysis import parse_position
+
+# ----------------------------
+# Configuration (edit these)
+# ----------------------------
+
+HOST = "127.0.0.1"
+PORT = 8765
+
+EVAL_MODES = ("terminal_only", "tanimoto_100_10_1")
+DEFAULT_EVAL_MODE = "tanimoto_100_10_1"
+DEFAULT_DEPTH = 2
+
+RESULT_CACHE_ENTRIES = 10_000     # complete answers kept (least recently used evicted)
+TT_MAX_ENTRIES = 1_000_000        # per evaluation mode
+LATENCY_WINDOW = 10_000           # latency stats cover the most recent requests
+
+# ----------------------------
+# Search service (shared by all request threads)
+# ----------------------------
+
+class BadRequest(ValueError):
+    """Request parameters that cannot be searched (reported as HTTP 400)."""
+
+def percentile(values: List[float], p: float) -> float:
+    """Nearest-rank percentile (p in 0..100) of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * p // 100))
+    return ordered[int(rank) - 1]
+
+def format_branch_table(player: str, branches: List[Tuple[int, int]], best_mv: int) -> str:
+    """Root branch summary, same layout as tictactoe_minimax_2026.py."""
+    lines = []
+    header = f"{'Move':>4}  {'(r,c)':>7}  {'Predicted value':>16}  {'Chosen':>7}"
+    lines.append(header)
+    lines.append("-" * len(header))
+    for mv, val in sorted(branches, key=lambda t: t[1], reverse=(player == "X")):
+        r, c = engine.idx_to_rc(mv)
+        chosen = "<<<" if mv == best_mv else ""
+        lines.append(f"{mv:>4}  ({r},{c})  {val:>16}  {chosen:>7}")
+    return "\n".join(lines)
+
+class MoveService:
+    """Warm caches + latency bookkeeping. analyze() is safe to call from many threads."""
+
+    def __init__(self, result_entries: int = RESULT_CACHE_ENTRIES,
+                 tt_max_entries: int = TT_MAX_ENTRIES) -> None:
+        self.result_entries = result_entries
+        self.results: OrderedDict = OrderedDict()
+        self.tables: Dict[str, engine.TranspositionTable] = {
+            mode: engine.TranspositionTable(tt_max_entries) for mode in EVAL_MODES
+        }
+        self.search_lock = threading.Lock()   # guards the shared tables and result cache
+        self.stats_lock = threading.Lock()
+        self.latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self.requests = 0
+        self.errors = 0
+        self.result_hits = 0
+
+    def analyze(self, board: List[str], player: str, depth: int, eval_mode: str) -> Dict:
+        if eval_mode not in EVAL_MODES:
+            raise BadRequest(f"unknown eval mode: {eval_mode}")
+        if not 1 <= depth <= 9:
+            raise BadRequest("depth must be 1..9")
+        if engine.winner(board) is not None or engine.board_full(board):
+            raise BadRequest("game is already over")
+
+        # the request fields are echoed as asked; a cached answer may come from
+        # a deeper request that reached the same (capped) depth
+        request = {
+            "board": "".join("." if cell == " " else cell for cell in board),
+            "player": player,
+            "depth": depth,
+            "eval": eval_mode,
+        }
+        key = ("".join(board), player, min(depth, board.count(" ")), eval_mode)
+        with self.search_lock:
+            if key in self.results:
+                self.results.move_to_end(key)
+                self.result_hits += 1
+                return dict(request, **self.results[key], nodes=0, cached=True)
+
+            # no alpha-beta: keeps every table entry an exact value
+            settings = engine.SearchSettings(eval_mode=eval_mode, use_alpha_beta=False)
+            counts = engine.SearchCounts()
+            branches = engine.branch_values(board[:], player, depth, tt=self.tables[eval_mode],
+                                            counts=counts, settings=settings)
+
+            best_mv, best_val = engine.choose_best_from_branches(player, branches)
+            result = {
+                "branches": [{"move": mv, "value": val} for mv, val in branches],
+                "best_move": best_mv,
+                "best_value": best_val,
+                "table": format_branch_table(player, branches, best_mv),
+            }
+            self.results[key] = result
+            if len(self.results) > self.result_entries:
+                self.results.popitem(last=False)
+        return dict(request, **result, nodes=counts.nodes, cached=False)
+
+    def record(self, seconds: float, ok: bool) -> None:
+        with self.stats_lock:
+            self.requests += 1
+            if ok:
+                self.latencies.append(seconds)
+            else:
+                self.errors += 1
+
+    def stats(self) -> Dict:
+        with self.stats_lock:
+            latencies = list(self.latencies)
+            requests, errors = self.requests, self.errors
+        summary = {"requests": requests, "errors": errors}
+        if latencies:
+            summary["latency_ms"] = {
+                "p50": percentile(latencies, 50) * 1000,
+                "p95": percentile(latencies, 95) * 1000,
+                "p99": percentile(latencies, 99) * 1000,
+                "max": max(latencies) * 1000,
+                "window": len(latencies),
+            }
+        with self.search_lock:
+            summary["result_cache"] = {"entries": len(self.results), "hits": self.result_hits}
+            summary["transposition_tables"] = {
+                mode: {"entries": len(tt.entries), "hits": tt.hits, "misses": tt.misses,
+                       "evictions": tt.evictions}
+                for mode, tt in self.tables.items()
+            }
+        return summary
+
+# ----------------------------
+# HTTP front end
+# ----------------------------
+
+class MoveRequestHandler(BaseHTTPRequestHandler):
+    service: MoveService   # set by make_server()
+
+    def do_GET(self) -> None:
+        url = urllib.parse.urlparse(self.path)
+        if url.path == "/stats":
+            self.send_json(200, self.service.stats())
+            return
+        if url.path != "/move":
+            self.send_json(404, {"error": f"unknown path: {url.path}"})
+            return
+
+        t0 = time.perf_counter()
+        query = urllib.parse.parse_qs(url.query)
+        try:
+            board, player = parse_position(
+                f"{query.get('board', [''])[0]} {query.get('player', [''])[0]}"
+            )
+            depth = int(query.get("depth", [DEFAULT_DEPTH])[0])
+            eval_mode = query.get("eval", [DEFAULT_EVAL_MODE])[0]
+            answer = self.service.analyze(board, player, depth, eval_mode)
+        except ValueError as exc:   # parse errors and BadRequest
+            self.service.record(time.perf_counter() - t0, ok=False)
+            self.send_json(400, {"error": str(exc)})
+            return
+        elapsed = time.perf_counter() - t0
+        self.service.record(elapsed, ok=True)
+        answer["server_ms"] = round(elapsed * 1000, 3)
+        self.send_json(200, answer)
+
+    def send_json(self, status: int, payload: Dict) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass   # one line per request is too noisy under load; see /stats
+
+def make_server(host: str = HOST, port: int = PORT,
+                service: Optional[MoveService] = None) -> ThreadingHTTPServer:
+    handler = type("BoundMoveRequestHandler", (MoveRequestHandler,),
+                   {"service": service or MoveService()})
+    return ThreadingHTTPServer((host, port), handler)
+
+# ----------------------------
+# Client helper
+# ----------------------------
+
+def request_move(board: str, player: str, depth: int = DEFAULT_DEPTH,
+                 eval_mode: str = DEFAULT_EVAL_MODE, host: str = HOST, port: int = PORT) -> Dict:
+    """Ask a running server for the root branch values of board ("." = empty)."""
+    query = urllib.parse.urlencode({"board": board, "player": player,
+                                    "depth": depth, "eval": eval_mode})
+    with urllib.request.urlopen(f"http://{host}:{port}/move?{query}") as resp:
+        return json.loads(resp.read())
+
+# ----------------------------
+# Main
+# ----------------------------
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local Tic Tac Toe move server.")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    args = parser.parse_args()
+
+    server = make_server(args.host, args.port)
+    print(f"Move server on http://{args.host}:{args.port}  (GET /move, GET /stats; Ctrl-C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+"""
+tictactoe_perfect_table.py
+
+prof. lehman
+spring 2026
+
+Perfect-play table for every reachable Tic Tac Toe position (X starts).
+
+Build step (retrograde analysis):
+  1) walk forward from the empty board to collect all 5,478 legal positions
+     (play stops at a win or a full board)
+  2) go backward, from 9 marks down to 0: terminal positions are scored
+     +1 X win / -1 O win / 0 tie, every other position takes the max (X to move)
+     or min (O to move) of its children, which are already solved
+
+Each position is stored at its base-3 board number
+    index = sum(digit(board[i]) * 3**i)   digit: " "=0, "X"=1, "O"=2
+as one little-endian 16-bit record:
+    bits 0-8   best moves (bit i set -> square i is an optimal move)
+    bits 9-10  game value + 1  (0 = O wins, 1 = tie, 2 = X wins)
+    bit  11    position is reachable
+so the whole file is a small header + 3**9 records (~39 KB).
+
+PerfectTable memory-maps the file; a lookup is one unpack at a fixed offset.
+The file is built on first use. It is written to a temporary file and renamed
+into place, so a crash or a second process never sees half a table. A file
+with the wrong header or size is rebuilt.
+The value matches a full-depth "terminal_only" minimax search of the position.
+"""
+
+from __future__ import annotations
+import mmap
+import os
+import struct
+import tempfile
+from typing import Dict, Iterable, List, Optional, Tuple
+
+TABLE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tictactoe_perfect.bin")
+
+MAGIC = b"TTTPERF1"
+RECORD = struct.Struct("<H")
+NUM_INDEXES = 3 ** 9
+FILE_SIZE = len(MAGIC) + NUM_INDEXES * RECORD.size
+
+BEST_MASK = (1 << 9) - 1
+VALUE_SHIFT = 9
+REACHABLE = 1 << 11
+
+WIN_LINES = [
+    (0, 1, 2), (3, 4, 5), (6, 7, 8),  # rows
+    (0, 3, 6), (1, 4, 7), (2, 5, 8),  # cols
+    (0, 4, 8), (2, 4, 6)              # diagonals
+]
+
+DIGIT = {" ": 0, "X": 1, "O": 2}
+POW3 = [3 ** i for i in range(9)]
+
+# ----------------------------
+# Board helpers
+# ----------------------------
+
+def board_index(board: List[str]) -> int:
+    """Base-3 board number (0 .. 3**9 - 1)."""
+    return sum(DIGIT[cell] * POW3[i] for i, cell in enumerate(board))
+
+def winner(board: List[str]) -> Optional[str]:
+    for a, b, c in WIN_LINES:
+        if board[a] != " " and board[a] == board[b] == board[c]:
+            return board[a]
+    return None
+
+def player_to_move(board: List[str]) -> str:
+    """X starts, so X moves whenever the mark counts are equal."""
+    return "X" if board.count("X") == board.count("O") else "O"
+
+# ----------------------------
+# Build (retrograde analysis)
+# ----------------------------
+
+def reachable_positions() -> Dict[int, List[str]]:
+    """index -> board for every position reachable from the empty board."""
+    found: Dict[int, List[str]] = {}
+    frontier = [[" "] * 9]
+    found[0] = frontier[0]
+    while frontier:
+        next_frontier = []
+        for board in frontier:
+            if winner(board) is not None or " " not in board:
+                continue
+            turn = player_to_move(board)
+            for mv in range(9):
+                if board[mv] != " ":
+                    continue
+                child = board[:]
+                child[mv] = turn
+                idx = board_index(child)
+                if idx not in found:
+                    found[idx] = child
+                    next_frontier.append(child)
+        frontier = next_frontier
+    return found
+
+def solve_positions() -> Dict[int, Tuple[int, int]]:
+    """index -> (game value, best-move mask), solved from full boards back to empty."""
+    positions = reachable_positions()
+    solved: Dict[int, Tuple[int, int]] = {}
+
+    by_marks = sorted(positions.items(), key=lambda item: -(9 - item[1].count(" ")))
+    for idx, board in by_marks:
+        w = winner(board)
+        if w is not None:
+            solved[idx] = (1 if w == "X" else -1, 0)
+            continue
+        if " " not in board:
+            solved[idx] = (0, 0)
+            continue
+
+        turn = player_to_move(board)
+        digit = DIGIT[turn]
+        child_vals = [
+            (mv, solved[idx + digit * POW3[mv]][0])
+            for mv in range(9) if board[mv] == " "
+        ]
+        pick = max if turn == "X" else min
+        best_val = pick(v for _, v in child_vals)
+        mask = 0
+        for mv, v in child_vals:
+            if v == best_val:
+                mask |= 1 << mv
+        solved[idx] = (best_val, mask)
+    return solved
+
+def write_atomic(path: str, chunks: Iterable[bytes]) -> None:
+    """Write chunks to a temporary file next to path, then rename it over path."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)),
+                                    prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, 0o644)   # mkstemp creates it owner-only
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def file_matches(path: str, magic: bytes, size: int) -> bool:
+    """True if path exists, has exactly size bytes and starts with magic."""
+    try:
+        if os.path.getsize(path) != size:
+            return False
+        with open(path, "rb") as f:
+            return f.read(len(magic)) == magic
+    except OSError:
+        return False
+
+def build_table(path: str = TABLE_FILE) -> int:
+    """Write the table file; returns the number of positions stored."""
+    records = bytearray(NUM_INDEXES * RECORD.size)
+    solved = solve_positions()
+    for idx, (value, mask) in solved.items():
+        RECORD.pack_into(records, idx * RECORD.size, REACHABLE | (value + 1) << VALUE_SHIFT | mask)
+    write_atomic(path, (MAGIC, records))
+    return len(solved)
+
+# ----------------------------
+# Lookup (memory-mapped)
+# ----------------------------
+
+class PerfectTable:
+    """
+    Read-only, memory-mapped view of the table file.
+
+        with PerfectTable() as table:
+            table.value(board)        # +1 / 0 / -1, or None if unreachable
+            table.best_moves(board)   # optimal squares for the player to move
+    """
+
+    def __init__(self, path: str = TABLE_FILE) -> None:
+        if not file_matches(path, MAGIC, FILE_SIZE):
+            build_table(path)   # missing, truncated or from another format
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> PerfectTable:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def record(self, index: int) -> int:
+        return RECORD.unpack_from(self._map, len(MAGIC) + index * RECORD.size)[0]
+
+    def lookup(self, board: List[str]) -> Optional[Tuple[int, List[int]]]:
+        """(value, best moves) for a reachable position, else None."""
+        rec = self.record(board_index(board))
+        if not rec & REACHABLE:
+            return None
+        mask = rec & BEST_MASK
+        return (rec >> VALUE_SHIFT & 3) - 1, [i for i in range(9) if mask >> i & 1]
+
+    def value(self, board: List[str]) -> Optional[int]:
+        found = self.lookup(board)
+        return None if found is None else found[0]
+
+    def best_moves(self, board: List[str]) -> List[int]:
+        found = self.lookup(board)
+        return [] if found is None else found[1]
+
+    def branch_values(self, board: List[str], player: str) -> Optional[List[Tuple[int, int]]]:
+        """
+        Table version of a full-depth terminal_only branch_values(): (move, value)
+        for every legal move. None if any resulting position is not reachable
+        (e.g. player is not the one whose turn it is with X moving first).
+        """
+        base = board_index(board)
+        digit = DIGIT[player]
+        results: List[Tuple[int, int]] = []
+        for mv in range(9):
+            if board[mv] != " ":
+                continue
+            rec = self.record(base + digit * POW3[mv])
+            if not rec & REACHABLE:
+                return None
+            results.append((mv, (rec >> VALUE_SHIFT & 3) - 1))
+        return results
+
+# ----------------------------
+# Main
+# ----------------------------
+
+def main() -> None:
+    count = build_table(TABLE_FILE)
+    size = os.path.getsize(TABLE_FILE)
+    print(f"Wrote {count:,} positions to {TABLE_FILE} ({size:,} bytes)")
+
+    with PerfectTable(TABLE_FILE) as table:
+        value, best = table.lookup([" "] * 9)
+        print("Empty board value:", value, " best first moves:", best)
+
+if __name__ == "__main__":
+    main()
@@ -12,10 +12,33 @@ Counts game states at each move depth (1..9), and how many terminal outcomes
 
 "State" here means a reached board position after exactly N moves along legal play,
 where play stops after a win.
+
+With USE_SYMMETRY = True, moves that lead to the same position up to rotation/
+reflection are expanded once and weighted by how many raw moves they stand for.
+The States/outcome columns stay exact raw counts, and a "Unique" column shows
+how many positions are distinct up to symmetry at each depth. The symmetry
+helpers (tictactoe_mnk_board.py) work for any board shape, so this also
+combines with COUNT_MODE = "memo" below.
+
+With COUNT_MODE = "memo", the raw counts are computed level by level instead of
+path by path: each distinct position at depth N is kept once with the number of
+move sequences that reach it, and its children at depth N+1 inherit that count.
+A "Distinct" column shows how many different positions exist at each depth.
+MEMO_ROWS/COLS/K select the board shape for this mode. With USE_SYMMETRY the
+levels hold one position per symmetry class (Distinct is still the raw count).
 """
 
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional, Set
+
+from tictactoe_mnk_board import Shape, canonical, symmetric_images, unique_moves, winner_at
+
+USE_SYMMETRY = False  # Set True for symmetry-reduced expansion + unique state counts
+
+COUNT_MODE = "paths"  # "paths" (walk every move sequence) or "memo" (each distinct position once)
+MEMO_ROWS = 3         # board shape used by COUNT_MODE = "memo"
+MEMO_COLS = 3
+MEMO_K = 3
 
 WIN_LINES = [
     (0, 1, 2), (3, 4, 5), (6, 7, 8),  # rows
@@ -29,6 +52,10 @@ class LevelStats:
     x_wins: int = 0     # terminal positions at this depth where X has won
     o_wins: int = 0     # terminal positions at this depth where O has won
     ties: int = 0       # terminal positions at this depth that are ties
+    unique: int = 0     # positions distinct up to symmetry (USE_SYMMETRY only)
+    distinct: int = 0   # different positions at this depth (COUNT_MODE = "memo" only)
+
+SHAPE = Shape(3, 3, 3)  # board of COUNT_MODE = "paths"
 
 def winner(board: List[str]) -> Optional[str]:
     for a, b, c in WIN_LINES:
@@ -46,11 +73,16 @@ def backtrack(
     board: List[str],
     turn: str,
     move_depth: int,
-    levels: List[LevelStats]
+    levels: List[LevelStats],
+    weight: int = 1,
+    seen: Optional[List[Set[str]]] = None
 ) -> None:
     """
     move_depth = number of moves already made on the board (0..9).
     When we make a move, depth becomes move_depth+1 and we record a state at that level.
+
+    weight = raw paths this call stands for (1 unless USE_SYMMETRY is on).
+    seen   = per-depth sets of canonical positions, used for the unique counts.
     """
 
     # If already terminal, stop (should only happen at root in weird calls; safe guard)
@@ -58,51 +90,125 @@ def backtrack(
     if w is not None or board_full(board):
         return
 
-    for mv in legal_moves(board):
+    if USE_SYMMETRY:
+        moves = unique_moves(board, turn, SHAPE)
+    else:
+        moves = [(mv, 1, "") for mv in legal_moves(board)]
+
+    for mv, mult, key in moves:
         board[mv] = turn
         new_depth = move_depth + 1  # 1..9
+        w_child = weight * mult
 
         # Record that we reached a state at this depth
-        levels[new_depth].states += 1
+        levels[new_depth].states += w_child
+        if seen is not None and key not in seen[new_depth]:
+            seen[new_depth].add(key)
+            levels[new_depth].unique += 1
 
         w = winner(board)
         if w == "X":
-            levels[new_depth].x_wins += 1
+            levels[new_depth].x_wins += w_child
             # stop expanding (game ends)
         elif w == "O":
-            levels[new_depth].o_wins += 1
+            levels[new_depth].o_wins += w_child
             # stop expanding (game ends)
         elif board_full(board):
-            levels[new_depth].ties += 1
+            levels[new_depth].ties += w_child
             # stop expanding (tie ends)
         else:
             next_turn = "O" if turn == "X" else "X"
-            backtrack(board, next_turn, new_depth, levels)
+            backtrack(board, next_turn, new_depth, levels, w_child, seen)
 
         # undo move
         board[mv] = " "
 
-def main() -> None:
-    # index 0 unused for convenience; we use 1..9
-    levels = [LevelStats() for _ in range(10)]
+def count_levels_memo(shape: Shape, levels: List[LevelStats], symmetric: bool = False) -> None:
+    """
+    Same raw counts as backtrack(), one depth at a time.
+    frontier maps each non-terminal position at the current depth to the
+    number of move sequences that reach it. With symmetric, a position stands
+    for its whole symmetry class (keyed by canonical(), paths summed over the
+    class), and moves into the same class are followed once with their weight.
+    """
+    frontier: Dict[str, int] = {" " * shape.cells: 1}
+    turn = "X"
+    for new_depth in range(1, shape.cells + 1):
+        next_frontier: Dict[str, int] = {}
+        distinct: Dict[str, int] = {}   # child (class) -> raw positions it stands for
+        for key, paths in frontier.items():
+            board = list(key)
+            if symmetric:
+                moves = unique_moves(board, turn, shape)
+            else:
+                moves = [(mv, 1, "") for mv in legal_moves(board)]
+            for mv, mult, child in moves:
+                board[mv] = turn
+                child = child or "".join(board)
+                child_paths = paths * mult
+                levels[new_depth].states += child_paths
+                if child not in distinct:
+                    distinct[child] = symmetric_images(board, shape) if symmetric else 1
+
+                w = winner_at(board, mv, shape)
+                if w == "X":
+                    levels[new_depth].x_wins += child_paths
+                elif w == "O":
+                    levels[new_depth].o_wins += child_paths
+                elif new_depth == shape.cells:
+                    levels[new_depth].ties += child_paths
+                else:
+                    next_frontier[child] = next_frontier.get(child, 0) + child_paths
+
+                board[mv] = " "
+        levels[new_depth].distinct = sum(distinct.values())
+        levels[new_depth].unique = len(distinct) if symmetric else 0
+        frontier = next_frontier
+        turn = "O" if turn == "X" else "X"
 
-    board = [" "] * 9
-    backtrack(board, "X", 0, levels)
+def main() -> None:
+    title = "Tic Tac Toe"
+    if COUNT_MODE == "memo":
+        shape = Shape(MEMO_ROWS, MEMO_COLS, MEMO_K)
+        if (MEMO_ROWS, MEMO_COLS, MEMO_K) != (3, 3, 3):
+            title = f"{MEMO_ROWS}x{MEMO_COLS} board, {MEMO_K} in a row"
+        max_depth = shape.cells
+        # index 0 unused for convenience; we use 1..max_depth
+        levels = [LevelStats() for _ in range(max_depth + 1)]
+        count_levels_memo(shape, levels, USE_SYMMETRY)
+    elif COUNT_MODE == "paths":
+        max_depth = SHAPE.cells
+        levels = [LevelStats() for _ in range(max_depth + 1)]
+        board = [" "] * SHAPE.cells
+        seen = [set() for _ in range(max_depth + 1)] if USE_SYMMETRY else None
+        backtrack(board, "X", 0, levels, 1, seen)
+    else:
+        raise ValueError(f"Unknown COUNT_MODE: {COUNT_MODE}")
 
     # Output
     print()
-    print("=== Tic Tac Toe: game states and outcomes by move depth (X starts) ===")
+    print(f"=== {title}: game states and outcomes by move depth (X starts) ===")
     print()
     header = f"{'Move':>4}  {'States':>12}  {'X wins':>12}  {'O wins':>12}  {'Ties':>12}"
+    if COUNT_MODE == "memo":
+        header += f"  {'Distinct':>12}"
+    if USE_SYMMETRY:
+        header += f"  {'Unique':>12}"
     print(header)
     print("-" * len(header))
 
-    for depth in range(1, 10):
+    for depth in range(1, max_depth + 1):
         s = levels[depth]
-        print(f"{depth:>4}  {s.states:>12,}  {s.x_wins:>12,}  {s.o_wins:>12,}  {s.ties:>12,}")
+        row = f"{depth:>4}  {s.states:>12,}  {s.x_wins:>12,}  {s.o_wins:>12,}  {s.ties:>12,}"
+        if COUNT_MODE == "memo":
+            row += f"  {s.distinct:>12,}"
+        if USE_SYMMETRY:
+            row += f"  {s.unique:>12,}"
+        print(row)
 
     # Optional totals across all depths (terminal outcomes should sum to total games)
-    total_terminal = sum(levels[d].x_wins + levels[d].o_wins + levels[d].ties for d in range(1, 10))
+    total_terminal = sum(levels[d].x_wins + levels[d].o_wins + levels[d].ties
+                         for d in range(1, max_depth + 1))
     print()
     print(f"{'Total terminal games:':<24}{total_terminal:>12,}")
 
@@ -0,0 +1,217 @@
+"""
+tictactoe_ternary_eval.py
+
+prof. lehman
+spring 2026
+
+Lookup-table evaluation for Tic Tac Toe.
+
+There are only 3**9 = 19,683 ways to fill the 9 squares with " ", "X", "O".
+Every board gets its base-3 board number (same numbering as the perfect-play table)
+    index = sum(digit(board[i]) * 3**i)   digit: " "=0, "X"=1, "O"=2
+and four arrays are filled once for all of them:
+    WINNER[index]             0 none / 1 X / 2 O   (same answer as winner())
+    FULL[index]               1 if no empty square
+    SCORES[mode][index]       eval_terminal_only() / eval_tanimoto_100_10_1()
+
+During search, TernaryEval keeps the board number in step with make/unmake
+(one add or subtract of digit * 3**square), so winner, full and the evaluation
+are each a single indexed read.
+
+Nothing is built or read at import: tables() loads the arrays on first use
+(the first TernaryEval or board-level lookup). They are saved to TABLE_FILE
+the first time and loaded from it after that; a file of the wrong size or
+with the wrong header is rebuilt. The arrays are stored little-endian whatever
+the machine's byte order, so the file can be shared between machines.
+"""
+
+from __future__ import annotations
+import os
+import sys
+from array import array
+from typing import Dict, List, Optional
+
+from tictactoe_perfect_table import DIGIT, NUM_INDEXES, POW3, board_index, file_matches, write_atomic
+
+TABLE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tictactoe_ternary.bin")
+
+MAGIC = b"TTTTERN1"
+
+EVAL_MODES = ("terminal_only", "tanimoto_100_10_1")
+
+WIN_LINES = [
+    (0, 1, 2), (3, 4, 5), (6, 7, 8),  # rows
+    (0, 3, 6), (1, 4, 7), (2, 5, 8),  # cols
+    (0, 4, 8), (2, 4, 6)              # diagonals
+]
+
+WINNER_NAME = (None, "X", "O")
+
+# score of a line that holds n marks of one player and none of the other
+LINE_WEIGHT = (0, 1, 10, 100)
+
+# ----------------------------
+# Build / load
+# ----------------------------
+
+def decode(index: int) -> List[str]:
+    """Board for a base-3 board number."""
+    board = []
+    for _ in range(9):
+        index, d = divmod(index, 3)
+        board.append(" XO"[d])
+    return board
+
+def build_tables() -> Dict[str, array]:
+    winners = array("b", bytes(NUM_INDEXES))
+    full = array("b", bytes(NUM_INDEXES))
+    scores = {mode: array("h", [0]) * NUM_INDEXES for mode in EVAL_MODES}
+
+    for index in range(NUM_INDEXES):
+        board = decode(index)
+        w = 0
+        for a, b, c in WIN_LINES:
+            if board[a] != " " and board[a] == board[b] == board[c]:
+                w = DIGIT[board[a]]
+                break
+        winners[index] = w
+        full[index] = " " not in board
+        scores["terminal_only"][index] = (0, 1, -1)[w]
+
+        score = 0
+        for line in WIN_LINES:
+            xs = sum(1 for i in line if board[i] == "X")
+            os_ = sum(1 for i in line if board[i] == "O")
+            if os_ == 0:
+                score += LINE_WEIGHT[xs]
+            elif xs == 0:
+                score -= LINE_WEIGHT[os_]
+        scores["tanimoto_100_10_1"][index] = score
+
+    tables = {"winner": winners, "full": full}
+    tables.update(scores)
+    return tables
+
+TABLE_ORDER = ("winner", "full") + EVAL_MODES
+TYPECODE = {"winner": "b", "full": "b", "terminal_only": "h", "tanimoto_100_10_1": "h"}
+FILE_SIZE = len(MAGIC) + NUM_INDEXES * sum(array(TYPECODE[name]).itemsize for name in TABLE_ORDER)
+
+def little_endian(values: array) -> array:
+    """values in little-endian byte order (a swapped copy on big-endian machines)."""
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values
+
+def save_tables(tables: Dict[str, array], path: str = TABLE_FILE) -> None:
+    write_atomic(path, [MAGIC] + [little_endian(tables[name]).tobytes() for name in TABLE_ORDER])
+
+def load_tables(path: str = TABLE_FILE) -> Dict[str, array]:
+    """Read the cached arrays, building (and caching) them if the file is missing or stale."""
+    if file_matches(path, MAGIC, FILE_SIZE):
+        try:
+            with open(path, "rb") as f:
+                f.seek(len(MAGIC))
+                tables = {}
+                for name in TABLE_ORDER:
+                    tables[name] = array(TYPECODE[name])
+                    tables[name].fromfile(f, NUM_INDEXES)
+                    if sys.byteorder == "big":
+                        tables[name].byteswap()
+                return tables
+        except (OSError, EOFError):
+            pass
+    tables = build_tables()
+    try:
+        save_tables(tables, path)
+    except OSError:
+        pass  # read-only checkout: keep the tables in memory only
+    return tables
+
+_TABLES: Optional[Dict[str, array]] = None
+
+def tables() -> Dict[str, array]:
+    """The arrays, loaded (or built) on the first call."""
+    global _TABLES
+    if _TABLES is None:
+        _TABLES = load_tables()
+    return _TABLES
+
+# ----------------------------
+# Board-level lookups
+# ----------------------------
+
+def winner(board: List[str]) -> Optional[str]:
+    return WINNER_NAME[tables()["winner"][board_index(board)]]
+
+def board_full(board: List[str]) -> bool:
+    return bool(tables()["full"][board_index(board)])
+
+def evaluate(board: List[str], eval_mode: str) -> int:
+    if eval_mode not in EVAL_MODES:
+        raise ValueError(f"Unknown EVAL_MODE: {eval_mode}")
+    return tables()[eval_mode][board_index(board)]
+
+# ----------------------------
+# Incremental board number (make/unmake)
+# ----------------------------
+
+class TernaryEval:
+    """
+    Board number kept in step with minimax() make/unmake.
+    .winner, .full and .score are one array read each.
+    """
+
+    answers_terminal = True   # minimax() reads .winner / .full instead of scanning
+
+    def __init__(self, board: List[str], eval_mode: str) -> None:
+        if eval_mode not in EVAL_MODES:
+            raise ValueError(f"Unknown EVAL_MODE: {eval_mode}")
+        t = tables()
+        self.index = board_index(board)
+        self._winner = t["winner"]
+        self._full = t["full"]
+        self._scores = t[eval_mode]
+
+    def make(self, square: int, player: str) -> None:
+        self.index += DIGIT[player] * POW3[square]
+
+    def unmake(self, square: int, player: str) -> None:
+        self.index -= DIGIT[player] * POW3[square]
+
+    @property
+    def winner(self) -> Optional[str]:
+        return WINNER_NAME[self._winner[self.index]]
+
+    @property
+    def full(self) -> bool:
+        return bool(self._full[self.index])
+
+    @property
+    def score(self) -> int:
+        return self._scores[self.index]
+
+# ----------------------------
+# Main
+# ----------------------------
+
+def main() -> None:
+    import tictactoe_minimax_2026 as list_engine
+
+    global _TABLES
+    _TABLES = build_tables()
+    save_tables(_TABLES, TABLE_FILE)
+    print(f"Wrote {NUM_INDEXES:,} boards to {TABLE_FILE} ({os.path.getsize(TABLE_FILE):,} bytes)")
+
+    mismatches = 0
+    for index in range(NUM_INDEXES):
+        board = decode(index)
+        if (winner(board) != list_engine.winner(board)
+                or board_full(board) != list_engine.board_full(board)
+                or evaluate(board, "terminal_only") != list_engine.eval_terminal_only(board)
+                or evaluate(board, "tanimoto_100_10_1") != list_engine.eval_tanimoto_100_10_1(board)):
+            mismatches += 1
+    print("Boards that differ from tictactoe_minimax_2026:", mismatches)
+
+if __name__ == "__main__":
+    main()
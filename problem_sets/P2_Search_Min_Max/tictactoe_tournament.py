@@ -0,0 +1,252 @@
+"""
+tictactoe_tournament.py
+
+prof. lehman
+spring 2026
+
+Self-play tournament between engine configurations (3x3 Tic Tac Toe, X starts).
+
+Each entry in ENGINES is one configuration: the minimax engine of
+tictactoe_minimax_2026.py with its own EVAL_MODE / SEARCH_DEPTH / alpha-beta /
+transposition table settings, or the MCTS engine of tictactoe_mcts.py with an
+iteration count.
+Every pair of configurations plays GAMES_PER_PAIR full games, swapping X and O
+each game. Games are spread over a process pool (WORKERS processes).
+
+Minimax is deterministic, so to get different games:
+  - the first OPENING_RANDOM_PLIES moves of each game are random
+  - when several moves share the best value, one of them is picked at random
+Game g of every pairing uses seed RANDOM_SEED + g, so runs are repeatable.
+
+Report per configuration:
+  - wins / draws / losses (rates over its games)
+  - total search nodes (minimax nodes or MCTS playouts)
+  - per-move latency percentiles p50 / p95 / p99 (ms, opening moves excluded)
+"""
+
+from __future__ import annotations
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import combinations
+from typing import Dict, List, Tuple
+
+import tictactoe_mcts
+import tictactoe_minimax_2026 as minimax_engine
+from tictactoe_minimax_2026 import board_full, legal_moves, next_player, winner
+
+# ----------------------------
+# Configuration (edit these)
+# ----------------------------
+
+@dataclass(frozen=True)
+class EngineConfig:
+    name: str
+    engine: str = "minimax"               # "minimax" or "mcts"
+    eval_mode: str = "tanimoto_100_10_1"  # minimax only
+    depth: int = 2                        # minimax only (plies)
+    alpha_beta: bool = False              # minimax only
+    transposition_table: bool = True      # minimax only
+    iterations: int = 1_000               # mcts only
+
+ENGINES = [
+    EngineConfig("tanimoto d2", eval_mode="tanimoto_100_10_1", depth=2),
+    EngineConfig("terminal d4", eval_mode="terminal_only", depth=4),
+    EngineConfig("terminal d9 ab", eval_mode="terminal_only", depth=9, alpha_beta=True),
+]
+
+GAMES_PER_PAIR = 20
+OPENING_RANDOM_PLIES = 1
+WORKERS = 2            # 0 = play every game in this process
+RANDOM_SEED = 2026
+
+# ----------------------------
+# Engines
+# ----------------------------
+
+def minimax_move(board: List[str], player: str, cfg: EngineConfig,
+                 rng: random.Random) -> Tuple[int, int]:
+    """(move, nodes searched) from tictactoe_minimax_2026 with cfg's settings."""
+    settings = minimax_engine.SearchSettings(
+        eval_mode=cfg.eval_mode,
+        use_alpha_beta=cfg.alpha_beta,
+        use_transposition_table=cfg.transposition_table,
+    )
+    tt = (minimax_engine.TranspositionTable(settings.tt_max_entries)
+          if settings.use_transposition_table else None)
+    counts = minimax_engine.SearchCounts()
+    branches = minimax_engine.branch_values(board[:], player, cfg.depth, tt=tt, counts=counts,
+                                            settings=settings)
+    pick = max if player == "X" else min
+    best_val = pick(v for _, v in branches)
+    return rng.choice([mv for mv, v in branches if v == best_val]), counts.nodes
+
+def mcts_move(board: List[str], player: str, cfg: EngineConfig,
+              rng: random.Random) -> Tuple[int, int]:
+    """(move, playouts) from tictactoe_mcts on the 3x3 board."""
+    result = tictactoe_mcts.mcts(board, player, tictactoe_mcts.Shape(3, 3, 3),
+                                 iterations=cfg.iterations, time_budget=None,
+                                 seed=rng.randrange(2**32))
+    return result.best_move, result.playouts
+
+ENGINE_MOVE = {"minimax": minimax_move, "mcts": mcts_move}
+
+# ----------------------------
+# One game
+# ----------------------------
+
+@dataclass
+class GameRecord:
+    x_name: str
+    o_name: str
+    result: str                                  # "X", "O" or "Tie"
+    moves: List[int]
+    latencies: Dict[str, List[float]]            # engine name -> seconds per searched move
+    nodes: Dict[str, int]                        # engine name -> total nodes / playouts
+
+def play_game(task: Tuple[EngineConfig, EngineConfig, int, int]) -> GameRecord:
+    """Worker: play one game, x_cfg as X and o_cfg as O."""
+    x_cfg, o_cfg, seed, opening_plies = task
+    rng = random.Random(seed)
+    cfgs = {"X": x_cfg, "O": o_cfg}
+    latencies: Dict[str, List[float]] = {x_cfg.name: [], o_cfg.name: []}
+    nodes: Dict[str, int] = {x_cfg.name: 0, o_cfg.name: 0}
+
+    board = [" "] * 9
+    player = "X"
+    moves: List[int] = []
+    while winner(board) is None and not board_full(board):
+        cfg = cfgs[player]
+        if len(moves) < opening_plies:
+            mv = rng.choice(legal_moves(board))
+        else:
+            t0 = time.perf_counter()
+            mv, searched = ENGINE_MOVE[cfg.engine](board, player, cfg, rng)
+            latencies[cfg.name].append(time.perf_counter() - t0)
+            nodes[cfg.name] += searched
+        board[mv] = player
+        moves.append(mv)
+        player = next_player(player)
+
+    return GameRecord(x_cfg.name, o_cfg.name, winner(board) or "Tie", moves, latencies, nodes)
+
+# ----------------------------
+# Tournament + report
+# ----------------------------
+
+@dataclass
+class Standing:
+    wins: int = 0
+    draws: int = 0
+    losses: int = 0
+    nodes: int = 0
+    latencies: List[float] = field(default_factory=list)
+
+    @property
+    def games(self) -> int:
+        return self.wins + self.draws + self.losses
+
+def schedule(engines: List[EngineConfig], games_per_pair: int, seed: int,
+             opening_plies: int) -> List[Tuple[EngineConfig, EngineConfig, int, int]]:
+    """Round robin: every pair plays games_per_pair games, alternating colors."""
+    tasks = []
+    for a, b in combinations(engines, 2):
+        for g in range(games_per_pair):
+            x_cfg, o_cfg = (a, b) if g % 2 == 0 else (b, a)
+            tasks.append((x_cfg, o_cfg, seed + g, opening_plies))
+    return tasks
+
+def run_tournament(engines: List[EngineConfig], games_per_pair: int, workers: int,
+                   seed: int, opening_plies: int = OPENING_RANDOM_PLIES) -> List[GameRecord]:
+    tasks = schedule(engines, games_per_pair, seed, opening_plies)
+    if workers > 0:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(play_game, tasks))
+    return [play_game(task) for task in tasks]
+
+def standings(engines: List[EngineConfig], games: List[GameRecord]) -> Dict[str, Standing]:
+    table = {cfg.name: Standing() for cfg in engines}
+    for game in games:
+        for name, side in ((game.x_name, "X"), (game.o_name, "O")):
+            s = table[name]
+            if game.result == "Tie":
+                s.draws += 1
+            elif game.result == side:
+                s.wins += 1
+            else:
+                s.losses += 1
+            s.nodes += game.nodes[name]
+            s.latencies.extend(game.latencies[name])
+    return table
+
+def percentile(values: List[float], p: float) -> float:
+    """Nearest-rank percentile (p in 0..100) of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * p // 100))
+    return ordered[int(rank) - 1]
+
+def main() -> None:
+    names = [cfg.name for cfg in ENGINES]
+    if len(set(names)) != len(names):
+        raise ValueError("engine names must be unique")
+
+    print("=== Tic Tac Toe self-play tournament ===\n")
+    for cfg in ENGINES:
+        if cfg.engine == "mcts":
+            detail = f"MCTS, {cfg.iterations:,} iterations"
+        else:
+            search = "alpha-beta" if cfg.alpha_beta else "plain minimax"
+            detail = f"{search}, {cfg.eval_mode}, depth {cfg.depth}"
+        print(f"  {cfg.name:<16} {detail}")
+    print(f"\nGames per pair: {GAMES_PER_PAIR}  random opening plies: {OPENING_RANDOM_PLIES}  "
+          f"workers: {WORKERS}")
+
+    t0 = time.perf_counter()
+    games = run_tournament(ENGINES, GAMES_PER_PAIR, WORKERS, RANDOM_SEED)
+    elapsed = time.perf_counter() - t0
+    table = standings(ENGINES, games)
+
+    print("\n\n=== Standings ===\n")
+    header = (f"{'Engine':<16}  {'Games':>5}  {'Win %':>6}  {'Draw %':>6}  {'Loss %':>6}  "
+              f"{'Nodes':>12}  {'p50 ms':>8}  {'p95 ms':>8}  {'p99 ms':>8}")
+    print(header)
+    print("-" * len(header))
+    for cfg in ENGINES:
+        s = table[cfg.name]
+        n = s.games or 1
+        if s.latencies:
+            p50, p95, p99 = (percentile(s.latencies, p) * 1000 for p in (50, 95, 99))
+            lat = f"{p50:>8.2f}  {p95:>8.2f}  {p99:>8.2f}"
+        else:
+            lat = f"{'-':>8}  {'-':>8}  {'-':>8}"
+        print(f"{cfg.name:<16}  {s.games:>5}  {s.wins / n * 100:>6.1f}  {s.draws / n * 100:>6.1f}  "
+              f"{s.losses / n * 100:>6.1f}  {s.nodes:>12,}  {lat}")
+
+    print("\n\n=== Head to head (row engine's wins-draws-losses) ===\n")
+    width = max(len(name) for name in names)
+    print(" " * width + "  " + "  ".join(f"{name:>{width}}" for name in names))
+    for a in names:
+        cells = []
+        for b in names:
+            if a == b:
+                cells.append(f"{'-':>{width}}")
+                continue
+            w = d = l = 0
+            for game in games:
+                if {game.x_name, game.o_name} != {a, b}:
+                    continue
+                side = "X" if game.x_name == a else "O"
+                if game.result == "Tie":
+                    d += 1
+                elif game.result == side:
+                    w += 1
+                else:
+                    l += 1
+            cells.append(f"{f'{w}-{d}-{l}':>{width}}")
+        print(f"{a:<{width}}  " + "  ".join(cells))
+
+    print(f"\nPlayed {len(games):,} games in {elapsed:.2f}s")
+
+if __name__ == "__main__":
+    main()
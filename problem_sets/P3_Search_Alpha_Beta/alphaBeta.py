@@ -5,13 +5,38 @@
 #
 # creates a tree with x16 child nodes
 #
+# also: an implicit (array) version of the same tree for large pruning
+# experiments - any branching factor and depth, leaf values in one NumPy
+# array, node j of a level has children j*b .. j*b + b-1 on the next level,
+# and pruned/visited flags are one boolean array per level
+#
+# and: a lazy tree where no leaf is stored up front - a leaf's value is computed
+# from (seed, leaf index) by a counter-based hash (splitmix64) the first time
+# the search reaches it, so memory grows only with the nodes actually visited
+# and the values are the same in every run and every process
 #  
 
 import random
 
+try:
+    import numpy as np
+except ImportError:  # only the implicit tree needs NumPy
+    np = None
+
 # set random seed ie. will get same set of random numbers
 # comment out or change seed to change numbers
-random.seed(14)
+SEED = 14
+random.seed(SEED)
+
+# implicit tree experiment (runs after the x16 tree when True)
+RUN_IMPLICIT_EXPERIMENT = False
+IMPLICIT_BRANCHING = 4
+IMPLICIT_DEPTH = 10         # 4**10 = 1,048,576 leaves
+
+# lazy tree experiment (runs after the x16 tree when True)
+RUN_LAZY_EXPERIMENT = False
+LAZY_BRANCHING = 8
+LAZY_DEPTH = 8              # 8**8 = 16,777,216 leaves (depth 12 works too, it just takes a while)
 
 
 class Node:
@@ -25,10 +50,10 @@ class Node:
     def add_child(self, child):
         self.children.append(child)
 
-def create_tree(node, current_depth, max_depth=4):
+def create_tree(node, current_depth, max_depth=4, branching=2):
     if current_depth < max_depth:
-        node.add_child(create_tree(Node(current_depth + 1, not node.is_maximizing_player), current_depth + 1, max_depth))
-        node.add_child(create_tree(Node(current_depth + 1, not node.is_maximizing_player), current_depth + 1, max_depth))
+        for _ in range(branching):
+            node.add_child(create_tree(Node(current_depth + 1, not node.is_maximizing_player), current_depth + 1, max_depth, branching))
     else:
         
         node.value = random.randint(1, 50)  # Assigning random values at leaf nodes
@@ -73,12 +98,217 @@ def print_tree(node, indent="", last=True):
         last = i == len(node.children) - 1
         print_tree(child, indent, last)
 
-# Create and display the tree
-root = create_tree(Node(0, True), 0)
-minimax_value = minimax(root, 4, float('-inf'), float('inf'), True)
-print("Minimax Value: ", minimax_value)
-print("\nTree with Pruned Branches:")
-print_tree(root)
+def pruned_nodes(node, level=0, index=0, branching=2):
+    """set of (level, index) for every node marked pruned (index = position in its level)"""
+    found = {(level, index)} if node.pruned else set()
+    for i, child in enumerate(node.children):
+        found |= pruned_nodes(child, level + 1, index * branching + i, branching)
+    return found
+
+# ----------------------------
+# Implicit (array) tree
+# ----------------------------
+
+class ImplicitTree:
+    """
+    Full tree with b children per node, stored as arrays instead of Node objects.
+    level d holds b**d nodes; node j on level d has children j*b + i (i = 0..b-1)
+    on level d+1. MAX moves on even levels (root = level 0).
+    """
+
+    def __init__(self, branching, depth, leaves):
+        if np is None:
+            raise ImportError("ImplicitTree needs NumPy (pip install numpy)")
+        if len(leaves) != branching ** depth:
+            raise ValueError(f"expected {branching ** depth} leaf values, got {len(leaves)}")
+        self.branching = branching
+        self.depth = depth
+        self.leaves = np.asarray(leaves)
+        self.pruned = [np.zeros(branching ** d, dtype=bool) for d in range(depth + 1)]
+        self.visited = [np.zeros(branching ** d, dtype=bool) for d in range(depth + 1)]
+
+    # node interface used by minimax_implicit() / print_implicit_tree()
+    def visit(self, level, index):
+        self.visited[level][index] = True
+
+    def leaf(self, index):
+        return int(self.leaves[index])
+
+    def prune(self, level, start, stop):
+        self.pruned[level][start:stop] = True
+
+    def is_pruned(self, level, index):
+        return bool(self.pruned[level][index])
+
+    def reset_flags(self):
+        for d in range(self.depth + 1):
+            self.pruned[d][:] = False
+            self.visited[d][:] = False
+
+    def pruned_nodes(self):
+        """set of (level, index) for every node marked pruned"""
+        return {(d, int(j)) for d in range(self.depth + 1) for j in np.flatnonzero(self.pruned[d])}
+
+def create_implicit_tree(branching=2, depth=4, seed=SEED, generator="python", low=1, high=50):
+    """
+    Leaf values low..high, left to right.
+    generator="python" draws them with random.seed(seed) + random.randint exactly like
+    create_tree() (same tree for the same seed); "numpy" is much faster for big trees.
+    """
+    n = branching ** depth
+    if generator == "python":
+        rng = random.Random(seed)
+        leaves = np.array([rng.randint(low, high) for _ in range(n)], dtype=np.int32)
+    elif generator == "numpy":
+        leaves = np.random.default_rng(seed).integers(low, high + 1, size=n, dtype=np.int32)
+    else:
+        raise ValueError(f"unknown generator: {generator}")
+    return ImplicitTree(branching, depth, leaves)
+
+# ----------------------------
+# Lazy (seed-addressable) tree
+# ----------------------------
+
+MASK64 = (1 << 64) - 1
+
+def splitmix64(x):
+    """counter-based 64-bit hash: consecutive inputs give unrelated outputs"""
+    x = (x + 0x9E3779B97F4A7C15) & MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASK64
+    return x ^ (x >> 31)
+
+class LazyTree:
+    """
+    Same numbering as ImplicitTree (node j on level d has children j*b + i), but
+    nothing is allocated for unvisited nodes: leaf values come from
+    splitmix64(tree key + leaf index), and only visited leaves, visited node
+    counts and pruned nodes are kept.
+    """
+
+    def __init__(self, branching, depth, seed=SEED, low=1, high=50):
+        self.branching = branching
+        self.depth = depth
+        self.low = low
+        self.span = high - low + 1
+        self.key = splitmix64(splitmix64(seed & MASK64) ^ (depth << 32 | branching))
+        self.values = {}                 # leaf index -> value, for leaves the search reached
+        self.visits = [0] * (depth + 1)  # nodes visited per level
+        self.pruned = set()              # (level, index)
+
+    def leaf_value(self, index):
+        """value of any leaf, without touching the tree (same for every run / process)"""
+        return self.low + splitmix64((self.key + index) & MASK64) % self.span
+
+    def visit(self, level, index):
+        self.visits[level] += 1
+
+    def leaf(self, index):
+        value = self.values.get(index)
+        if value is None:
+            value = self.values[index] = self.leaf_value(index)
+        return value
+
+    def prune(self, level, start, stop):
+        self.pruned.update((level, j) for j in range(start, stop))
+
+    def is_pruned(self, level, index):
+        return (level, index) in self.pruned
+
+    def pruned_nodes(self):
+        return set(self.pruned)
+
+def minimax_implicit(tree, level, index, alpha, beta, is_maximizing_player, verbose=False):
+    """
+    same search (and same pruned marks) as minimax() on the object tree;
+    tree is an ImplicitTree or a LazyTree
+    """
+    tree.visit(level, index)
+    if level == tree.depth:
+        return tree.leaf(index)
+
+    b = tree.branching
+    first = index * b
+    best = float('-inf') if is_maximizing_player else float('inf')
+    for i in range(b):
+        eval = minimax_implicit(tree, level + 1, first + i, alpha, beta, not is_maximizing_player, verbose)
+        if is_maximizing_player:
+            best = max(best, eval)
+            alpha = max(alpha, eval)
+        else:
+            best = min(best, eval)
+            beta = min(beta, eval)
+        if beta <= alpha:
+            tree.prune(level + 1, first + i + 1, first + b)
+            break
+    if verbose:
+        print("max_eval" if is_maximizing_player else "     min_eval", best)
+    return best
+
+def print_implicit_tree(tree):
+    """print_tree() layout, without recursion (an explicit stack instead)"""
+    stack = [(0, 0, "", True)]
+    while stack:
+        level, index, indent, last = stack.pop()
+        if level == tree.depth:
+            label = tree.leaf(index)
+        else:
+            label = "M" if level % 2 == 0 else "m"
+        print(indent, "+- " if last else "|- ", label, " (Pruned)" if tree.is_pruned(level, index) else "", sep="")
+        if level == tree.depth:
+            continue
+        indent += "   " if last else "|  "
+        b = tree.branching
+        # children print in reverse (like print_tree), so push child 0 first
+        for i in range(b):
+            stack.append((level + 1, index * b + i, indent, i == b - 1))
+
+if __name__ == "__main__":
+    # Create and display the tree
+    root = create_tree(Node(0, True), 0)
+    minimax_value = minimax(root, 4, float('-inf'), float('inf'), True)
+    print("Minimax Value: ", minimax_value)
+    print("\nTree with Pruned Branches:")
+    print_tree(root)
+
+    if RUN_IMPLICIT_EXPERIMENT:
+        import time
+
+        # same x16 tree as arrays: value and pruned nodes must match
+        tree = create_implicit_tree(2, 4, SEED)
+        value = minimax_implicit(tree, 0, 0, float('-inf'), float('inf'), True)
+        print("\nImplicit x16 tree: value", value,
+              "matches" if value == minimax_value and tree.pruned_nodes() == pruned_nodes(root) else "DIFFERS")
+
+        t0 = time.perf_counter()
+        tree = create_implicit_tree(IMPLICIT_BRANCHING, IMPLICIT_DEPTH, SEED, generator="numpy")
+        t1 = time.perf_counter()
+        value = minimax_implicit(tree, 0, 0, float('-inf'), float('inf'), True)
+        t2 = time.perf_counter()
+        leaves_visited = int(tree.visited[tree.depth].sum())
+        print(f"\nImplicit tree b={IMPLICIT_BRANCHING} depth={IMPLICIT_DEPTH}: {len(tree.leaves):,} leaves "
+              f"(built in {t1 - t0:.2f}s)")
+        print(f"Minimax Value: {value}  leaves visited: {leaves_visited:,} "
+              f"({leaves_visited / len(tree.leaves):.2%})  pruned nodes: {len(tree.pruned_nodes()):,}  "
+              f"search {t2 - t1:.2f}s")
+
+    if RUN_LAZY_EXPERIMENT:
+        import time
+        import tracemalloc
+
+        tracemalloc.start()
+        t0 = time.perf_counter()
+        tree = LazyTree(LAZY_BRANCHING, LAZY_DEPTH, SEED)
+        value = minimax_implicit(tree, 0, 0, float('-inf'), float('inf'), True)
+        elapsed = time.perf_counter() - t0
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        total = LAZY_BRANCHING ** LAZY_DEPTH
+        print(f"\nLazy tree b={LAZY_BRANCHING} depth={LAZY_DEPTH} seed={SEED}: {total:,} leaves")
+        print(f"Minimax Value: {value}  leaves visited: {len(tree.values):,} "
+              f"({len(tree.values) / total:.4%})  nodes visited: {sum(tree.visits):,}  "
+              f"pruned nodes: {len(tree.pruned):,}")
+        print(f"search {elapsed:.2f}s  peak memory {peak / 2**20:.1f} MB")
 
 
 
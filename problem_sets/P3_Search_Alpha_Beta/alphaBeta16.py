@@ -7,13 +7,47 @@ Prof. Lehman - Alpha-Beta narrated trace demo (compact)
 - Tree is an implicit full binary tree of depth 4 (MAX at root).
 - Prints a compact trace showing v, alpha, beta as each child is checked,
   when child returns, updates, and pruning.
+
+Batch mode (no prompts, no trace unless --trace):
+- Reads one leaf vector per line from a file or stdin ("-"), values separated
+  by spaces or commas; blank lines and # comments are skipped.
+- Any branching factor (--branching, default 2); the depth follows from the
+  number of leaves (b**depth), or is checked against --depth.
+- Writes one CSV row per vector: root value, leaves visited, cut points.
+  A cut point d:n:c means node n at height d skipped its children after child c
+  (same numbering as the trace).
+- A line that cannot be searched is reported on stderr and skipped; the exit
+  status is 1 if any line failed.
+
+    python alphaBeta16.py --batch trees.txt --branching 3 --output results.csv
+
+Search variants (ALGORITHM, or --algorithm in batch mode), same trace format:
+- "alphabeta": classic alpha-beta (above)
+- "pvs": principal variation search / NegaScout. The first child gets the full
+  window, the others a null window (a, a+1) for MAX or (b-1, b) for MIN that
+  only proves "no better than the first"; a child that fails that test is
+  searched again with the full window.
+- "mtdf": MTD(f). Only null-window alpha-beta searches from the root, each one
+  moving a bound on the root value toward a first guess until lower = upper.
+  A memory table of (lower, upper) bounds per node carries over between passes.
+Leaves are counted every time one is evaluated (re-searches included), so the
+counts compare directly with alpha-beta (COMPARE_ALGORITHMS, or --compare).
 """
 
 from __future__ import annotations
-from typing import List
+import argparse
+import csv
+import sys
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
 
 INF = 10**9  # sentinel for +infinity/-infinity in trace
 
+ALGORITHM = "alphabeta"     # "alphabeta", "pvs" or "mtdf" (interactive trace)
+COMPARE_ALGORITHMS = False  # after the trace, leaves evaluated by every algorithm
+MTDF_FIRST_GUESS: Optional[int] = None   # None = middle of the leaf values
+
 
 # ----------------------------
 # Formatting helpers
@@ -63,8 +97,40 @@ def input_16_integers() -> List[int]:
 
 
 # ----------------------------
-# Alpha-Beta on implicit binary tree
+# Alpha-Beta on implicit tree (narrated or silent)
 # ----------------------------
+@dataclass
+class SearchResult:
+    value: int
+    leaves_visited: int = 0
+    cuts: List[Tuple[int, int, int]] = field(default_factory=list)  # (depth, node_index, child)
+    passes: int = 1           # root searches (MTD(f) makes several)
+    re_searches: int = 0      # PVS children searched a second time
+
+
+def tree_depth(num_leaves: int, branching: int) -> int:
+    """depth d with branching**d == num_leaves (ValueError if there is none)."""
+    if branching < 2:
+        raise ValueError("branching factor must be at least 2")
+    depth, n = 0, 1
+    while n < num_leaves:
+        n *= branching
+        depth += 1
+    if n != num_leaves:
+        raise ValueError(f"{num_leaves} leaves is not a power of the branching factor {branching}")
+    return depth
+
+
+def check_depth(leaves: List[int], branching: int, depth: Optional[int]) -> int:
+    """depth of the tree over leaves (from the leaf count when depth is None)."""
+    if depth is None:
+        return tree_depth(len(leaves), branching)
+    if branching ** depth != len(leaves):
+        raise ValueError(f"depth {depth} with branching {branching} needs "
+                         f"{branching ** depth} leaves, got {len(leaves)}")
+    return depth
+
+
 def alphabeta(
     leaves: List[int],
     node_index: int,
@@ -73,46 +139,52 @@ def alphabeta(
     beta: int,
     maximizing: bool,
     indent: str = "",
+    branching: int = 2,
+    stats: Optional[SearchResult] = None,
+    trace: bool = True,
+    out: Optional[TextIO] = None,
 ) -> int:
     """
-    Alpha-beta minimax on an implicit full binary tree.
+    Alpha-beta minimax on an implicit full tree, printing the narrated trace to out
+    (default stdout; trace=False: silent; stats, if given, collects leaves visited
+    and cut points).
 
-    - leaves length must be 2**root_depth (here 16 and root_depth=4).
-    - node_index is the index at this depth in the implicit tree.
+    - leaves length must be branching**root_depth (16 and root_depth=4 for binary).
+    - node_index is the index at this depth in the implicit tree; its children
+      are node_index * branching + child.
       At depth=0, node_index is the leaf index (0..15).
     """
     node_type = "MAX" if maximizing else "MIN"
     v = -INF if maximizing else INF
 
-    print(f"{indent}Enter {node_type} d={depth} n={node_index}   "
-          f"v:{fmt(v)}  a:{fmt(alpha)}  b:{fmt(beta)}")
+    if trace:
+        print(f"{indent}Enter {node_type} d={depth} n={node_index}   "
+              f"v:{fmt(v)}  a:{fmt(alpha)}  b:{fmt(beta)}", file=out)
 
     # Terminal
     if depth == 0:
         v = leaves[node_index]
-        print(f"{indent}Exit  {node_type} d={depth} n={node_index}   return v={v}\n")
+        if stats is not None:
+            stats.leaves_visited += 1
+        if trace:
+            print(f"{indent}Exit  {node_type} d={depth} n={node_index}   return v={v}\n", file=out)
         return v
 
-    for child in (0, 1):
-        child_index = node_index * 2 + child
+    for child in range(branching):
+        child_index = node_index * branching + child
 
         # 1) Before calling child
-        print(f"{indent}  Check child {child}:     "
-              f"v:{fmt(v)}  a:{fmt(alpha)}  b:{fmt(beta)}")
+        if trace:
+            print(f"{indent}  Check child {child}:     "
+                  f"v:{fmt(v)}  a:{fmt(alpha)}  b:{fmt(beta)}", file=out)
 
         # 2) Call child
-        r = alphabeta(
-            leaves=leaves,
-            node_index=child_index,
-            depth=depth - 1,
-            alpha=alpha,
-            beta=beta,
-            maximizing=not maximizing,
-            indent=indent + "    ",
-        )
+        r = alphabeta(leaves, child_index, depth - 1, alpha, beta, not maximizing,
+                      indent + "    ", branching, stats, trace, out)
 
         # 3) After child returns
-        print(f"{indent}  Child {child} returns:   r={r}")
+        if trace:
+            print(f"{indent}  Child {child} returns:   r={r}", file=out)
 
         old_v, old_a, old_b = v, alpha, beta
 
@@ -125,48 +197,403 @@ def alphabeta(
             beta = min(beta, v)
 
         # 4) Show updates
-        print(
-            f"{indent}  Update after c{child}:   "
+        if trace:
+            print(
+                f"{indent}  Update after c{child}:   "
+                f"v:{fmt_update(old_v, v)}  "
+                f"a:{fmt_update(old_a, alpha)}  "
+                f"b:{fmt_update(old_b, beta)}",
+                file=out,
+            )
+
+        # 5) Prune
+        if alpha >= beta:
+            if trace:
+                print(f"{indent}  PRUNE after c{child}:    "
+                      f"a={fmt(alpha)} ≥ b={fmt(beta)}   "
+                      f"(skip remaining children)", file=out)
+            if stats is not None and child < branching - 1:
+                stats.cuts.append((depth, node_index, child))
+            break
+
+    if trace:
+        print(f"{indent}Exit  {node_type} d={depth} n={node_index}   "
+              f"return v={fmt(v)}\n", file=out)
+    return v
+
+
+def search(leaves: List[int], branching: int = 2, depth: Optional[int] = None) -> SearchResult:
+    """alphabeta() from the root (root is MAX) without the trace, returning counts."""
+    depth = check_depth(leaves, branching, depth)
+    result = SearchResult(value=0)
+    result.value = alphabeta(leaves, 0, depth, -INF, INF, True, branching=branching,
+                             stats=result, trace=False)
+    return result
+
+
+# ----------------------------
+# PVS (NegaScout) and MTD(f), narrated or silent
+# ----------------------------
+def _quiet(*args, **kwargs) -> None:
+    pass
+
+
+def pvs(
+    leaves: List[int],
+    node_index: int,
+    depth: int,
+    alpha: int,
+    beta: int,
+    maximizing: bool,
+    indent: str = "",
+    branching: int = 2,
+    stats: Optional[SearchResult] = None,
+    trace: bool = True,
+    out: Optional[TextIO] = None,
+) -> int:
+    """
+    Principal variation search on the implicit tree, same trace as alphabeta().
+    Children after the first are scouted with a null window and re-searched
+    with (alpha, beta) only when the scout lands strictly inside it.
+    """
+    say = partial(print, file=out) if trace else _quiet
+    node_type = "MAX" if maximizing else "MIN"
+    v = -INF if maximizing else INF
+
+    say(f"{indent}Enter {node_type} d={depth} n={node_index}   "
+        f"v:{fmt(v)}  a:{fmt(alpha)}  b:{fmt(beta)}")
+
+    if depth == 0:
+        v = leaves[node_index]
+        if stats is not None:
+            stats.leaves_visited += 1
+        say(f"{indent}Exit  {node_type} d={depth} n={node_index}   return v={v}\n")
+        return v
+
+    for child in range(branching):
+        child_index = node_index * branching + child
+        say(f"{indent}  Check child {child}:     "
+            f"v:{fmt(v)}  a:{fmt(alpha)}  b:{fmt(beta)}")
+
+        if child == 0:
+            r = pvs(leaves, child_index, depth - 1, alpha, beta, not maximizing,
+                    indent + "    ", branching, stats, trace, out)
+        else:
+            lo, hi = (alpha, alpha + 1) if maximizing else (beta - 1, beta)
+            say(f"{indent}  Scout child {child}:     a:{fmt(lo)}  b:{fmt(hi)}   (null window)")
+            r = pvs(leaves, child_index, depth - 1, lo, hi, not maximizing,
+                    indent + "    ", branching, stats, trace, out)
+            if alpha < r < beta:
+                say(f"{indent}  Scout {child} returns:   r={r} inside a:{fmt(alpha)} b:{fmt(beta)}"
+                    f"   (re-search)")
+                if stats is not None:
+                    stats.re_searches += 1
+                r = pvs(leaves, child_index, depth - 1, alpha, beta, not maximizing,
+                        indent + "    ", branching, stats, trace, out)
+
+        say(f"{indent}  Child {child} returns:   r={r}")
+
+        old_v, old_a, old_b = v, alpha, beta
+        if maximizing:
+            v = max(v, r)
+            alpha = max(alpha, v)
+        else:
+            v = min(v, r)
+            beta = min(beta, v)
+
+        say(f"{indent}  Update after c{child}:   "
             f"v:{fmt_update(old_v, v)}  "
             f"a:{fmt_update(old_a, alpha)}  "
-            f"b:{fmt_update(old_b, beta)}"
-        )
+            f"b:{fmt_update(old_b, beta)}")
 
-        # 5) Prune
         if alpha >= beta:
-            print(f"{indent}  PRUNE after c{child}:    "
-                  f"a={fmt(alpha)} ≥ b={fmt(beta)}   "
-                  f"(skip remaining children)")
+            say(f"{indent}  PRUNE after c{child}:    "
+                f"a={fmt(alpha)} ≥ b={fmt(beta)}   "
+                f"(skip remaining children)")
+            if stats is not None and child < branching - 1:
+                stats.cuts.append((depth, node_index, child))
             break
 
-    print(f"{indent}Exit  {node_type} d={depth} n={node_index}   "
-          f"return v={fmt(v)}\n")
+    say(f"{indent}Exit  {node_type} d={depth} n={node_index}   "
+        f"return v={fmt(v)}\n")
+    return v
+
+
+Bounds = Dict[Tuple[int, int], Tuple[int, int]]   # (depth, node_index) -> (lower, upper)
+
+
+def alphabeta_memory(
+    leaves: List[int],
+    node_index: int,
+    depth: int,
+    alpha: int,
+    beta: int,
+    maximizing: bool,
+    table: Bounds,
+    indent: str = "",
+    branching: int = 2,
+    stats: Optional[SearchResult] = None,
+    trace: bool = True,
+    out: Optional[TextIO] = None,
+) -> int:
+    """
+    alphabeta() with a memory table of proven bounds (Plaat's AlphaBetaWithMemory).
+    A stored bound outside the window answers the node without searching it.
+    """
+    say = partial(print, file=out) if trace else _quiet
+    node_type = "MAX" if maximizing else "MIN"
+    v = -INF if maximizing else INF
+
+    say(f"{indent}Enter {node_type} d={depth} n={node_index}   "
+        f"v:{fmt(v)}  a:{fmt(alpha)}  b:{fmt(beta)}")
+
+    key = (depth, node_index)
+    lower, upper = table.get(key, (-INF, INF))
+    if lower >= beta or upper <= alpha:
+        v = lower if lower >= beta else upper
+        say(f"{indent}  Table hit:           lower={fmt(lower)}  upper={fmt(upper)}")
+        say(f"{indent}Exit  {node_type} d={depth} n={node_index}   return v={fmt(v)}\n")
+        return v
+    alpha, beta = max(alpha, lower), min(beta, upper)
+    window_a, window_b = alpha, beta
+
+    if depth == 0:
+        v = leaves[node_index]
+        if stats is not None:
+            stats.leaves_visited += 1
+    else:
+        for child in range(branching):
+            say(f"{indent}  Check child {child}:     "
+                f"v:{fmt(v)}  a:{fmt(alpha)}  b:{fmt(beta)}")
+            r = alphabeta_memory(leaves, node_index * branching + child, depth - 1, alpha, beta,
+                                 not maximizing, table, indent + "    ", branching, stats, trace, out)
+            say(f"{indent}  Child {child} returns:   r={r}")
+
+            old_v, old_a, old_b = v, alpha, beta
+            if maximizing:
+                v = max(v, r)
+                alpha = max(alpha, v)
+            else:
+                v = min(v, r)
+                beta = min(beta, v)
+
+            say(f"{indent}  Update after c{child}:   "
+                f"v:{fmt_update(old_v, v)}  "
+                f"a:{fmt_update(old_a, alpha)}  "
+                f"b:{fmt_update(old_b, beta)}")
+
+            if alpha >= beta:
+                say(f"{indent}  PRUNE after c{child}:    "
+                    f"a={fmt(alpha)} ≥ b={fmt(beta)}   "
+                    f"(skip remaining children)")
+                if stats is not None and child < branching - 1:
+                    stats.cuts.append((depth, node_index, child))
+                break
+
+    if v <= window_a:
+        table[key] = (lower, v)
+    elif v >= window_b:
+        table[key] = (v, upper)
+    else:
+        table[key] = (v, v)
+
+    say(f"{indent}Exit  {node_type} d={depth} n={node_index}   return v={fmt(v)}\n")
     return v
 
 
+def mtdf(
+    leaves: List[int],
+    depth: int,
+    branching: int = 2,
+    first_guess: Optional[int] = None,
+    stats: Optional[SearchResult] = None,
+    trace: bool = True,
+    out: Optional[TextIO] = None,
+) -> int:
+    """MTD(f): null-window passes from the root until the bounds meet."""
+    say = partial(print, file=out) if trace else _quiet
+    g = first_guess if first_guess is not None else (min(leaves) + max(leaves)) // 2
+    lower, upper = -INF, INF
+    table: Bounds = {}
+    passes = 0
+    while lower < upper:
+        beta = g + 1 if g == lower else g
+        passes += 1
+        say(f"--- MTD(f) pass {passes}: a:{fmt(beta - 1)}  b:{fmt(beta)}   "
+            f"(root value in [{fmt(lower)}, {fmt(upper)}]) ---\n")
+        g = alphabeta_memory(leaves, 0, depth, beta - 1, beta, True, table,
+                             branching=branching, stats=stats, trace=trace, out=out)
+        if g < beta:
+            upper = g
+        else:
+            lower = g
+    if stats is not None:
+        stats.passes = passes
+    return g
+
+
+ALGORITHMS = ("alphabeta", "pvs", "mtdf")
+ALGORITHM_TITLES = {"alphabeta": "Alpha-Beta", "pvs": "PVS (NegaScout)", "mtdf": "MTD(f)"}
+
+
+def run_search(algorithm: str, leaves: List[int], branching: int = 2,
+               depth: Optional[int] = None, trace: bool = False,
+               out: Optional[TextIO] = None) -> SearchResult:
+    """Root value and leaf counts from one of ALGORITHMS (root is MAX), trace optional (to out)."""
+    depth = check_depth(leaves, branching, depth)
+    result = SearchResult(value=0)
+    if algorithm == "alphabeta":
+        result.value = alphabeta(leaves, 0, depth, -INF, INF, True, branching=branching,
+                                 stats=result, trace=trace, out=out)
+    elif algorithm == "pvs":
+        result.value = pvs(leaves, 0, depth, -INF, INF, True, branching=branching,
+                           stats=result, trace=trace, out=out)
+    elif algorithm == "mtdf":
+        result.value = mtdf(leaves, depth, branching, MTDF_FIRST_GUESS, stats=result,
+                            trace=trace, out=out)
+    else:
+        raise ValueError(f"unknown algorithm: {algorithm}")
+    return result
+
+
+def print_comparison(leaves: List[int], branching: int = 2) -> None:
+    print("\n=== Leaves evaluated by each algorithm (same tree) ===\n")
+    header = f"{'Algorithm':<16}  {'Value':>6}  {'Leaves':>7}  {'Passes':>6}  {'Re-searches':>11}"
+    print(header)
+    print("-" * len(header))
+    for algorithm in ALGORITHMS:
+        r = run_search(algorithm, leaves, branching)
+        print(f"{ALGORITHM_TITLES[algorithm]:<16}  {r.value:>6}  "
+              f"{r.leaves_visited:>4}/{len(leaves):<2}  {r.passes:>6}  {r.re_searches:>11}")
+
+
+def parse_leaf_line(line: str) -> List[int]:
+    return [int(p) for p in line.replace(",", " ").split()]
+
+
+def read_leaf_lines(stream: TextIO) -> Iterator[Tuple[int, str]]:
+    """(line number, text) for each non-blank, non-comment line."""
+    for line_no, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        yield line_no, line
+
+
+def batch_row(line_no: int, leaves: List[int], branching: int, depth: Optional[int],
+              trace: bool, algorithm: str, compare: bool) -> List[object]:
+    """One CSV row of run_batch(); ValueError if the line cannot be searched."""
+    d = check_depth(leaves, branching, depth)
+    if trace:
+        print(f"\n=== Line {line_no}: {ALGORITHM_TITLES[algorithm]} Trace (root is MAX, "
+              f"depth={d}) ===\n", file=sys.stderr)
+    result = run_search(algorithm, leaves, branching, d, trace=trace, out=sys.stderr)
+    row = [line_no, result.value, result.leaves_visited, len(leaves),
+           " ".join(f"{d}:{n}:{c}" for d, n, c in result.cuts)]
+    if compare:
+        for name in ALGORITHMS:
+            other = result if name == algorithm else run_search(name, leaves, branching, d)
+            if other.value != result.value:
+                raise ValueError(f"{name} returned {other.value}, "
+                                 f"{algorithm} returned {result.value}")
+            row.append(other.leaves_visited)
+    return row
+
+
+def run_batch(lines: Iterable[Tuple[int, str]], out: TextIO, branching: int,
+              depth: Optional[int] = None, trace: bool = False,
+              algorithm: str = "alphabeta", compare: bool = False) -> Tuple[int, int]:
+    """
+    Search every leaf line, writing CSV rows to out; returns (trees searched, lines failed).
+    A bad line (not integers, wrong leaf count, algorithms disagreeing) is reported
+    on stderr and skipped. compare adds the leaves evaluated by every algorithm
+    (and checks their values agree). The trace, if any, goes to stderr.
+    """
+    writer = csv.writer(out)
+    header = ["line", "value", "leaves_visited", "leaves", "cuts"]
+    if compare:
+        header += [f"{name}_leaves_visited" for name in ALGORITHMS]
+    writer.writerow(header)
+    count = failed = 0
+    for line_no, text in lines:
+        try:
+            row = batch_row(line_no, parse_leaf_line(text), branching, depth, trace,
+                            algorithm, compare)
+        except ValueError as exc:
+            print(f"line {line_no}: {exc}", file=sys.stderr)
+            failed += 1
+            continue
+        writer.writerow(row)
+        count += 1
+    return count, failed
+
+
 # ----------------------------
 # Main
 # ----------------------------
-def main() -> None:
+def batch_main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Alpha-beta over many leaf vectors (no prompts).")
+    parser.add_argument("--batch", required=True, metavar="FILE",
+                        help="leaf vectors, one per line ('-' for stdin)")
+    parser.add_argument("--branching", type=int, default=2)
+    parser.add_argument("--depth", type=int, default=None,
+                        help="tree depth (default: from the number of leaves)")
+    parser.add_argument("--output", default="-", help="CSV file ('-' for stdout)")
+    parser.add_argument("--trace", action="store_true",
+                        help="also print the narrated trace of every tree (to stderr)")
+    parser.add_argument("--algorithm", choices=ALGORITHMS, default="alphabeta")
+    parser.add_argument("--compare", action="store_true",
+                        help="add leaves evaluated by every algorithm to each row")
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.batch == "-" else open(args.batch, "r")
+    out = sys.stdout if args.output == "-" else open(args.output, "w", newline="")
+    try:
+        count, failed = run_batch(read_leaf_lines(source), out, args.branching, args.depth,
+                                  args.trace, args.algorithm, args.compare)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if out is not sys.stdout:
+            out.close()
+    if args.output != "-":
+        print(f"Searched {count:,} trees -> {args.output}")
+    if failed:
+        print(f"{failed:,} line(s) failed (see above)", file=sys.stderr)
+        return 1
+    return 0
+
+
+def main() -> int:
+    if len(sys.argv) > 1:
+        return batch_main(sys.argv[1:])
+
     leaves = input_16_integers()
 
     print("\nLeaf list (index:value):")
     for i, v in enumerate(leaves):
         print(f"  {i}: {v}")
 
-    print("\n=== Alpha-Beta Trace (root is MAX, depth=4) ===\n")
-    result = alphabeta(
-        leaves=leaves,
-        node_index=0,
-        depth=4,          # because 2**4 = 16 leaves
-        alpha=-INF,
-        beta=INF,
-        maximizing=True,  # root is MAX
-        indent="",
-    )
+    print(f"\n=== {ALGORITHM_TITLES[ALGORITHM]} Trace (root is MAX, depth=4) ===\n")
+    if ALGORITHM == "alphabeta":
+        result = alphabeta(
+            leaves=leaves,
+            node_index=0,
+            depth=4,          # because 2**4 = 16 leaves
+            alpha=-INF,
+            beta=INF,
+            maximizing=True,  # root is MAX
+            indent="",
+        )
+    else:
+        result = run_search(ALGORITHM, leaves, depth=4, trace=True).value
 
     print(f"FINAL RESULT at root = {result}")
 
+    if COMPARE_ALGORITHMS:
+        print_comparison(leaves)
+    return 0
+
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
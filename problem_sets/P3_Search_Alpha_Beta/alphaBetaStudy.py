@@ -0,0 +1,248 @@
+"""
+alphaBetaStudy.py
+
+prof. lehman
+spring 2026
+
+How much does alpha-beta prune? Runs the search of alphaBeta16.py over many
+implicit trees and counts, per tree, the leaves evaluated and the cut points
+at each level:
+
+- "permutations": every ordering of one leaf set (default 0 .. b**d - 1),
+  e.g. b=2 d=3 -> 8! = 40,320 trees, b=3 d=2 -> 9! = 362,880 trees
+- "random": RANDOM_TREES trees with leaves drawn from LEAF_LOW..LEAF_HIGH
+
+With perfect move ordering alpha-beta evaluates only
+    b**ceil(d/2) + b**floor(d/2) - 1   leaves   (Knuth & Moore, about b**(d/2))
+and with the worst ordering all b**d of them; the study shows where real
+orderings fall in between.
+
+Trees are split into chunks and searched on a process pool (WORKERS processes);
+each chunk returns histograms that are merged here. Output:
+- a summary table (leaves evaluated, prunes per level) and a text histogram
+- CSV_FILE with every histogram: metric, level, value, trees
+
+Levels use the trace's numbering: d = DEPTH is the root, d = 1 the nodes just
+above the leaves.
+
+usage: python alphaBetaStudy.py                           # settings below
+       python alphaBetaStudy.py --mode permutations --branching 3 --depth 2
+       python alphaBetaStudy.py --mode random --trees 1000000 --workers 4
+"""
+
+from __future__ import annotations
+import argparse
+import csv
+import math
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import permutations
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from alphaBeta16 import search
+
+# ----------------------------
+# Configuration (defaults for the command line)
+# ----------------------------
+
+MODE = "random"            # "random" or "permutations"
+BRANCHING = 2
+DEPTH = 4
+
+PERMUTATION_LEAVES: Optional[List[int]] = None   # None = 0 .. b**d - 1
+RANDOM_TREES = 100_000
+LEAF_LOW = 0
+LEAF_HIGH = 99
+RANDOM_SEED = 2026
+
+CHUNK_SIZE = 20_000        # random trees per task
+WORKERS = 2                # 0 = search every tree in this process
+CSV_FILE = "alphabeta_study.csv"
+
+# ----------------------------
+# Histograms (one per chunk, merged at the end)
+# ----------------------------
+
+@dataclass
+class Histograms:
+    trees: int = 0
+    leaves: Counter = field(default_factory=Counter)                # leaves evaluated -> trees
+    cuts: Dict[int, Counter] = field(default_factory=dict)          # level -> (cuts -> trees)
+    skipped: Dict[int, Counter] = field(default_factory=dict)       # level -> (children skipped -> trees)
+
+    def add(self, leaves: List[int], branching: int, depth: int) -> None:
+        result = search(leaves, branching, depth)
+        self.trees += 1
+        self.leaves[result.leaves_visited] += 1
+        cuts = [0] * (depth + 1)
+        skipped = [0] * (depth + 1)
+        for d, _, child in result.cuts:
+            cuts[d] += 1
+            skipped[d] += branching - 1 - child
+        for d in range(1, depth + 1):
+            self.cuts.setdefault(d, Counter())[cuts[d]] += 1
+            self.skipped.setdefault(d, Counter())[skipped[d]] += 1
+
+    def merge(self, other: Histograms) -> None:
+        self.trees += other.trees
+        self.leaves.update(other.leaves)
+        for mine, theirs in ((self.cuts, other.cuts), (self.skipped, other.skipped)):
+            for d, hist in theirs.items():
+                mine.setdefault(d, Counter()).update(hist)
+
+def best_case_leaves(branching: int, depth: int) -> int:
+    return branching ** math.ceil(depth / 2) + branching ** (depth // 2) - 1
+
+def mean(hist: Counter) -> float:
+    n = sum(hist.values())
+    return sum(v * c for v, c in hist.items()) / n if n else 0.0
+
+# ----------------------------
+# Tasks (run in the worker processes)
+# ----------------------------
+
+Task = Tuple[str, int, int, tuple]   # (mode, branching, depth, mode arguments)
+
+def run_task(task: Task) -> Histograms:
+    mode, branching, depth, args = task
+    hist = Histograms()
+    if mode == "permutations":
+        prefix, rest = args
+        for tail in permutations(rest):
+            hist.add(list(prefix + tail), branching, depth)
+    else:
+        seed, count, low, high = args
+        rng = random.Random(seed)
+        n = branching ** depth
+        for _ in range(count):
+            hist.add([rng.randint(low, high) for _ in range(n)], branching, depth)
+    return hist
+
+def permutation_tasks(leaves: List[int], branching: int, depth: int,
+                      min_tasks: int) -> Iterator[Task]:
+    """Split the orderings by a fixed prefix, long enough to give min_tasks tasks."""
+    prefix_len, tasks = 0, 1
+    while tasks < min_tasks and prefix_len < len(leaves) - 1:
+        tasks *= len(leaves) - prefix_len
+        prefix_len += 1
+    for prefix in permutations(range(len(leaves)), prefix_len):
+        rest = tuple(v for i, v in enumerate(leaves) if i not in prefix)
+        yield ("permutations", branching, depth, (tuple(leaves[i] for i in prefix), rest))
+
+def random_tasks(trees: int, branching: int, depth: int, seed: int, low: int, high: int,
+                 chunk: int) -> Iterator[Task]:
+    for i, start in enumerate(range(0, trees, chunk)):
+        yield ("random", branching, depth, (seed + i, min(chunk, trees - start), low, high))
+
+def run_study(tasks: List[Task], workers: int) -> Histograms:
+    total = Histograms()
+    if workers > 0:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for hist in pool.map(run_task, tasks):
+                total.merge(hist)
+    else:
+        for task in tasks:
+            total.merge(run_task(task))
+    return total
+
+# ----------------------------
+# Output
+# ----------------------------
+
+def write_csv(path: str, hist: Histograms) -> None:
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["metric", "level", "value", "trees"])
+        for value, count in sorted(hist.leaves.items()):
+            writer.writerow(["leaves_evaluated", "", value, count])
+        for metric, by_level in (("cuts", hist.cuts), ("children_skipped", hist.skipped)):
+            for d in sorted(by_level, reverse=True):
+                for value, count in sorted(by_level[d].items()):
+                    writer.writerow([metric, d, value, count])
+
+def print_summary(hist: Histograms, branching: int, depth: int) -> None:
+    if not hist.trees:
+        print("\nNo trees searched.")
+        return
+    best = best_case_leaves(branching, depth)
+    worst = branching ** depth
+    lo, hi = min(hist.leaves), max(hist.leaves)
+
+    print("\n=== Leaves evaluated ===\n")
+    print(f"Trees:              {hist.trees:,}")
+    print(f"Best case (theory): {best:,}   (b**ceil(d/2) + b**floor(d/2) - 1)")
+    print(f"Worst case:         {worst:,}   (b**d)")
+    print(f"Observed:           min {lo:,}  mean {mean(hist.leaves):,.2f}  max {hi:,}")
+    print(f"Trees at best case: {hist.leaves[best] / hist.trees * 100:.2f}%   "
+          f"at worst case: {hist.leaves[worst] / hist.trees * 100:.2f}%")
+
+    print("\n=== Prunes per level (mean per tree) ===\n")
+    header = (f"{'Level':>7}  {'Nodes':>9}  {'Cuts':>8}  {'Max cuts':>8}  "
+              f"{'Children skipped':>16}  {'Trees with a cut':>16}")
+    print(header)
+    print("-" * len(header))
+    for d in range(depth, 0, -1):
+        cuts, skipped = hist.cuts[d], hist.skipped[d]
+        with_cut = hist.trees - cuts.get(0, 0)
+        label = f"d={d}" + (" *" if d == depth else "")
+        print(f"{label:>7}  {branching ** (depth - d):>9,}  {mean(cuts):>8.3f}  {max(cuts):>8}  "
+              f"{mean(skipped):>16.3f}  {with_cut / hist.trees * 100:>15.1f}%")
+    print("(* root)")
+
+    print("\n=== Histogram: leaves evaluated ===\n")
+    peak = max(hist.leaves.values())
+    for value in range(lo, hi + 1):
+        count = hist.leaves.get(value, 0)
+        bar = "#" * round(count / peak * 50)
+        print(f"{value:>7}  {count:>10,}  {bar}")
+
+# ----------------------------
+# Main
+# ----------------------------
+
+def positive_int(text: str) -> int:
+    """argparse type: an integer >= 1."""
+    n = int(text)
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {n}")
+    return n
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Alpha-beta pruning statistics over many trees.")
+    parser.add_argument("--mode", choices=("random", "permutations"), default=MODE)
+    parser.add_argument("--branching", type=int, default=BRANCHING)
+    parser.add_argument("--depth", type=int, default=DEPTH)
+    parser.add_argument("--trees", type=positive_int, default=RANDOM_TREES, help="random mode only")
+    parser.add_argument("--seed", type=int, default=RANDOM_SEED)
+    parser.add_argument("--workers", type=int, default=WORKERS)
+    parser.add_argument("--csv", default=CSV_FILE)
+    args = parser.parse_args()
+
+    b, d = args.branching, args.depth
+    if args.mode == "permutations":
+        leaves = PERMUTATION_LEAVES if PERMUTATION_LEAVES is not None else list(range(b ** d))
+        if len(leaves) != b ** d:
+            raise ValueError(f"PERMUTATION_LEAVES needs {b ** d} values, got {len(leaves)}")
+        tasks = list(permutation_tasks(leaves, b, d, max(1, args.workers) * 8))
+        detail = f"all {math.factorial(len(leaves)):,} orderings of {leaves}"
+    else:
+        tasks = list(random_tasks(args.trees, b, d, args.seed, LEAF_LOW, LEAF_HIGH, CHUNK_SIZE))
+        detail = f"{args.trees:,} random trees, leaves {LEAF_LOW}..{LEAF_HIGH}, seed {args.seed}"
+
+    print(f"=== Alpha-beta pruning study: branching {b}, depth {d} ({b ** d:,} leaves) ===\n")
+    print(detail)
+    print(f"Tasks: {len(tasks):,}  workers: {args.workers}")
+
+    t0 = time.perf_counter()
+    hist = run_study(tasks, args.workers)
+    elapsed = time.perf_counter() - t0
+
+    print_summary(hist, b, d)
+    write_csv(args.csv, hist)
+    print(f"\nSearched {hist.trees:,} trees in {elapsed:.2f}s -> {args.csv}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+minimaxOracle.py
+
+prof. lehman
+spring 2026
+
+Exact minimax values for many full trees at once, with NumPy, to check the
+alpha-beta searches against.
+
+The trees are the implicit trees of alphaBeta16.py / alphaBeta.py: one row of
+b**d leaf values per tree, node j of a level has children j*b .. j*b + b-1.
+Instead of recursing node by node, a whole level of every tree is reduced at
+once: reshape the (trees, b**h) array to (trees, b**(h-1), b) and take max or
+min over the last axis, alternating up to the root (root is MAX). Alpha-beta
+must return the same root value, so:
+
+- search() and the narrated alphabeta() in alphaBeta16.py
+- minimax() (object tree) and minimax_implicit() (array tree) in alphaBeta.py
+
+are run on the first CHECK_TREES trees and compared with the oracle.
+ORACLE_TREES trees (millions are fine) are solved in chunks of CHUNK_ROWS rows.
+"""
+
+from __future__ import annotations
+import contextlib
+import io
+import time
+from typing import List
+
+import numpy as np
+
+import alphaBeta
+import alphaBeta16
+
+# ----------------------------
+# Configuration (edit these)
+# ----------------------------
+
+BRANCHING = 2
+DEPTH = 4
+LEAF_LOW = 0
+LEAF_HIGH = 99
+RANDOM_SEED = 2026
+
+ORACLE_TREES = 2_000_000   # trees solved by the oracle
+CHUNK_ROWS = 250_000       # trees per NumPy batch (memory: CHUNK_ROWS * b**d * 8 bytes)
+CHECK_TREES = 20_000       # of those, trees also searched by the Python functions
+TRACED_CHECK_TREES = 200   # ... and by the narrated alphabeta() / minimax() (output discarded)
+
+# ----------------------------
+# Oracle
+# ----------------------------
+
+def minimax_values(leaves, branching: int, root_is_max: bool = True) -> np.ndarray:
+    """
+    Root minimax value of every row of leaves (shape (trees, b**d)).
+    Levels are reduced bottom-up; the level above the leaves is MAX when d is odd.
+    """
+    values = np.asarray(leaves)
+    if values.ndim != 2:
+        raise ValueError("leaves must be a 2-D array (one tree per row)")
+    depth = alphaBeta16.tree_depth(values.shape[1], branching)
+    for height in range(1, depth + 1):
+        blocks = values.reshape(values.shape[0], -1, branching)
+        maximizing = ((depth - height) % 2 == 0) == root_is_max
+        values = blocks.max(axis=2) if maximizing else blocks.min(axis=2)
+    return values[:, 0]
+
+def random_leaves(trees: int, branching: int, depth: int, rng: np.random.Generator,
+                  low: int = LEAF_LOW, high: int = LEAF_HIGH) -> np.ndarray:
+    return rng.integers(low, high + 1, size=(trees, branching ** depth), dtype=np.int64)
+
+# ----------------------------
+# Cross-checks (row numbers of trees whose value differs)
+# ----------------------------
+
+def object_tree(row: List[int], branching: int, depth: int) -> alphaBeta.Node:
+    """alphaBeta.py Node tree with the given leaves (left to right)."""
+    leaves = iter(row)
+
+    def build(node: alphaBeta.Node, level: int) -> alphaBeta.Node:
+        if level == depth:
+            node.value = next(leaves)
+            return node
+        for _ in range(branching):
+            node.add_child(build(alphaBeta.Node(level + 1, not node.is_maximizing_player), level + 1))
+        return node
+
+    return build(alphaBeta.Node(0, True), 0)
+
+def check_alphabeta16(leaves: np.ndarray, expected: np.ndarray, branching: int,
+                      traced: int = 0) -> List[int]:
+    bad = []
+    depth = alphaBeta16.tree_depth(leaves.shape[1], branching)
+    inf = alphaBeta16.INF
+    for t, row in enumerate(leaves.tolist()):
+        value = alphaBeta16.search(row, branching, depth).value
+        if t < traced:
+            with contextlib.redirect_stdout(io.StringIO()):
+                traced_value = alphaBeta16.alphabeta(row, 0, depth, -inf, inf, True,
+                                                     branching=branching)
+            value = value if traced_value == value else None
+        if value != expected[t]:
+            bad.append(t)
+    return bad
+
+def check_alphabeta_py(leaves: np.ndarray, expected: np.ndarray, branching: int,
+                       traced: int = 0) -> List[int]:
+    bad = []
+    depth = alphaBeta16.tree_depth(leaves.shape[1], branching)
+    for t, row in enumerate(leaves.tolist()):
+        tree = alphaBeta.ImplicitTree(branching, depth, row)
+        value = alphaBeta.minimax_implicit(tree, 0, 0, float('-inf'), float('inf'), True)
+        if t < traced:
+            with contextlib.redirect_stdout(io.StringIO()):
+                object_value = alphaBeta.minimax(object_tree(row, branching, depth), depth,
+                                                 float('-inf'), float('inf'), True)
+            value = value if object_value == value else None
+        if value != expected[t]:
+            bad.append(t)
+    return bad
+
+# ----------------------------
+# Main
+# ----------------------------
+
+def main() -> None:
+    b, d = BRANCHING, DEPTH
+    rng = np.random.default_rng(RANDOM_SEED)
+
+    print(f"=== Minimax oracle: branching {b}, depth {d} ({b ** d:,} leaves per tree) ===\n")
+
+    t0 = time.perf_counter()
+    solved = 0
+    histogram = np.zeros(LEAF_HIGH - LEAF_LOW + 1, dtype=np.int64)
+    first_chunk = None
+    while solved < ORACLE_TREES:
+        rows = min(CHUNK_ROWS, ORACLE_TREES - solved)
+        leaves = random_leaves(rows, b, d, rng)
+        values = minimax_values(leaves, b)
+        histogram += np.bincount(values - LEAF_LOW, minlength=len(histogram))
+        if first_chunk is None:
+            first_chunk = (leaves, values)
+        solved += rows
+    elapsed = time.perf_counter() - t0
+
+    mean_value = (histogram * np.arange(LEAF_LOW, LEAF_HIGH + 1)).sum() / solved
+    print(f"Oracle: {solved:,} trees in {elapsed:.2f}s ({solved / elapsed:,.0f} trees/s)")
+    print(f"Root values: mean {mean_value:.2f}, "
+          f"min {LEAF_LOW + np.flatnonzero(histogram)[0]}, max {LEAF_LOW + np.flatnonzero(histogram)[-1]}")
+
+    leaves, values = first_chunk
+    n = min(CHECK_TREES, len(values))
+    traced = min(TRACED_CHECK_TREES, n)
+    print(f"\nCross-checking the first {n:,} trees ({traced:,} also with the narrated searches):\n")
+
+    checks = (
+        ("alphaBeta16.search / alphabeta", check_alphabeta16),
+        ("alphaBeta.minimax_implicit / minimax", check_alphabeta_py),
+    )
+    for name, check in checks:
+        t0 = time.perf_counter()
+        bad = check(leaves[:n], values[:n], b, traced)
+        elapsed = time.perf_counter() - t0
+        status = "all match" if not bad else f"{len(bad):,} DIFFER (first: tree {bad[0]})"
+        print(f"  {name:<38} {status:<24} {elapsed:6.2f}s ({n / elapsed:,.0f} trees/s)")
+
+if __name__ == "__main__":
+    main()